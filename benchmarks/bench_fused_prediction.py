@@ -0,0 +1,71 @@
+# benchmarks/bench_fused_prediction.py
+#
+# Compares the two-pass prediction path (predict_proba + score, each binning the
+# input) against the fused single-binning path, for both prediction engines.
+#
+# Run command: PYTHONPATH=. python benchmarks/bench_fused_prediction.py [--sizes 1 1000 1000000]
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from src.config.load_config import LoadConfig
+from src.entity.artifacts_entity import ModelPusherArtifact
+from src.components.model_prediction import ModelPrediction
+from src.utils.file_ops import load_json
+
+RAW_DATA_PATH = "data/raw/credit_risk_dataset.csv"
+
+
+def make_input(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    df = pd.read_csv(RAW_DATA_PATH).drop(columns="loan_status")
+    return df.sample(n_rows, replace=True, random_state=seed).reset_index(drop=True)
+
+
+def time_it(fn, repeat: int) -> float:
+    """Best wall time over ``repeat`` runs, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Two-pass vs fused prediction benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1_000, 1_000_000])
+    args = parser.parse_args()
+
+    cfg = LoadConfig()
+    pusher_artifact = ModelPusherArtifact(
+        **load_json(f"{cfg.get_model_pusher_config().export_dir}/model_pusher_artifact.json")
+    )
+
+    print(f"{'rows':>10} | {'engine':>10} | {'two-pass ms':>12} | {'fused ms':>10} | {'speedup':>7}")
+    for n_rows in args.sizes:
+        X = make_input(n_rows)
+        repeat = 20 if n_rows <= 1_000 else 2
+
+        for engine in ("optbinning", "compiled"):
+            predictor = ModelPrediction(pusher_artifact, engine=engine)
+            model = predictor.load_model()
+
+            def two_pass():
+                model.predict_proba(X)[:, 1]
+                model.score(X)
+
+            def fused():
+                predictor.predict_fused(X)
+
+            # Both paths must agree before timing them
+            proba, score = predictor.predict_fused(X)
+            assert np.allclose(proba, model.predict_proba(X)[:, 1], atol=1e-9)
+            assert np.allclose(score, model.score(X), atol=1e-6)
+
+            t_two, t_fused = time_it(two_pass, repeat), time_it(fused, repeat)
+            print(f"{n_rows:>10} | {engine:>10} | {t_two:>12.2f} | {t_fused:>10.2f} | {t_two / t_fused:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
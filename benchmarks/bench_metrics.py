@@ -0,0 +1,66 @@
+# benchmarks/bench_metrics.py
+#
+# Evaluation metrics of one split: the sklearn/scipy sequence previously used by
+# ModelEvaluation.evaluate (roc_auc_score, average_precision_score, ks_2samp,
+# brier_score_loss) against the fused single-sort kernel. Also checks that
+# both give identical values.
+#
+# Run command: PYTHONPATH=. python benchmarks/bench_metrics.py [--sizes 100000 1000000 10000000]
+
+import argparse
+import time
+import numpy as np
+from scipy.stats import ks_2samp
+from sklearn.metrics import roc_auc_score, average_precision_score, brier_score_loss
+from src.utils.metrics import binary_classification_metrics
+
+
+def make_scores(n_rows: int, seed: int = 42):
+    """Scorecard-like probabilities (rounded, so with many ties) and a ~22% event rate."""
+    rng = np.random.default_rng(seed)
+    y = (rng.random(n_rows) < 0.22).astype(np.int64)
+    logit = rng.normal(-1.8, 1.0, n_rows) + 1.9 * y
+    proba = np.round(1 / (1 + np.exp(-logit)), 6)
+    return y, proba
+
+
+def separate_calls(y: np.ndarray, proba: np.ndarray) -> dict:
+    auc = roc_auc_score(y, proba)
+    ks = ks_2samp(proba[y == 1], proba[y == 0])
+    return {
+        "auc": auc,
+        "gini": 2 * auc - 1,
+        "pr_auc": average_precision_score(y, proba),
+        "ks": ks.statistic,
+        "ks_cutoff": ks.statistic_location,
+        "brier": brier_score_loss(y, proba),
+    }
+
+
+def time_it(fn, repeat: int):
+    """Best wall time over ``repeat`` runs, in seconds, and the last result."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Separate sklearn/scipy metrics vs fused kernel")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'sklearn+scipy (s)':>18} {'fused (s)':>10} {'speedup':>8} {'identical':>10}")
+    for n_rows in args.sizes:
+        y, proba = make_scores(n_rows)
+        t_ref, ref = time_it(lambda: separate_calls(y, proba), args.repeat)
+        t_fused, fused = time_it(lambda: binary_classification_metrics(y, proba), args.repeat)
+        identical = all(float(ref[k]) == fused[k] for k in ref)
+        print(f"{n_rows:>12,} {t_ref:>18.3f} {t_fused:>10.3f} {t_ref / t_fused:>7.1f}x {str(identical):>10}")
+
+
+if __name__ == "__main__":
+    main()
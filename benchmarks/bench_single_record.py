@@ -0,0 +1,85 @@
+# benchmarks/bench_single_record.py
+#
+# Per-request latency (p50 / p99) of the DataFrame prediction path used for
+# /predict/ before, against the pandas-free single-record fast path. Each
+# measurement covers record dict -> response dict, as in main.py.
+#
+# Run command: PYTHONPATH=. python benchmarks/bench_single_record.py [--requests 5000]
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from src.config.load_config import LoadConfig
+from src.entity.artifacts_entity import ModelPusherArtifact
+from src.components.model_prediction import ModelPrediction
+from src.utils.file_ops import load_json
+from src.utils.risk_level import get_risk_level
+
+RAW_DATA_PATH = "data/raw/credit_risk_dataset.csv"
+
+
+def make_records(n_records: int, seed: int = 42) -> list:
+    df = pd.read_csv(RAW_DATA_PATH).drop(columns="loan_status").dropna()
+    return df.sample(n_records, replace=True, random_state=seed).to_dict(orient="records")
+
+
+def dataframe_path(predictor: ModelPrediction, record: dict) -> dict:
+    prediction_df = predictor.initiate_model_prediction(pd.DataFrame([record]))
+    default_prob = round(float(prediction_df["default_probability"].iloc[0]), 4)
+    return {
+        "credit_score": int(prediction_df["credit_score"].iloc[0]),
+        "credit_level": int(prediction_df["credit_level"].iloc[0]),
+        "credit_description": prediction_df["credit_description"].iloc[0],
+        "default_probability": default_prob,
+        "risk_level": get_risk_level(default_prob)
+    }
+
+
+def fast_path(predictor: ModelPrediction, record: dict) -> dict:
+    prediction = predictor.predict_record(record)
+    default_prob = round(prediction["default_probability"], 4)
+    prediction["default_probability"] = default_prob
+    prediction["risk_level"] = get_risk_level(default_prob)
+    return prediction
+
+
+def latencies_us(fn, predictor: ModelPrediction, records: list) -> np.ndarray:
+    timings = np.empty(len(records))
+    for i, record in enumerate(records):
+        start = time.perf_counter()
+        fn(predictor, record)
+        timings[i] = (time.perf_counter() - start) * 1e6
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-record latency: DataFrame path vs fast path")
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    cfg = LoadConfig()
+    serving_cfg = cfg.get_model_serving_config()
+    pusher_artifact = ModelPusherArtifact(
+        **load_json(f"{cfg.get_model_pusher_config().export_dir}/model_pusher_artifact.json")
+    )
+    predictor = ModelPrediction(pusher_artifact, engine=serving_cfg.engine, fused=serving_cfg.fused_prediction)
+    predictor.load_model()
+    records = make_records(args.requests)
+
+    # Both paths must return the same response before timing them
+    for record in records[:200]:
+        slow, fast = dataframe_path(predictor, record), fast_path(predictor, record)
+        assert slow["credit_level"] == fast["credit_level"] and slow["risk_level"] == fast["risk_level"]
+        assert abs(slow["credit_score"] - fast["credit_score"]) <= 1
+        assert abs(slow["default_probability"] - fast["default_probability"]) <= 1e-4
+
+    print(f"{'path':>10} | {'p50 us':>9} | {'p99 us':>9} | {'mean us':>9}")
+    for name, fn in (("dataframe", dataframe_path), ("fast", fast_path)):
+        timings = latencies_us(fn, predictor, records)
+        p50, p99 = np.percentile(timings, [50, 99])
+        print(f"{name:>10} | {p50:>9.1f} | {p99:>9.1f} | {timings.mean():>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_split_formats.py
+#
+# Load time and peak RSS of the split artifact formats (joblib, parquet, npy)
+# for the access patterns of the pipeline: the whole split (ModelTrainer /
+# ModelEvaluation), a two-column projection, and a single row (PredictPipeline).
+# Each measurement runs in a fresh interpreter so peak RSS is not shared (Linux).
+#
+# Run command: PYTHONPATH=. python benchmarks/bench_split_formats.py [--rows 2000000]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import pandas as pd
+from src.utils.file_ops import SPLIT_FORMATS, save_split
+
+RAW_DATA_PATH = "data/raw/credit_risk_dataset.csv"
+
+ACCESS_PATTERNS = {
+    "full": {},
+    "2 columns": {"columns": ["person_income", "loan_grade"]},
+    "1 row": {"rows": [12345]},
+}
+
+CHILD = """
+import json, sys, time
+import numpy, pandas, pyarrow.parquet, joblib  # Imported before the baseline RSS
+from src.utils.file_ops import load_split
+
+def peak_rss_kb():
+    # VmHWM is reset by exec, unlike ru_maxrss which inherits the parent's peak
+    with open("/proc/self/status") as f:
+        return int(next(line for line in f if line.startswith("VmHWM")).split()[1])
+
+path, fmt, kwargs = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+base_kb = peak_rss_kb()
+start = time.perf_counter()
+data = load_split(path, fmt, **kwargs)
+data.sum(numeric_only=True)  # Touch the values so memory-mapped pages are counted
+elapsed = time.perf_counter() - start
+peak_kb = peak_rss_kb()
+print("BENCH " + json.dumps({"seconds": elapsed, "peak_rss_mb": (peak_kb - base_kb) / 1024}))
+"""
+
+
+def measure(path: str, fmt: str, kwargs: dict) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, path, fmt, json.dumps(kwargs)],
+        capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": os.getcwd()}
+    ).stdout
+    return json.loads(next(line for line in out.splitlines() if line.startswith("BENCH "))[6:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split artifact format benchmark")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    X = pd.read_csv(RAW_DATA_PATH).drop(columns="loan_status")
+    X = X.sample(args.rows, replace=True, random_state=42).reset_index(drop=True)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = {fmt: save_split(f"{tmp_dir}/X_train.pkl", X, fmt) for fmt in SPLIT_FORMATS}
+
+        print(f"{args.rows:,} rows x {X.shape[1]} columns")
+        print(f"{'format':>8} | {'access':>9} | {'load s':>8} | {'peak RSS MB':>11}")
+        for fmt in SPLIT_FORMATS:
+            for access, kwargs in ACCESS_PATTERNS.items():
+                result = measure(paths[fmt], fmt, kwargs)
+                print(f"{fmt:>8} | {access:>9} | {result['seconds']:>8.3f} | {result['peak_rss_mb']:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
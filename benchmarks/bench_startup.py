@@ -0,0 +1,68 @@
+# benchmarks/bench_startup.py
+#
+# Cold-start profile of the API process: time to import main.py, time until the
+# service reports ready (model loaded and warmed up) and latency of the first
+# prediction. Every run is a fresh interpreter so nothing is cached in memory.
+#
+# Run command: PYTHONPATH=. python benchmarks/bench_startup.py [--runs 5]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+
+CHILD = """
+import time
+t0 = time.perf_counter()
+import asyncio, json, sys
+import main
+t_import = time.perf_counter() - t0
+loaded = [m for m in ("pandas", "sklearn", "optbinning", "joblib") if m in sys.modules]
+
+async def run():
+    t1 = time.perf_counter()
+    async with main.lifespan(main.app):
+        while not main.serving_state["ready"]:
+            await asyncio.sleep(0.005)
+        t_ready = time.perf_counter() - t1
+        record = dict(main.WARMUP_RECORD, loan_amnt=12345.0)  # Not a cache hit
+        t2 = time.perf_counter()
+        await main.predict_credit_risk(main.CreditData(**record))
+        t_first = time.perf_counter() - t2
+    return t_ready, t_first
+
+t_ready, t_first = asyncio.run(run())
+print("BENCH " + json.dumps({"import_s": t_import, "ready_s": t_ready, "first_prediction_ms": t_first * 1000,
+                             "heavy_modules_on_import": loaded}))
+"""
+
+
+def run_once() -> dict:
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD], capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.getcwd()}
+    ).stdout
+    result = json.loads(next(line for line in out.splitlines() if line.startswith("BENCH "))[6:])
+    result["process_total_s"] = time.perf_counter() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    print(f"Heavy modules imported by 'import main': {runs[0]['heavy_modules_on_import'] or 'none'}")
+    print(f"{'metric':>22} | {'median':>10} | {'max':>10}")
+    for key, unit in (("import_s", "s"), ("ready_s", "s"), ("first_prediction_ms", "ms"), ("process_total_s", "s")):
+        values = np.array([r[key] for r in runs])
+        print(f"{key:>22} | {np.median(values):>7.3f} {unit:<2} | {values.max():>7.3f} {unit:<2}")
+
+
+if __name__ == "__main__":
+    main()
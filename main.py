@@ -1,57 +1,383 @@
 # main.py
 
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from fastapi import FastAPI, HTTPException
-import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from src.schema.prediction_schema import CreditData
 
 from src.config.load_config import LoadConfig
 from src.entity.artifacts_entity import ModelPusherArtifact
-from src.components.model_prediction import ModelPrediction
+from src.components.model_prediction import ModelPrediction, init_prediction_worker, predict_in_worker
 from src.logger import logger
 from src.utils.file_ops import load_json
-from src.utils.risk_level import get_risk_level 
+from src.utils.risk_level import get_risk_level, get_risk_levels
+from src.utils.model_registry import model_registry
+from src.utils.micro_batcher import MicroBatcher
+from src.utils.worker_pool import ScoringPool, ServerBusyError
+from src.utils.prediction_cache import PredictionCache
+from src.utils.prediction_log import PredictionLog
 
-app = FastAPI(title="Credit Risk Prediction API")
+if TYPE_CHECKING:
+    import pandas as pd  # pandas, optbinning and sklearn are loaded during warm-up, not on import
 
 # === Load configuration ===
 cfg = LoadConfig()
+pusher_cfg = cfg.get_model_pusher_config()
+serving_cfg = cfg.get_model_serving_config()
 
 # === Load saved artifacts ===
-pusher_dict = load_json(f"{cfg.get_model_pusher_config().export_dir}/model_pusher_artifact.json")
+pusher_dict = load_json(f"{pusher_cfg.export_dir}/model_pusher_artifact.json")
 
 pusher_artifact = ModelPusherArtifact(**pusher_dict)
 
-# === Initialize model predictor ===
-predictor = ModelPrediction(pusher_artifact)   # no trans_artifact
+# === Configure the in-memory model registry ===
+model_registry.configure(
+    max_models=serving_cfg.registry_max_models,
+    max_memory_mb=serving_cfg.registry_max_memory_mb
+)
+
+# === Initialize model predictor (the model itself is loaded by warm_up) ===
+predictor = ModelPrediction(
+    pusher_artifact,  # no trans_artifact
+    engine=serving_cfg.engine,
+    fused=serving_cfg.fused_prediction
+)
+
+# === Dedicated scoring pool with a bounded in-flight limit ===
+if serving_cfg.worker_pool_kind == "process":
+    # Every worker process loads its own copy of the model once
+    scoring_pool = ScoringPool(
+        kind="process",
+        max_workers=serving_cfg.worker_pool_size,
+        max_in_flight=serving_cfg.max_in_flight,
+        initializer=init_prediction_worker,
+        initargs=(pusher_artifact, serving_cfg.engine, serving_cfg.fused_prediction, pusher_cfg.versions_dir)
+    )
+    predict_fn = predict_in_worker
+else:
+    scoring_pool = ScoringPool(
+        kind="thread",
+        max_workers=serving_cfg.worker_pool_size,
+        max_in_flight=serving_cfg.max_in_flight
+    )
+    predict_fn = predictor.initiate_model_prediction
+
+
+def format_predictions(prediction_df: "pd.DataFrame") -> List[Dict[str, Any]]:
+    """
+    Turn a prediction frame into one response dict per row, in order.
+    """
+    default_probs = prediction_df["default_probability"].to_numpy().round(4)
+    risk_levels = get_risk_levels(default_probs)
+    credit_scores = prediction_df["credit_score"].to_numpy()
+    credit_levels = prediction_df["credit_level"].to_numpy()
+    descriptions = prediction_df["credit_description"].to_numpy()
+
+    return [
+        {
+            "credit_score": int(credit_scores[pos]),
+            "credit_level": int(credit_levels[pos]),
+            "credit_description": descriptions[pos],
+            "default_probability": float(default_probs[pos]),
+            "risk_level": risk_levels[pos]
+        }
+        for pos in range(len(prediction_df))
+    ]
+
+
+# The fast path scores from the compiled tables, so it only serves the "compiled" engine
+use_fast_path = serving_cfg.single_record_fast_path and serving_cfg.engine == "compiled"
+if serving_cfg.single_record_fast_path and not use_fast_path:
+    logger.info(f"Single-record fast path disabled: it needs engine 'compiled' (configured: '{serving_cfg.engine}').")
+
+
+def score_record_fast(record: Dict[str, Any], model_version: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Single-record fast path: compiled-table lookups straight to the response dict.
+    """
+    prediction = predictor.predict_record(record, model_version)
+    default_prob = round(prediction["default_probability"], 4)
+    prediction["default_probability"] = default_prob
+    prediction["risk_level"] = get_risk_level(default_prob)
+    return prediction
+
+
+async def score_records(rows: List[Dict[str, Any]], model_version: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Score validated records in a single prediction pass on the scoring pool.
+    """
+    import pandas as pd
+
+    input_df = pd.DataFrame(rows)
+    prediction_df = await scoring_pool.run(predict_fn, input_df, model_version)
+    return format_predictions(prediction_df)
+
+
+def validate_records(records: List[Dict[str, Any]]):
+    """
+    Validate each record on its own so one bad record does not fail the batch.
+    Returns (valid rows, their indices, per-index error entries).
+    """
+    valid_rows, valid_idx, errors = [], [], {}
+    for i, record in enumerate(records):
+        try:
+            valid_rows.append(CreditData.model_validate(record).model_dump())
+            valid_idx.append(i)
+        except ValidationError as e:
+            errors[i] = {
+                "index": i,
+                "status": "error",
+                "errors": e.errors(include_url=False, include_context=False)
+            }
+    return valid_rows, valid_idx, errors
+
+
+def server_busy() -> HTTPException:
+    return HTTPException(
+        status_code=serving_cfg.overload_status_code,
+        detail="Server is at capacity. Please retry shortly.",
+        headers={"Retry-After": "1"}
+    )
+
+
+# === Result cache for repeated /predict/ payloads ===
+prediction_cache = PredictionCache(
+    max_size=serving_cfg.prediction_cache_max_size,
+    ttl_seconds=serving_cfg.prediction_cache_ttl_seconds
+) if serving_cfg.prediction_cache else None
+
+
+def cache_key_for(record: Dict[str, Any], model_version: Optional[str]) -> str:
+    """
+    Cache key for a record under the requested (or currently pushed) model version.
+    Resolving the pushed version is a stat() call; a changed file invalidates the cache.
+    """
+    if model_version is None:
+        model_version = model_registry.register(pusher_artifact.pushed_model_path)
+        prediction_cache.observe_model_version(model_version)
+    return prediction_cache.make_key(record, model_version)
+
+
+# === Structured request/response log for drift monitoring ===
+prediction_log = PredictionLog(serving_cfg.prediction_log_path) if serving_cfg.prediction_log else None
+
+
+def served_version(model_version: Optional[str]) -> str:
+    """
+    Version that scored a request: the requested one or the currently pushed model.
+    """
+    return model_version or model_registry.register(pusher_artifact.pushed_model_path)
+
+
+def fast_path_ready(model_version: Optional[str]) -> bool:
+    """
+    Whether a record can be scored inline on the event loop: only when the
+    compiled model (and its caps) is already resident, so nothing is loaded
+    or compiled there. Cold versions go through the scoring pool.
+    """
+    return use_fast_path and model_registry.is_warm(version=served_version(model_version))
+
+
+# === Micro-batching of concurrent /predict/ requests ===
+micro_batcher = MicroBatcher(
+    score_records,
+    max_batch_size=serving_cfg.micro_batch_max_size,
+    max_wait_ms=serving_cfg.micro_batch_max_wait_ms,
+    max_concurrent_batches=serving_cfg.worker_pool_size
+) if serving_cfg.micro_batching else None
+
+
+# === Startup warm-up and readiness ===
+# Representative applicant used to exercise every scoring path before readiness
+WARMUP_RECORD = {
+    "person_age": 30, "person_income": 50000.0, "person_home_ownership": "RENT",
+    "person_emp_length": 5.0, "loan_intent": "EDUCATION", "loan_grade": "B",
+    "loan_amnt": 10000.0, "loan_int_rate": 11.0, "loan_percent_income": 0.2,
+    "cb_person_default_on_file": "N", "cb_person_cred_hist_length": 4
+}
+
+serving_state: Dict[str, Any] = {"ready": False, "warmup_seconds": None, "error": None}
+
+
+def load_default_model() -> None:
+    """
+    Register all pushed versions and load (and compile) the default model.
+    This is where optbinning, sklearn and pandas get imported.
+    """
+    model_registry.discover(pusher_cfg.versions_dir)  # Previously pushed versions, selectable per request
+    predictor.load_model()
+    if use_fast_path:
+        score_record_fast(WARMUP_RECORD)
+
+
+async def warm_up() -> None:
+    """
+    Load the model and run one prediction on every scoring worker, so the first
+    real request pays none of the one-off costs. Marks the service ready.
+    """
+    start = time.perf_counter()
+    try:
+        await run_in_threadpool(load_default_model)
+        import pandas as pd
+
+        warmup_df = pd.DataFrame([WARMUP_RECORD])
+        # One task per worker: process workers are spawned and load their model here
+        await asyncio.gather(*(
+            scoring_pool.run(predict_fn, warmup_df, None) for _ in range(serving_cfg.worker_pool_size)
+        ))
+    except Exception as e:
+        serving_state["error"] = str(e)
+        logger.error(f"❌ Warm-up failed: {e}")
+        raise
+
+    serving_state["warmup_seconds"] = round(time.perf_counter() - start, 3)
+    serving_state["ready"] = True
+    logger.info(f"🔥 Model warmed up in {serving_state['warmup_seconds']}s; service is ready.")
+
+
+def not_ready() -> HTTPException:
+    return HTTPException(status_code=503, detail="Model is warming up. Please retry shortly.", headers={"Retry-After": "1"})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if micro_batcher is not None:
+        await micro_batcher.start()
+    if serving_cfg.warmup_in_background:
+        # Accept connections right away; /ready reports 503 until warm-up is done
+        warmup_task = asyncio.create_task(warm_up())
+    else:
+        await warm_up()
+    yield
+    if serving_cfg.warmup_in_background and not warmup_task.done():
+        warmup_task.cancel()
+    if micro_batcher is not None:
+        await micro_batcher.stop()
+    scoring_pool.shutdown()
+    if prediction_log is not None:
+        prediction_log.close()
+
+
+app = FastAPI(title="Credit Risk Prediction API", lifespan=lifespan)
+
+
+# === Readiness Endpoint ===
+@app.get("/ready")
+def readiness():
+    if not serving_state["ready"]:
+        raise HTTPException(status_code=503, detail=serving_state)
+    return {"status": "ready", "warmup_seconds": serving_state["warmup_seconds"]}
+
+
+# === Model Registry Endpoint ===
+@app.get("/models/")
+def list_models():
+    return {"versions": model_registry.versions(), "stats": model_registry.stats()}
+
+
+# === Serving Metrics Endpoint ===
+@app.get("/metrics/")
+def serving_metrics():
+    return {
+        "micro_batching": micro_batcher.metrics() if micro_batcher is not None else None,
+        "scoring_pool": scoring_pool.metrics(),
+        "prediction_cache": prediction_cache.metrics() if prediction_cache is not None else None
+    }
 
 
 # === Prediction Endpoint ===
 @app.post("/predict/")
-def predict_credit_risk(data: CreditData):
+async def predict_credit_risk(data: CreditData, model_version: Optional[str] = None):
+    if not serving_state["ready"]:
+        raise not_ready()
+    if model_version and model_version not in model_registry:
+        raise HTTPException(status_code=404, detail=f"Unknown model version: {model_version}")
+
     try:
         # ✅ Log incoming request
         logger.info(f"Input data received: {data.model_dump_json()}")
-        
-        input_df = pd.DataFrame([data.model_dump()])
-        prediction_df = predictor.initiate_model_prediction(input_df)
-
-        default_prob = round(prediction_df["default_probability"].iloc[0], 4)
-        credit_score = int(prediction_df["credit_score"].iloc[0])
-        credit_level = int(prediction_df["credit_level"].iloc[0])
-        description = prediction_df["credit_description"].iloc[0]
-
-        logger.info(f"Prediction successful: Score={credit_score}, Probability={default_prob}")
-
-        return {
-            "credit_score": credit_score,
-            "credit_level": credit_level,
-            "credit_description": description,
-            "default_probability": default_prob,
-            "risk_level": get_risk_level(default_prob)
-        }
+        record = data.model_dump()
+
+        cache_key = None
+        if prediction_cache is not None:
+            cache_key = cache_key_for(record, model_version)
+            cached = prediction_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Prediction served from cache: Score={cached['credit_score']}")
+                if prediction_log is not None:
+                    prediction_log.write(record, cached, served_version(model_version))
+                return cached
+
+        async with scoring_pool.slot():
+            if fast_path_ready(model_version):
+                # A few microseconds of lookups: cheaper inline than a hop to the pool
+                result = score_record_fast(record, model_version)
+            elif micro_batcher is not None:
+                result = await micro_batcher.submit(record, batch_key=model_version)
+            else:
+                result = (await score_records([record], model_version))[0]
+
+        if cache_key is not None:
+            prediction_cache.put(cache_key, result)
+
+        logger.info(f"Prediction successful: Score={result['credit_score']}, Probability={result['default_probability']}")
+        if prediction_log is not None:
+            prediction_log.write(record, result, served_version(model_version))
+
+        return result
+
+    except ServerBusyError:
+        logger.warning("Prediction rejected: scoring pool at capacity.")
+        raise server_busy()
 
     except Exception as e:
         logger.error(f"Prediction failed: {e}")
         raise HTTPException(status_code=500, detail="Prediction failed. Please check the input or model.")
-    
+
+
+# === Batch Prediction Endpoint ===
+@app.post("/predict/batch")
+async def predict_credit_risk_batch(records: List[Dict[str, Any]], model_version: Optional[str] = None):
+    if not serving_state["ready"]:
+        raise not_ready()
+    if model_version and model_version not in model_registry:
+        raise HTTPException(status_code=404, detail=f"Unknown model version: {model_version}")
+    if len(records) > serving_cfg.batch_max_records:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(records)} records (max {serving_cfg.batch_max_records})."
+        )
+
+    logger.info(f"Batch input received: {len(records)} records")
+
+    valid_rows, valid_idx, errors = await run_in_threadpool(validate_records, records)
+    results: List[Dict[str, Any]] = [errors.get(i) for i in range(len(records))]
+
+    if valid_rows:
+        try:
+            async with scoring_pool.slot():
+                # One predict_proba/score pass over all valid records
+                scored = await score_records(valid_rows, model_version=model_version)
+        except ServerBusyError:
+            logger.warning("Batch prediction rejected: scoring pool at capacity.")
+            raise server_busy()
+        except Exception as e:
+            logger.error(f"Batch prediction failed: {e}")
+            raise HTTPException(status_code=500, detail="Batch prediction failed. Please check the input or model.")
+
+        for i, result in zip(valid_idx, scored):
+            results[i] = {"index": i, "status": "ok", **result}
+
+        if prediction_log is not None:
+            prediction_log.write_many(zip(valid_rows, scored), served_version(model_version))
+
+    n_failed = len(records) - len(valid_rows)
+    logger.info(f"Batch prediction completed: {len(valid_rows)} scored, {n_failed} rejected")
+
+    return {"n_records": len(records), "n_scored": len(valid_rows), "n_failed": n_failed, "results": results}
+
 # Run command: uvicorn main:app --reload --port 8000
\ No newline at end of file
@@ -1,53 +1,60 @@
 # src/components/data_transformation.py
 
 import sys
-import numpy as np
+import time
 import pandas as pd
 from pathlib import Path
 from typing import Tuple
+from joblib import parallel_config
 from sklearn.model_selection import train_test_split
 from optbinning import BinningProcess
 from src.exception import AppException
 from src.logger import logger
-from src.utils.file_ops import save_joblib
-from src.entity.config_entity import DataTransformationConfig
+from src.utils.file_ops import save_joblib, save_json, save_split
+from src.utils.outlier_caps import apply_caps, compute_caps, save_caps
+from src.utils.typed_csv import read_csv_typed
+from src.entity.config_entity import DataLoadingConfig, DataTransformationConfig
 from src.entity.artifacts_entity import DataTransformationArtifact
 
 
 class DataTransformation:
     """
     Handles data preprocessing:
-    - Outlier capping
     - Train/Test/OOT split
+    - Outlier capping (caps fitted on the train split)
     - OptBinning transformation
     """
 
-    def __init__(self, config: DataTransformationConfig, input_csv: str):
+    def __init__(self, config: DataTransformationConfig, input_csv: str, loading_config: DataLoadingConfig = None):
         try:
             self.config = config
+            self.loading_config = loading_config  # Typed CSV reading; default inference if None
             self.input_path = Path(input_csv)
             self.output_dir = Path(self.config.transformed_data_dir)
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
             self.binning_object_path = self.output_dir / self.config.binning_object_file
+            self.outlier_caps_path = self.output_dir / self.config.outlier_caps_file
             self.transformed_csv_path = self.output_dir / self.config.transformed_data_file_name
+            self.transformation_report_path = self.output_dir / self.config.transformation_report_file
 
             logger.info(f"✅ DataTransformation initialized. Input CSV: {self.input_path}")
         except Exception as e:
             raise AppException(e, sys)
 
-    def cap_outliers(self, df: pd.DataFrame, lower=0.01, upper=0.99) -> pd.DataFrame:
+    def cap_outliers(self, X_train: pd.DataFrame, *frames: pd.DataFrame, lower=0.01, upper=0.99) -> dict:
         """
-        Clip numeric columns at 1st and 99th percentiles to handle outliers.
+        Fit 1st/99th percentile caps of the numeric columns on the train split
+        only, clip the train split and every other given frame in place with
+        them, and save the caps for serving.
         """
         try:
-            for col in df.select_dtypes(include="number"):
-                if col != self.config.target_column:
-                    lo = df[col].quantile(lower)
-                    hi = df[col].quantile(upper)
-                    df[col] = np.clip(df[col], lo, hi)
-            logger.info("📉 Outlier capping completed.")
-            return df
+            caps = compute_caps(X_train, lower, upper)
+            for df in (X_train, *frames):
+                apply_caps(df, caps)
+            save_caps(self.outlier_caps_path, caps)
+            logger.info(f"📉 Outlier capping completed; {len(caps['caps'])} caps saved to {self.outlier_caps_path}")
+            return caps
         except Exception as e:
             raise AppException(e, sys)
 
@@ -76,51 +83,131 @@ class DataTransformation:
                 stratify=y_dev,
                 random_state=self.config.random_state
             )
+            return X_train, X_test, X_oot, y_train, y_test, y_oot
+        except Exception as e:
+            raise AppException(e, sys)
 
-            # Save splits as joblib
-            save_joblib(self.config.X_train_path, X_train)
-            save_joblib(self.config.X_test_path, X_test)
-            save_joblib(self.config.X_oot_path, X_oot)
-            save_joblib(self.config.y_train_path, y_train)
-            save_joblib(self.config.y_test_path, y_test)
-            save_joblib(self.config.y_oot_path, y_oot)
+    def save_splits(self, X_train, X_test, X_oot, y_train, y_test, y_oot) -> dict:
+        """
+        Saves Train/Test/OOT sets in the configured split format.
 
-            logger.info("🗂️ Train, test, and OOT sets saved.")
-            return X_train, X_test, X_oot, y_train, y_test, y_oot
+        Returns:
+            dict: Path written for each split, keyed like the artifact fields.
+        """
+        try:
+            fmt = self.config.split_format
+            paths = {
+                "X_train_path": save_split(self.config.X_train_path, X_train, fmt),
+                "X_test_path": save_split(self.config.X_test_path, X_test, fmt),
+                "X_oot_path": save_split(self.config.X_oot_path, X_oot, fmt),
+                "y_train_path": save_split(self.config.y_train_path, y_train, fmt),
+                "y_test_path": save_split(self.config.y_test_path, y_test, fmt),
+                "y_oot_path": save_split(self.config.y_oot_path, y_oot, fmt),
+            }
+
+            logger.info(f"🗂️ Train, test, and OOT sets saved ({fmt}).")
+            return paths
         except Exception as e:
             raise AppException(e, sys)
 
     def apply_binning(self, X_train: pd.DataFrame, y_train: pd.Series) -> BinningProcess:
         """
         Fits an OptBinning process on the training data.
+
+        Variables are solved in parallel on ``binning_n_jobs`` workers of the
+        configured joblib backend; with "loky" these are processes, so the
+        solves are not serialized by the GIL. Writes the per-variable report
+        (see ``build_transformation_report``).
         """
         try:
-            cat_cols = X_train.select_dtypes(include="object").columns.tolist()
+            # Non-numeric columns are categorical whether loaded as object, string or category
+            cat_cols = X_train.select_dtypes(exclude="number").columns.tolist()
             binning_process = BinningProcess(
                 variable_names=X_train.columns.tolist(),
-                categorical_variables=cat_cols
+                categorical_variables=cat_cols,
+                n_jobs=self.config.binning_n_jobs
             )
-            binning_process.fit(X_train, y_train)
-            logger.info("📊 Binning process fitted.")
+
+            start = time.perf_counter()
+            # optbinning asks joblib for threads; an explicit backend takes precedence
+            with parallel_config(backend=self.config.binning_parallel_backend):
+                binning_process.fit(X_train, y_train)
+            fit_seconds = time.perf_counter() - start
+            logger.info(
+                f"📊 Binning process fitted in {fit_seconds:.2f}s "
+                f"({len(binning_process.variable_names)} variables, n_jobs={self.config.binning_n_jobs})."
+            )
+
+            report = self.build_transformation_report(binning_process, fit_seconds)
+            save_json(self.transformation_report_path, report)
+            logger.info(f"🧾 Transformation report saved to {self.transformation_report_path}")
             return binning_process
         except Exception as e:
             raise AppException(e, sys)
 
+    def build_transformation_report(self, binning_process: BinningProcess, fit_seconds: float) -> dict:
+        """
+        Per-variable solver status, bin count, IV and timings (total, prebinning
+        and solver seconds) of a fitted binning process, slowest variable first.
+
+        The per-variable timings are private OptimalBinning attributes with no
+        public accessor; they are read defensively and reported as None if an
+        optbinning release drops them. ``fit_seconds`` is measured around fit.
+        """
+        try:
+            summary = binning_process.summary().set_index("name")
+            variables = []
+            for name in binning_process.variable_names:
+                optb = binning_process.get_binned_variable(name)
+                row = summary.loc[name]
+                variables.append({
+                    "name": name,
+                    "dtype": row["dtype"],
+                    "status": row["status"],
+                    "selected": bool(row["selected"]),
+                    "n_bins": int(row["n_bins"]),
+                    "iv": float(row["iv"]),
+                    "time_total": getattr(optb, "_time_total", None),
+                    "time_prebinning": getattr(optb, "_time_prebinning", None),
+                    "time_solver": getattr(optb, "_time_solver", None),
+                })
+            variables.sort(key=lambda v: v["time_total"] or 0.0, reverse=True)
+
+            statuses = pd.Series([v["status"] for v in variables]).value_counts().to_dict()
+            return {
+                "n_variables": len(variables),
+                "n_jobs": self.config.binning_n_jobs,
+                "parallel_backend": self.config.binning_parallel_backend,
+                "fit_seconds": round(fit_seconds, 4),
+                "sum_variable_seconds": round(sum(v["time_total"] or 0.0 for v in variables), 4),
+                "status_counts": {str(k): int(v) for k, v in statuses.items()},
+                "variables": variables,
+            }
+        except Exception as e:
+            raise AppException(e, sys)
+
     def initiate_data_transformation(self) -> DataTransformationArtifact:
         """
         Complete orchestration of the data transformation step.
         """
         try:
-            df = pd.read_csv(self.input_path)
+            loading = self.loading_config
+            if loading is not None:
+                df = read_csv_typed(self.input_path, loading.schema_columns, engine=loading.csv_engine,
+                                    categorical=loading.categorical_dtypes, downcast=loading.downcast_numerics)
+            else:
+                df = pd.read_csv(self.input_path)
             logger.info(f"📥 Raw data loaded from {self.input_path}")
 
-            df = self.cap_outliers(df)
+            # Split first so the caps only see training rows
+            X_train, X_test, X_oot, y_train, y_test, y_oot = self.split_data(df)
+            self.cap_outliers(X_train, X_test, X_oot, df)
 
             # Save transformed dataframe as CSV
             df.to_csv(self.transformed_csv_path, index=False)
             logger.info(f"Transformed CSV saved at: {self.transformed_csv_path}")
-            
-            X_train, X_test, X_oot, y_train, y_test, y_oot = self.split_data(df)
+
+            split_paths = self.save_splits(X_train, X_test, X_oot, y_train, y_test, y_oot)
             bp = self.apply_binning(X_train, y_train)
             
             # Save binning object using joblib utility
@@ -130,12 +217,10 @@ class DataTransformation:
             return DataTransformationArtifact(
                 transformed_csv_file_path=str(self.transformed_csv_path),
                 binning_object_path=str(self.binning_object_path),
-                X_train_path=self.config.X_train_path,
-                X_test_path=self.config.X_test_path,
-                X_oot_path=self.config.X_oot_path,
-                y_train_path=self.config.y_train_path,
-                y_test_path=self.config.y_test_path,
-                y_oot_path=self.config.y_oot_path
+                **split_paths,
+                transformation_report_path=str(self.transformation_report_path),
+                split_format=self.config.split_format,
+                outlier_caps_path=str(self.outlier_caps_path)
             )
         except Exception as e:
             logger.error(f"❌ Exception in data transformation: {e}")
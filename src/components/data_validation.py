@@ -2,9 +2,12 @@
 
 import sys
 from pathlib import Path
+from typing import Iterator
 import pandas as pd
 from src.exception import AppException
 from src.logger import logger
+from src.utils.file_ops import save_json
+from src.utils.column_profile import ColumnProfile
 from src.entity.config_entity import DataValidationConfig
 from src.entity.artifacts_entity import DataIngestionArtifact, DataValidationArtifact
 
@@ -34,39 +37,60 @@ class DataValidation:
             logger.error(f"Error initializing DataValidation: {e}")
             raise AppException(e, sys)
 
+    def _iter_chunks(self, data_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Stream the data file in chunks of ``chunk_size`` rows with pandas' own
+        dtype inference: the schema check must see what the data holds, not
+        the schema's dtypes (typed loading is for the downstream loaders).
+        """
+        yield from pd.read_csv(data_path, chunksize=self.data_validation_config.chunk_size)
+
     def validate_data_file(self) -> DataValidationArtifact:
         """
-        Check columns and types against schema, write validation report.
+        Check columns and types against schema in a single streaming pass over
+        the data file, profiling every column on the way; write the validation
+        report and the JSON column profile.
 
         Returns:
-            DataValidationArtifact: Validation status and report path.
+            DataValidationArtifact: Validation status, report and profile paths.
         """
         try:
             logger.info("Starting data validation.")
 
             data_path = self.data_ingestion_artifact.data_csv_file_path
-            df = pd.read_csv(data_path)
-
             expected_schema = self.data_validation_config.schema["columns"]  # dict of col_name: dtype_str
             #target_column = self.data_validation_config.schema["target_column"]
 
+            # One pass: dtype kinds are promoted across chunks, profiles accumulate in constant memory
+            columns = list(pd.read_csv(data_path, nrows=0).columns)
+            profiles = {
+                col: ColumnProfile(
+                    col,
+                    sample_size=self.data_validation_config.quantile_sample_size,
+                    max_categories=self.data_validation_config.max_tracked_categories
+                )
+                for col in columns
+            }
+            n_rows, n_chunks = 0, 0
+            for chunk in self._iter_chunks(data_path):
+                for col in columns:
+                    profiles[col].update(chunk[col])
+                n_rows += len(chunk)
+                n_chunks += 1
+            logger.info(f"📊 Profiled {n_rows:,} rows in {n_chunks} chunk(s)")
+
             # Check columns presence
-            missing_columns = [col for col in expected_schema if col not in df.columns]
-            extra_columns = [col for col in df.columns if col not in expected_schema]
+            missing_columns = [col for col in expected_schema if col not in columns]
+            extra_columns = [col for col in columns if col not in expected_schema]
 
             type_mismatches = []
 
             for col, expected_type in expected_schema.items():
-                if col in df.columns:
-                    actual_dtype = str(df[col].dtype)
-                    # Simple check: expected type is a string like 'int', 'float', 'object'
-                    # Map pandas dtype to simple string for comparison
-                    if expected_type == "int" and not pd.api.types.is_integer_dtype(df[col]):
-                        type_mismatches.append((col, expected_type, actual_dtype))
-                    elif expected_type == "float" and not pd.api.types.is_float_dtype(df[col]):
-                        type_mismatches.append((col, expected_type, actual_dtype))
-                    elif expected_type == "object" and not pd.api.types.is_object_dtype(df[col]):
-                        type_mismatches.append((col, expected_type, actual_dtype))
+                if col in profiles:
+                    # Expected type is a schema kind: 'int', 'float' or 'object'
+                    actual_kind = profiles[col].kind or expected_type  # No rows: nothing contradicts the schema
+                    if actual_kind != expected_type:
+                        type_mismatches.append((col, expected_type, actual_kind))
 
             validation_status = True
             report_lines = [] # Create validation report string
@@ -95,14 +119,24 @@ class DataValidation:
             with open(validation_report_path, "w") as file:
                 file.write("\n".join(report_lines))
 
+            profile_path = validation_dir / self.data_validation_config.profile_file
+            save_json(profile_path, {
+                "data_file": str(data_path),
+                "rows": n_rows,
+                "validation_status": validation_status,
+                "columns": {col: profile.to_dict() for col, profile in profiles.items()},
+            })
+
             logger.info(f"Validation report saved to: {validation_report_path}")
+            logger.info(f"Column profile saved to: {profile_path}")
             logger.info(f"Validation status: {validation_status}")
 
             return DataValidationArtifact(
                 validation_status=validation_status,
-                validation_report_file_path=validation_report_path
+                validation_report_file_path=validation_report_path,
+                profile_file_path=profile_path
             )
 
         except Exception as e:
             logger.error(f"Exception during data validation: {e}")
-            raise AppException(e, sys)
\ No newline at end of file
+            raise AppException(e, sys)
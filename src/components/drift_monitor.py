@@ -0,0 +1,417 @@
+# src/components/drift_monitor.py
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from src.exception import AppException
+from src.logger import logger
+from src.utils.file_ops import load_joblib, load_json, save_json
+from src.utils.metrics import stability_index
+from src.utils.outlier_caps import apply_caps, caps_path_for, load_caps
+from src.utils.psi_baseline import baseline_path_for, load_psi_baseline
+from src.utils.scorecard_compiler import compile_scorecard
+from src.entity.config_entity import DriftMonitoringConfig
+from src.entity.artifacts_entity import DriftMonitoringArtifact, ModelPusherArtifact
+
+# Tumbling window sizes in seconds
+WINDOWS = {"hour": 3600, "day": 86400}
+# Score fields of the logged response, by PSI baseline name
+SCORE_FIELDS = {"score": "credit_score", "proba": "default_probability"}
+
+
+class DriftWindow:
+    """
+    Mergeable histograms of one time window: logged scores and default
+    probabilities over the frozen PSI breakpoints, and feature values over
+    the scorecard bins. Size is fixed by the model, not by the traffic.
+    """
+
+    def __init__(self, n: int, scores: Dict[str, np.ndarray], features: np.ndarray):
+        self.n = n
+        self.scores = scores
+        self.features = features
+
+    @classmethod
+    def empty(cls, score_bins: Dict[str, int], n_feature_bins: int) -> "DriftWindow":
+        scores = {name: np.zeros(size, dtype=np.int64) for name, size in score_bins.items()}
+        return cls(0, scores, np.zeros(n_feature_bins, dtype=np.int64))
+
+    def merge(self, other: "DriftWindow") -> "DriftWindow":
+        self.n += other.n
+        for name in self.scores:
+            self.scores[name] += other.scores[name]
+        self.features += other.features
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n": self.n,
+            "scores": {name: counts.tolist() for name, counts in self.scores.items()},
+            "features": self.features.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DriftWindow":
+        scores = {name: np.asarray(counts, dtype=np.int64) for name, counts in data["scores"].items()}
+        return cls(data["n"], scores, np.asarray(data["features"], dtype=np.int64))
+
+
+class DriftMonitor:
+    """
+    Score and feature drift of logged prediction traffic against the
+    training baseline of the pushed model.
+
+    Each run reads the prediction log from the byte offset where the previous
+    run stopped (a truncated or replaced log is read from the start), in
+    chunks of complete lines. New records are binned in one vectorized pass
+    and counted into hourly and daily tumbling windows with a single
+    bincount per histogram. Window histograms, offset and watermark (latest
+    logged timestamp) are kept in a state file, so nothing is ever re-read.
+
+    Windows are evaluated once they close, and a rolling window over the
+    last ``rolling_hours`` hourly windows is evaluated on every run: PSI of
+    the score and default probability against the frozen training
+    breakpoints, and CSI of every scorecard variable against the training
+    bins. Breaches of the PSI/CSI thresholds are logged and appended to the
+    alerts file.
+    """
+
+    def __init__(self, config: DriftMonitoringConfig, pusher_artifact: ModelPusherArtifact):
+        try:
+            self.config = config
+            self.model_path = pusher_artifact.pushed_model_path
+            self.model_version = pusher_artifact.model_version
+            self.artifact_dir = Path(config.artifact_dir)
+            self.artifact_dir.mkdir(parents=True, exist_ok=True)
+
+            self.compiled = compile_scorecard(load_joblib(self.model_path))
+            self.caps = load_caps(caps_path_for(self.model_path))
+            self.baseline = load_psi_baseline(baseline_path_for(self.model_path)) or {}
+            if not self.baseline:
+                logger.warning(f"⚠️ No PSI baseline next to {self.model_path}; only feature CSI is monitored.")
+            self.score_bins = {name: len(acc.counts) for name, acc in self.baseline.items()}
+            logger.info(f"✅ DriftMonitor initialized for model {self.model_version} (log: {config.prediction_log_path})")
+        except Exception as e:
+            raise AppException(e, sys)
+
+    # === State ===
+
+    def load_state(self) -> Dict[str, Any]:
+        state_path = self.artifact_dir / self.config.state_file
+        if state_path.exists():
+            state = load_json(state_path)
+            if state.get("model_version") == self.model_version:
+                state["windows"] = {
+                    kind: {int(start): DriftWindow.from_dict(w) for start, w in windows.items()}
+                    for kind, windows in state["windows"].items()
+                }
+                return state
+            logger.info("🔄 Pushed model changed; drift windows restart from the current log position.")
+            return self.new_state(offset=state["offset"], inode=state["inode"])
+        return self.new_state()
+
+    def new_state(self, offset: int = 0, inode: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "model_version": self.model_version,
+            "offset": offset,
+            "inode": inode,
+            "watermark": None,
+            "evaluated": {kind: None for kind in WINDOWS},
+            "windows": {kind: {} for kind in WINDOWS},
+        }
+
+    def save_state(self, state: Dict[str, Any]) -> None:
+        state_path = self.artifact_dir / self.config.state_file
+        tmp_path = state_path.with_suffix(".tmp")
+        save_json(tmp_path, {
+            **state,
+            "windows": {
+                kind: {str(start): w.to_dict() for start, w in windows.items()}
+                for kind, windows in state["windows"].items()
+            },
+        })
+        os.replace(tmp_path, state_path)  # Offset and counts are updated together or not at all
+
+    # === Ingestion ===
+
+    def read_new_lines(self, state: Dict[str, Any]) -> Iterator[bytes]:
+        """
+        Yield blocks of complete new lines from the log, advancing
+        ``state["offset"]`` past each block. A trailing partial line is left
+        for the next run.
+        """
+        log_path = Path(self.config.prediction_log_path)
+        if not log_path.exists():
+            return
+        with open(log_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != state["inode"] or stat.st_size < state["offset"]:
+                if state["inode"] is not None:
+                    logger.info("🔁 Prediction log was rotated or truncated; reading it from the start.")
+                state["inode"], state["offset"] = stat.st_ino, 0
+            f.seek(state["offset"])
+            pending = b""
+            while True:
+                chunk = f.read(self.config.chunk_bytes)
+                if not chunk:
+                    break
+                pending += chunk
+                end = pending.rfind(b"\n")
+                if end < 0:
+                    continue
+                block, pending = pending[:end + 1], pending[end + 1:]
+                state["offset"] += len(block)
+                yield block
+
+    @staticmethod
+    def _decode(block: bytes) -> List[Optional[Dict[str, Any]]]:
+        """
+        Decode a block of JSON lines in a single ``json.loads`` call (the
+        per-call overhead dominates for short lines); a block holding a
+        malformed line is decoded line by line, with None for bad lines.
+        """
+        try:
+            return json.loads(b"[" + block.rstrip(b"\n").replace(b"\n", b",") + b"]")
+        except ValueError:
+            entries = []
+            for line in block.splitlines():
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    entries.append(None)
+            return entries
+
+    def parse_block(self, block: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Timestamps, scores and request features of the block's records that
+        were scored by the pushed model (other versions, malformed lines and
+        requests with feature values that cannot be binned are counted and
+        skipped).
+        """
+        ts, scores, requests, skipped = [], {name: [] for name in self.score_bins}, [], 0
+        for entry in self._decode(block):
+            try:
+                if not isinstance(entry, dict):  # Malformed, or valid JSON that is not an object
+                    raise ValueError("Malformed log line")
+                if entry.get("model_version") not in (None, self.model_version):
+                    skipped += 1
+                    continue
+                response, request = entry["response"], entry["request"]
+                if not isinstance(request, dict):
+                    raise TypeError("Logged request is not an object")
+                values = {name: float(response[SCORE_FIELDS[name]]) for name in scores}
+                timestamp = float(entry["ts"])
+                requests.append(request)
+                ts.append(timestamp)
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+                continue
+            for name, value in values.items():
+                scores[name].append(value)
+        if not ts:
+            return {"n": 0, "skipped": skipped}
+
+        X, valid = self.coerce_features(pd.DataFrame.from_records(requests))
+        if not valid.all():
+            skipped += int((~valid).sum())
+            X = X[valid]
+            if X.empty:
+                return {"n": 0, "skipped": skipped}
+        if self.caps is not None:
+            X = apply_caps(X, self.caps)
+        return {
+            "n": len(X),
+            "skipped": skipped,
+            "ts": np.asarray(ts, dtype=np.float64)[valid],
+            "scores": {name: np.asarray(values, dtype=np.float64)[valid] for name, values in scores.items()},
+            "table_idx": self.compiled.transform(X),
+        }
+
+    def coerce_features(self, X: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        The scorecard variables of the logged requests, numerical ones as
+        floats (absent variables are missing values), and a mask of the rows
+        whose values can all be binned: a non-numeric value of a numerical
+        variable, or a list/object value of a categorical one, invalidates
+        its row instead of failing the whole block.
+        """
+        X = X.reindex(columns=self.compiled.variables)
+        valid = np.ones(len(X), dtype=bool)
+        for name, dtype in zip(self.compiled.variables, self.compiled.dtypes):
+            column = X[name]
+            if dtype == "numerical":
+                values = pd.to_numeric(column, errors="coerce")
+                valid &= ~(values.isna() & column.notna()).to_numpy()
+                X[name] = values.astype(np.float64)
+            else:
+                try:
+                    pd.factorize(column)
+                except TypeError:  # Unhashable (list/object) values; only then check value by value
+                    valid &= ~column.map(lambda value: isinstance(value, (list, dict))).to_numpy(dtype=bool)
+        return X, valid
+
+    def accumulate(self, state: Dict[str, Any], batch: Dict[str, Any]) -> None:
+        """
+        Add a parsed batch to every window it falls into: one bincount per
+        histogram and window size, whatever the number of windows.
+        """
+        n_feature_bins = len(self.compiled.woe_table)
+        for kind, size in WINDOWS.items():
+            starts, window_of = np.unique((batch["ts"] // size).astype(np.int64) * size, return_inverse=True)
+            n_windows = len(starts)
+
+            features = np.bincount(
+                (window_of[:, None] * n_feature_bins + batch["table_idx"]).ravel(),
+                minlength=n_windows * n_feature_bins
+            ).reshape(n_windows, n_feature_bins)
+            scores = {}
+            for name, n_bins in self.score_bins.items():
+                bins = np.searchsorted(self.baseline[name].breakpoints, batch["scores"][name], side="right")
+                scores[name] = np.bincount(window_of * n_bins + bins, minlength=n_windows * n_bins).reshape(n_windows, n_bins)
+            rows = np.bincount(window_of, minlength=n_windows)
+
+            windows = state["windows"][kind]
+            for i, start in enumerate(starts.tolist()):
+                delta = DriftWindow(int(rows[i]), {name: counts[i] for name, counts in scores.items()}, features[i])
+                if start in windows:
+                    windows[start].merge(delta)
+                else:
+                    windows[start] = DriftWindow.empty(self.score_bins, n_feature_bins).merge(delta)
+
+        latest = float(batch["ts"].max())
+        state["watermark"] = latest if state["watermark"] is None else max(state["watermark"], latest)
+
+    # === Evaluation ===
+
+    def evaluate_window(self, window: DriftWindow, label: str, start: float, end: float) -> Dict[str, Any]:
+        result = {"window": label, "start": start, "end": end, "n": window.n}
+        if window.n < self.config.min_records:
+            result["status"] = "insufficient_data"
+            return result
+
+        psi = {
+            name: float(stability_index(self.baseline[name].counts, counts, np.array([0]))[0])
+            for name, counts in window.scores.items()
+        }
+        csi = stability_index(self.compiled.train_counts, window.features, self.compiled.offsets)
+        csi = dict(zip(self.compiled.variables, csi.tolist()))
+
+        alerts = [
+            {"metric": "psi", "target": name, "value": value, "threshold": self.config.psi_threshold}
+            for name, value in psi.items() if value > self.config.psi_threshold
+        ] + [
+            {"metric": "csi", "target": name, "value": value, "threshold": self.config.csi_threshold}
+            for name, value in csi.items() if value > self.config.csi_threshold
+        ]
+        result.update({"status": "drift" if alerts else "ok", "psi": psi, "csi": csi, "alerts": alerts})
+        return result
+
+    def evaluate(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate windows closed since the last run, the open windows and the
+        rolling window, then drop windows past retention.
+        """
+        watermark = state["watermark"]
+        closed, open_windows = [], {}
+        for kind, size in WINDOWS.items():
+            windows = state["windows"][kind]
+            last_evaluated = state["evaluated"][kind]
+            for start in sorted(windows):
+                window_range = (start, start + size)
+                if start + size <= watermark:
+                    if last_evaluated is None or start > last_evaluated:
+                        closed.append(self.evaluate_window(windows[start], kind, *window_range))
+                        state["evaluated"][kind] = start
+                else:
+                    open_windows[kind] = self.evaluate_window(windows[start], kind, *window_range)
+
+        hour = WINDOWS["hour"]
+        current_hour = int(watermark // hour) * hour
+        rolling_start = current_hour - (self.config.rolling_hours - 1) * hour
+        rolling = DriftWindow.empty(self.score_bins, len(self.compiled.woe_table))
+        for start, window in state["windows"]["hour"].items():
+            if start >= rolling_start:
+                rolling.merge(window)
+        rolling = self.evaluate_window(rolling, f"rolling_{self.config.rolling_hours}h",
+                                       rolling_start, current_hour + hour)
+
+        horizon = watermark - self.config.retention_days * WINDOWS["day"]
+        for kind, size in WINDOWS.items():
+            windows = state["windows"][kind]
+            for start in [s for s in windows if s + size < horizon]:
+                del windows[start]
+
+        return {"closed": closed, "open": open_windows, "rolling": rolling}
+
+    def emit_alerts(self, evaluations: List[Dict[str, Any]]) -> int:
+        alerts_path = self.artifact_dir / self.config.alerts_file
+        n_alerts = 0
+        with open(alerts_path, "a", encoding="utf-8") as f:
+            for evaluation in evaluations:
+                for alert in evaluation.get("alerts", []):
+                    record = {
+                        "raised_at": round(time.time(), 3),
+                        "model_version": self.model_version,
+                        "window": evaluation["window"],
+                        "start": evaluation["start"],
+                        "end": evaluation["end"],
+                        "n": evaluation["n"],
+                        **alert,
+                    }
+                    f.write(json.dumps(record) + "\n")
+                    logger.warning(
+                        f"🚨 Drift alert [{evaluation['window']} from {evaluation['start']}]: "
+                        f"{alert['metric'].upper()} of {alert['target']} = {alert['value']:.4f} "
+                        f"> {alert['threshold']}"
+                    )
+                    n_alerts += 1
+        return n_alerts
+
+    def initiate_monitoring(self) -> DriftMonitoringArtifact:
+        try:
+            start = time.perf_counter()
+            state = self.load_state()
+            n_new, n_skipped = 0, 0
+            for block in self.read_new_lines(state):
+                batch = self.parse_block(block)
+                n_skipped += batch["skipped"]
+                if batch["n"]:
+                    self.accumulate(state, batch)
+                    n_new += batch["n"]
+            logger.info(f"📥 Read {n_new:,} new prediction record(s) ({n_skipped:,} skipped) up to offset {state['offset']:,}")
+
+            report = {
+                "model_version": self.model_version,
+                "log_path": self.config.prediction_log_path,
+                "offset": state["offset"],
+                "n_new_records": n_new,
+                "n_skipped": n_skipped,
+                "watermark": state["watermark"],
+            }
+            n_alerts = 0
+            if state["watermark"] is not None:
+                evaluations = self.evaluate(state)
+                # The rolling window only alerts again once new traffic has arrived
+                n_alerts = self.emit_alerts(evaluations["closed"] + ([evaluations["rolling"]] if n_new else []))
+                report.update(evaluations)
+            self.save_state(state)
+
+            report["elapsed_seconds"] = round(time.perf_counter() - start, 4)
+            report_path = self.artifact_dir / self.config.report_file
+            save_json(report_path, report)
+            logger.info(f"🛰️ Drift report saved at: {report_path} ({n_alerts} alert(s), {report['elapsed_seconds']}s)")
+
+            return DriftMonitoringArtifact(
+                report_path=str(report_path),
+                alerts_path=str(self.artifact_dir / self.config.alerts_file),
+                n_new_records=n_new,
+                n_alerts=n_alerts
+            )
+        except Exception as e:
+            logger.error(f"❌ Drift monitoring failed: {e}")
+            raise AppException(e, sys)
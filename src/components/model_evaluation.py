@@ -1,13 +1,18 @@
 # src/components/model_evaluation.py
 
 import sys
+import time
 from pathlib import Path
-from scipy.stats import ks_2samp
-from sklearn.metrics import roc_auc_score, average_precision_score, brier_score_loss
+import numpy as np
+import pandas as pd
 from src.exception import AppException
 from src.logger import logger
-from src.utils.file_ops import load_joblib, save_json
-from src.utils.metrics import calculate_psi
+from src.utils.bootstrap import bootstrap_confidence_intervals
+from src.utils.file_ops import compute_file_hash, load_joblib, load_split, save_json
+from src.utils.metrics import binary_classification_metrics, calculate_psi, characteristic_stability
+from src.utils.score_store import ScoreStore
+from src.utils.scorecard_compiler import compile_scorecard
+from src.utils.woe_cache import hash_data
 from src.entity.config_entity import ModelEvaluationConfig
 from src.entity.artifacts_entity import DataTransformationArtifact, ModelTrainerArtifact, ModelEvaluationArtifact
 
@@ -26,39 +31,125 @@ class ModelEvaluation:
         except Exception as e:
             raise AppException(e, sys)
 
-    def evaluate(self, X, y, model, name="Model"):
-        proba = model.predict_proba(X)[:, 1]
-        auc = roc_auc_score(y, proba)
-        pr_auc = average_precision_score(y, proba)
-        gini = 2 * auc - 1
-        ks = ks_2samp(proba[y == 1], proba[y == 0]).statistic
-        brier = brier_score_loss(y, proba)
+    def score_split(self, X, compiled, model_hash: str, store: ScoreStore, name="Model"):
+        """
+        Default probability and score vectors of a split, read from the score
+        store when this model already scored the same data. Otherwise both
+        are computed from a single binning pass of the compiled model and stored.
+
+        Returns:
+            tuple: (proba, score) memory-mapped vectors (float64 / float32) and the store entry path.
+        """
+        key = ScoreStore.make_key(model_hash, hash_data(X))
+        vectors = store.get(key)
+        if vectors is not None:
+            logger.info(f"♻️ {name} score vectors reused from {store.path_of(key)}")
+            return (*vectors, store.path_of(key))
+
+        proba, score = compiled.predict(X)
+        entry = store.put(key, proba, score, {
+            "split": name,
+            "model_path": self.trainer_artifact.trained_model_path,
+            "model_hash": model_hash,
+            "n_rows": len(X),
+        })
+        logger.info(f"💾 {name} score vectors saved to {entry}")
+        return (*store.get(key), entry)
+
+    def evaluate(self, y, proba, name="Model"):
+        # The stored float64 vector is the compiled model's output, so metrics match sklearn's on it
+        proba = np.asarray(proba, dtype=np.float64)
+        metrics = binary_classification_metrics(y, proba)
 
         logger.info(
-            f"{name} — AUC: {auc:.3f}, GINI: {gini:.3f}, PR-AUC: {pr_auc:.3f}, KS: {ks:.3f}, Brier: {brier:.3f}"
+            f"{name} — AUC: {metrics['auc']:.3f}, GINI: {metrics['gini']:.3f}, PR-AUC: {metrics['pr_auc']:.3f}, "
+            f"KS: {metrics['ks']:.3f} (cutoff {metrics['ks_cutoff']:.3f}), Brier: {metrics['brier']:.3f}"
         )
 
-        return {"auc": auc, "gini": gini, "pr_auc": pr_auc, "ks": ks, "brier": brier, "proba": proba}
+        return {**metrics, "proba": proba}
+
+    def add_confidence_intervals(self, splits: dict, targets: dict) -> dict:
+        """
+        Add ``<metric>_ci_lower`` / ``<metric>_ci_upper`` bootstrap bounds to
+        every split's metrics (in place).
+
+        Returns:
+            dict: Bootstrap settings and timing, stored alongside the metrics.
+        """
+        cfg = self.eval_cfg.bootstrap
+        start = time.perf_counter()
+        for name, metrics in splits.items():
+            intervals = bootstrap_confidence_intervals(
+                targets[name], metrics["proba"],
+                n_replicates=cfg["n_replicates"],
+                confidence=cfg["confidence"],
+                random_state=cfg["random_state"],
+                block_size=cfg.get("block_size", 50),
+                n_workers=cfg.get("n_workers"),
+                max_memory_mb=cfg.get("max_memory_mb", 1024)
+            )
+            for metric, (lower, upper) in intervals.items():
+                metrics[f"{metric}_ci_lower"] = lower
+                metrics[f"{metric}_ci_upper"] = upper
+            logger.info(
+                f"📏 {name} {cfg['confidence']:.0%} CI — AUC: [{intervals['auc'][0]:.3f}, {intervals['auc'][1]:.3f}], "
+                f"KS: [{intervals['ks'][0]:.3f}, {intervals['ks'][1]:.3f}]"
+            )
+        return {
+            "n_replicates": cfg["n_replicates"],
+            "confidence": cfg["confidence"],
+            "random_state": cfg["random_state"],
+            "elapsed_seconds": round(time.perf_counter() - start, 4),
+        }
 
     def initiate_evaluation(self) -> ModelEvaluationArtifact:
         try:
             model = load_joblib(self.trainer_artifact.trained_model_path)
-            X_train = load_joblib(self.trans_artifact.X_train_path)
-            X_test = load_joblib(self.trans_artifact.X_test_path)
-            X_oot = load_joblib(self.trans_artifact.X_oot_path)
-            y_train = load_joblib(self.trans_artifact.y_train_path)
-            y_test = load_joblib(self.trans_artifact.y_test_path)
-            y_oot = load_joblib(self.trans_artifact.y_oot_path)
+
+            # Only the columns the scorecard bins are read (projected for columnar formats)
+            fmt, columns = self.trans_artifact.split_format, list(model.binning_process_.variable_names)
+            X_train = load_split(self.trans_artifact.X_train_path, fmt, columns=columns)
+            X_test = load_split(self.trans_artifact.X_test_path, fmt, columns=columns)
+            X_oot = load_split(self.trans_artifact.X_oot_path, fmt, columns=columns)
+            y_train = load_split(self.trans_artifact.y_train_path, fmt)
+            y_test = load_split(self.trans_artifact.y_test_path, fmt)
+            y_oot = load_split(self.trans_artifact.y_oot_path, fmt)
 
             logger.info("🔍 Running model evaluation...")
 
-            metrics_train = self.evaluate(X_train, y_train, model, name="Train")
-            metrics_test = self.evaluate(X_test, y_test, model, name="Test")
-            metrics_oot = self.evaluate(X_oot, y_oot, model, name="OOT")
+            compiled = compile_scorecard(model)
+            model_hash = compute_file_hash(self.trainer_artifact.trained_model_path)
+            store = ScoreStore(self.eval_cfg.score_store_dir)
+            vector_paths = {}
+            proba_train, _, vector_paths["train"] = self.score_split(X_train, compiled, model_hash, store, name="Train")
+            proba_test, _, vector_paths["test"] = self.score_split(X_test, compiled, model_hash, store, name="Test")
+            proba_oot, _, vector_paths["oot"] = self.score_split(X_oot, compiled, model_hash, store, name="OOT")
+
+            metrics_train = self.evaluate(y_train, proba_train, name="Train")
+            metrics_test = self.evaluate(y_test, proba_test, name="Test")
+            metrics_oot = self.evaluate(y_oot, proba_oot, name="OOT")
 
             psi = calculate_psi(metrics_train["proba"], metrics_oot["proba"])
             logger.info(f"PSI between train & OOT: {psi:.3f}")
 
+            # Per-feature stability of every split against the training bin distribution
+            csi_table = pd.DataFrame({
+                name: characteristic_stability(compiled, X)
+                for name, X in (("train", X_train), ("test", X_test), ("oot", X_oot))
+            }).rename_axis("feature")
+            csi_path = Path(self.eval_cfg.evaluation_artifact_dir) / self.eval_cfg.csi_file_name
+            csi_path.parent.mkdir(parents=True, exist_ok=True)
+            csi_table.to_csv(csi_path)
+            top = csi_table["oot"].idxmax()
+            logger.info(f"📐 CSI table saved at: {csi_path} (highest OOT CSI: {top} = {csi_table.loc[top, 'oot']:.4f})")
+
+            bootstrap_info = None
+            if self.eval_cfg.bootstrap and self.eval_cfg.bootstrap.get("enabled"):
+                bootstrap_info = self.add_confidence_intervals(
+                    {"train": metrics_train, "test": metrics_test, "oot": metrics_oot},
+                    {"train": y_train, "test": y_test, "oot": y_oot}
+                )
+
             # Remove raw probabilities for JSON compatibility
             for metrics in (metrics_train, metrics_test, metrics_oot):
                 metrics.pop("proba", None)
@@ -69,6 +160,8 @@ class ModelEvaluation:
                 "oot": metrics_oot,
                 "psi": psi
             }
+            if bootstrap_info:
+                final_metrics["bootstrap"] = bootstrap_info
 
             metrics_path = Path(self.eval_cfg.evaluation_artifact_dir) / self.eval_cfg.metrics_file_name
             metrics_path.parent.mkdir(parents=True, exist_ok=True)
@@ -76,7 +169,11 @@ class ModelEvaluation:
 
             logger.info(f"✅ Evaluation metrics saved at: {metrics_path}")
 
-            return ModelEvaluationArtifact(evaluation_metrics_path=str(metrics_path))
+            return ModelEvaluationArtifact(
+                evaluation_metrics_path=str(metrics_path),
+                score_vector_paths={name: str(path) for name, path in vector_paths.items()},
+                csi_table_path=str(csi_path)
+            )
 
         except Exception as e:
             logger.error(f"❌ Model evaluation failed: {e}")
@@ -1,48 +1,138 @@
 # src/components/model_prediction.py
 
 import sys
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, Mapping
 from src.logger import logger
 from src.exception import AppException
-from src.utils.file_ops import load_joblib
+from src.utils.credit_level import get_credit_level, get_credit_levels
+from src.utils.outlier_caps import apply_caps, apply_caps_record
+from src.utils.model_registry import ModelRegistry, model_registry
 from src.entity.artifacts_entity import DataTransformationArtifact, ModelPusherArtifact
 
+if TYPE_CHECKING:
+    import pandas as pd  # Type hints only; not imported at runtime to keep API cold start fast
+
+
+ENGINES = ("optbinning", "compiled")
+
 
 class ModelPrediction:
     def __init__(
         self,
         model_artifact: ModelPusherArtifact,
-        trans_artifact: DataTransformationArtifact = None  # Optional for CLI sampling
+        trans_artifact: DataTransformationArtifact = None,  # Optional for CLI sampling
+        registry: ModelRegistry = model_registry,
+        engine: str = "optbinning",  # "compiled" scores with the NumPy engine from scorecard_compiler
+        fused: bool = False  # Bin once and derive probability and score from the same bin matrix
     ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown prediction engine '{engine}'. Expected one of {ENGINES}.")
         self.model_artifact = model_artifact
         self.trans_artifact = trans_artifact
+        self.registry = registry
+        self.engine = engine
+        self.fused = fused
 
-    def initiate_model_prediction(self, input_df: pd.DataFrame) -> pd.DataFrame:
-        try:
-            # Load model
-            model = load_joblib(self.model_artifact.pushed_model_path)
-            logger.info(f"✅ Model loaded from: {self.model_artifact.pushed_model_path}")
+    def load_model(self, model_version: str = None):
+        """
+        Fetch the model from the in-memory registry (loaded from disk only once).
+        Uses the pushed model unless a specific registered version is requested.
+        With the "compiled" engine the CompiledScorecard is returned instead; it
+        exposes the same predict_proba/score interface.
+        """
+        fetch = self.registry.get_compiled if self.engine == "compiled" else self.registry.get
+        if model_version:
+            return fetch(version=model_version)
+        return fetch(model_path=self.model_artifact.pushed_model_path)
 
-            # Predict probability of default
-            default_proba = model.predict_proba(input_df)[:, 1]
-            logger.info("📉 Predicted default probabilities.")
+    def get_caps(self, model_version: str = None):
+        """
+        Outlier caps pushed with the model (None for models pushed without caps).
+        """
+        if model_version:
+            return self.registry.get_caps(version=model_version)
+        return self.registry.get_caps(model_path=self.model_artifact.pushed_model_path)
 
-            # Predict credit score
-            credit_scores = model.score(input_df).round()
-            logger.info("🧾 Predicted credit scores.")
+    def cap_inputs(self, input_df: "pd.DataFrame", model_version: str = None) -> "pd.DataFrame":
+        """
+        Clip inputs with the training caps. Works on a shallow copy, so the
+        caller's frame is left untouched and unclipped columns are not copied.
+        """
+        caps = self.get_caps(model_version)
+        if caps is None:
+            return input_df
+        return apply_caps(input_df.copy(deep=False), caps)
 
-            # Map credit score to levels and descriptions
-            bins = [-float("inf"), 380, 450, 520, 590, 660, 730, 800, float("inf")]
-            labels = [1, 2, 3, 4, 5, 6, 7, 8]
-            descriptions = {
-                1: "Very Poor", 2: "Poor", 3: "Average", 4: "Above Average",
-                5: "Good", 6: "Very Good", 7: "Excellent", 8: "Exceptional"
+    def predict_fused(self, input_df: "pd.DataFrame", model_version: str = None):
+        """
+        Default probability and raw credit score from a single binning pass.
+
+        The optbinning engine transforms the input to bin indices once with the
+        Scorecard's own BinningProcess; WoE and points are then gathered from the
+        compiled per-bin tables. The compiled engine bins with NumPy directly.
+        """
+        version = model_version or self.registry.register(self.model_artifact.pushed_model_path)
+        compiled = self.registry.get_compiled(version=version)
+        if self.engine == "compiled":
+            return compiled.predict(input_df)
+
+        binning_process = self.registry.get(version=version).binning_process_
+        indices = binning_process.transform(
+            input_df[binning_process.variable_names], metric="indices",
+            metric_special="empirical", metric_missing="empirical"
+        )
+        return compiled.predict_from_indices(indices[compiled.variables].to_numpy())
+
+    def predict_record(self, record: Mapping[str, Any], model_version: str = None) -> Dict[str, Any]:
+        """
+        Low-latency path for a single validated record: scores it straight from
+        the compiled tables (no DataFrame, no BinningProcess) and bands the score.
+
+        Returns:
+            dict: credit_score, credit_level, credit_description, default_probability.
+        """
+        try:
+            version = model_version or self.registry.register(self.model_artifact.pushed_model_path)
+            compiled = self.registry.get_compiled(version=version)  # Loads the model first, so its caps are cached
+            caps = self.registry.get_caps(version=version)
+            if caps is not None:
+                record = apply_caps_record(record, caps)
+            default_proba, score = compiled.predict_record(record)
+            credit_score = round(score)
+            credit_level, level_desc = get_credit_level(credit_score)
+            return {
+                "credit_score": credit_score,
+                "credit_level": credit_level,
+                "credit_description": level_desc,
+                "default_probability": default_proba
             }
 
-            credit_levels = pd.cut(credit_scores, bins=bins, labels=labels, include_lowest=True)
-            level_descs = credit_levels.map(descriptions, na_action=None)
+        except Exception as e:
+            logger.error(f"❌ Prediction failed: {e}")
+            raise AppException(e, sys)
+
+    def initiate_model_prediction(self, input_df: "pd.DataFrame", model_version: str = None) -> "pd.DataFrame":
+        try:
+            model_input = self.cap_inputs(input_df, model_version)
+
+            if self.fused:
+                default_proba, credit_scores = self.predict_fused(model_input, model_version)
+                credit_scores = credit_scores.round()
+                logger.info("📉 Predicted default probabilities and credit scores (single binning pass).")
+            else:
+                # Load model
+                model = self.load_model(model_version)
 
-            print(f"🔍 Check for any NaNs: {credit_levels.isna().sum()}, {level_descs.isna().sum()}")
+                # Predict probability of default
+                default_proba = model.predict_proba(model_input)[:, 1]
+                logger.info("📉 Predicted default probabilities.")
+
+                # Predict credit score
+                credit_scores = model.score(model_input).round()
+                logger.info("🧾 Predicted credit scores.")
+
+            # Map credit score to levels and descriptions
+            credit_levels, level_descs = get_credit_levels(credit_scores)
 
             logger.info("📦 Assembling prediction results")
 
@@ -58,4 +148,29 @@ class ModelPrediction:
 
         except Exception as e:
             logger.error(f"❌ Prediction failed: {e}")
-            raise AppException(e, sys)
\ No newline at end of file
+            raise AppException(e, sys)
+
+
+# === Process-pool worker hooks ===
+# Each worker process builds its own ModelPrediction (and loads the model once)
+# in the pool initializer; tasks then only ship the input frame.
+_worker_predictor: ModelPrediction = None
+
+
+def init_prediction_worker(
+    model_artifact: ModelPusherArtifact,
+    engine: str = "optbinning",
+    fused: bool = False,
+    versions_dir: str = None
+) -> None:
+    global _worker_predictor
+    if versions_dir:
+        model_registry.discover(versions_dir)
+    _worker_predictor = ModelPrediction(model_artifact, engine=engine, fused=fused)
+    _worker_predictor.load_model()
+
+
+def predict_in_worker(input_df: "pd.DataFrame", model_version: str = None) -> "pd.DataFrame":
+    if _worker_predictor is None:
+        raise RuntimeError("Prediction worker is not initialized; use init_prediction_worker as pool initializer.")
+    return _worker_predictor.initiate_model_prediction(input_df, model_version=model_version)
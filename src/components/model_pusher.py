@@ -5,6 +5,9 @@ import shutil
 from pathlib import Path
 from src.exception import AppException
 from src.logger import logger
+from src.utils.file_ops import compute_file_hash
+from src.utils.outlier_caps import caps_path_for
+from src.utils.psi_baseline import baseline_path_for
 from src.entity.config_entity import ModelPusherConfig
 from src.entity.artifacts_entity import ModelTrainerArtifact, ModelPusherArtifact
 
@@ -19,19 +22,63 @@ class ModelPusher:
         self.trainer_artifact = trainer_artifact
         logger.info("✅ ModelPusher initialized.")
 
+    @staticmethod
+    def push_sidecar(src_file, path_for, dst_path: Path, version_path: Path, label: str):
+        """
+        Copy a file that belongs to the model (outlier caps, PSI baseline) next
+        to the pushed model and its versioned copy, or remove the previous
+        model's one when the new model has none.
+
+        Returns:
+            Path: The pushed file, or None.
+        """
+        if not src_file:
+            path_for(dst_path).unlink(missing_ok=True)  # Never leave a previous model's file behind
+            path_for(version_path).unlink(missing_ok=True)
+            return None
+        pushed = path_for(dst_path)
+        shutil.copy(src_file, pushed)
+        shutil.copy(src_file, path_for(version_path))
+        logger.info(f"{label} pushed to {pushed}")
+        return pushed
+
     def initiate_model_pusher(self) -> ModelPusherArtifact:
         try:
             src_path = Path(self.trainer_artifact.trained_model_path)
             dst_dir = Path(self.cfg.export_dir)
             dst_dir.mkdir(parents=True, exist_ok=True)
-
             dst_path = dst_dir / src_path.name
-            shutil.copy(src_path, dst_path)
 
+            # Keep a versioned copy so the serving registry can hold several versions
+            model_version = compute_file_hash(src_path)  # Same content as the copies below
+            versions_dir = Path(self.cfg.versions_dir)
+            versions_dir.mkdir(parents=True, exist_ok=True)
+            version_path = versions_dir / f"{model_version}.pkl"
+
+            # The caps the model was trained with (as recorded by the trainer) and its PSI
+            # baseline travel with the model (and each version) so serving clips inputs and
+            # monitoring compares scores the same way. They are written before the model:
+            # serving notices a new model by its file changing and must then find its own
+            # caps, not the previous model's or none.
+            caps_path = self.push_sidecar(
+                self.trainer_artifact.outlier_caps_path, caps_path_for, dst_path, version_path, "📏 Outlier caps"
+            )
+            baseline_path = self.push_sidecar(
+                self.trainer_artifact.psi_baseline_path, baseline_path_for, dst_path, version_path, "📊 PSI baseline"
+            )
+
+            shutil.copy(src_path, version_path)
+            logger.info(f"🏷️ Model version {model_version} stored in {versions_dir}")
+            shutil.copy(src_path, dst_path)
             logger.info(f"🚚 Model copied from {src_path} to {dst_path}")
 
-            return ModelPusherArtifact(pushed_model_path=str(dst_path))
-            
+            return ModelPusherArtifact(
+                pushed_model_path=str(dst_path),
+                model_version=model_version,
+                outlier_caps_path=str(caps_path) if caps_path else None,
+                psi_baseline_path=str(baseline_path) if baseline_path else None
+            )
+
         except Exception as e:
             logger.error(f"❌ Model pusher failed: {e}")
-            raise AppException(e, sys)
\ No newline at end of file
+            raise AppException(e, sys)
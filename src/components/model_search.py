@@ -0,0 +1,202 @@
+# src/components/model_search.py
+
+import os
+import sys
+import time
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression
+from src.exception import AppException
+from src.logger import logger
+from src.utils.metrics import binary_classification_metrics
+
+RANK_METRICS = ("gini", "ks")
+
+# Per-process WoE matrices of every binning group (see _init_search_worker)
+_woe_groups: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+_targets: Tuple[np.ndarray, np.ndarray] = None
+
+
+def expand_grid(grid: Dict[str, list]) -> List[Dict[str, Any]]:
+    """
+    Cartesian product of a {param: [values]} grid as a list of param dicts
+    (an empty grid yields a single empty dict).
+    """
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def fit_binning_group(binning_process, binning_params: Dict[str, Any], X_train, y_train, X_test) -> Dict[str, Any]:
+    """
+    Fit one binning configuration and WoE-transform train and test with it.
+    Runs once per distinct set of binning options, however many estimator
+    candidates share it.
+    """
+    start = time.perf_counter()
+    bp = clone(binning_process).set_params(**binning_params, n_jobs=1)
+    bp.fit(X_train, y_train)
+    woe_train = bp.transform(X_train, metric="woe").to_numpy(dtype=np.float64)
+    woe_test = bp.transform(X_test, metric="woe").to_numpy(dtype=np.float64)
+    n_bins = bp.summary()["n_bins"]
+    return {
+        "woe_train": woe_train,
+        "woe_test": woe_test,
+        "total_bins": int(n_bins.sum()),
+        "binning_seconds": time.perf_counter() - start,
+    }
+
+
+def _init_search_worker(woe_groups: Dict[int, Tuple[np.ndarray, np.ndarray]], y_train: np.ndarray,
+                        y_test: np.ndarray) -> None:
+    """
+    Process pool initializer: every worker receives the WoE matrices once
+    instead of once per candidate.
+    """
+    global _woe_groups, _targets
+    _woe_groups = woe_groups
+    _targets = (y_train, y_test)
+
+
+def evaluate_candidate(group_id: int, estimator_params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fit a LogisticRegression on the group's train WoE matrix and score the
+    test split. The scorecard's probabilities are exactly these (scaling only
+    maps them to points), so test Gini/KS here equal the final model's.
+    """
+    woe_train, woe_test = _woe_groups[group_id]
+    y_train, y_test = _targets
+    try:
+        start = time.perf_counter()
+        estimator = LogisticRegression(**estimator_params).fit(woe_train, y_train)
+        proba = estimator.predict_proba(woe_test)[:, 1]
+        metrics = binary_classification_metrics(y_test, proba)
+        return {
+            "test_auc": metrics["auc"],
+            "test_gini": metrics["gini"],
+            "test_ks": metrics["ks"],
+            "fit_seconds": time.perf_counter() - start,
+        }
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+class ScorecardSearch:
+    """
+    Grid search over estimator and binning options of the scorecard.
+
+    Candidates are grouped by their binning options: each group's
+    BinningProcess is fitted, and train/test WoE-transformed, exactly once.
+    The (cheap) estimator fits of all candidates then run on a process pool
+    whose workers hold every group's WoE matrices. Candidates are ranked by
+    test Gini or KS.
+    """
+
+    def __init__(self, search_cfg: Dict[str, Any], base_estimator_params: Dict[str, Any]):
+        """
+        Args:
+            search_cfg (dict): ``model_trainer.search`` from params.yaml
+                (estimator_grid, binning_grid, rank_by, n_workers).
+            base_estimator_params (dict): Estimator params every candidate starts from.
+        """
+        try:
+            self.estimator_grid = expand_grid(search_cfg.get("estimator_grid") or {})
+            self.binning_grid = expand_grid(search_cfg.get("binning_grid") or {})
+            self.rank_by = search_cfg.get("rank_by", "gini")
+            self.n_workers = search_cfg.get("n_workers") or os.cpu_count()
+            self.base_estimator_params = dict(base_estimator_params)
+
+            if self.rank_by not in RANK_METRICS:
+                raise ValueError(f"Unknown rank_by '{self.rank_by}'. Expected one of {RANK_METRICS}.")
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def run(self, binning_process, X_train, y_train, X_test, y_test) -> Dict[str, Any]:
+        """
+        Evaluate every candidate.
+
+        Args:
+            binning_process (BinningProcess): Template whose options the binning grid overrides.
+            X_train, y_train, X_test, y_test: Train and test splits.
+
+        Returns:
+            dict: rank_by, group and candidate counts, timings, the ranked
+            candidates (failed ones last, with their error) and the best one.
+        """
+        try:
+            start = time.perf_counter()
+            y_train, y_test = np.asarray(y_train), np.asarray(y_test)
+            n_workers = min(self.n_workers, max(len(self.binning_grid), len(self.estimator_grid)))
+            logger.info(
+                f"🔎 Scorecard search: {len(self.binning_grid)} binning group(s) x "
+                f"{len(self.estimator_grid)} estimator setting(s) on {n_workers} worker(s)"
+            )
+
+            # 1) One binning fit + WoE transform per binning group
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(self.binning_grid))) as pool:
+                futures = [
+                    pool.submit(fit_binning_group, binning_process, params, X_train, y_train, X_test)
+                    for params in self.binning_grid
+                ]
+                groups = [future.result() for future in futures]
+            for params, group in zip(self.binning_grid, groups):
+                logger.info(f"📊 Binning group {params}: {group['total_bins']} bins in {group['binning_seconds']:.2f}s")
+
+            # 2) Every estimator setting on every group's WoE matrices
+            woe_groups = {gid: (g["woe_train"], g["woe_test"]) for gid, g in enumerate(groups)}
+            tasks = [
+                (gid, {**self.base_estimator_params, **est_params})
+                for gid in range(len(groups)) for est_params in self.estimator_grid
+            ]
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_search_worker,
+                initargs=(woe_groups, y_train, y_test)
+            ) as pool:
+                futures = [pool.submit(evaluate_candidate, gid, params) for gid, params in tasks]
+                outcomes = [future.result() for future in futures]
+
+            candidates = []
+            for idx, ((gid, est_params), outcome) in enumerate(zip(tasks, outcomes)):
+                candidates.append({
+                    "candidate_id": f"c{idx:03d}",
+                    "binning_params": self.binning_grid[gid],
+                    "estimator_params": est_params,
+                    "total_bins": groups[gid]["total_bins"],
+                    **outcome,
+                })
+
+            other = "ks" if self.rank_by == "gini" else "gini"
+            ranked = sorted(
+                (c for c in candidates if "error" not in c),
+                key=lambda c: (c[f"test_{self.rank_by}"], c[f"test_{other}"]),
+                reverse=True
+            )
+            failed = [c for c in candidates if "error" in c]
+            for rank, candidate in enumerate(ranked, start=1):
+                candidate["rank"] = rank
+            if not ranked:
+                raise ValueError(f"All {len(candidates)} search candidates failed; first error: {failed[0]['error']}")
+
+            best = ranked[0]
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"🏆 Best candidate {best['candidate_id']} — test Gini: {best['test_gini']:.4f}, "
+                f"KS: {best['test_ks']:.4f} ({len(candidates)} candidates, {len(failed)} failed, {elapsed:.2f}s)"
+            )
+            return {
+                "rank_by": self.rank_by,
+                "n_binning_groups": len(groups),
+                "n_candidates": len(candidates),
+                "n_failed": len(failed),
+                "n_workers": n_workers,
+                "elapsed_seconds": round(elapsed, 4),
+                "binning_seconds": round(sum(g["binning_seconds"] for g in groups), 4),
+                "best": best,
+                "candidates": ranked + failed,
+            }
+        except Exception as e:
+            logger.error(f"❌ Scorecard search failed: {e}")
+            raise AppException(e, sys)
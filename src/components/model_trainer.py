@@ -1,12 +1,27 @@
 # src/components/model_trainer.py
 
 import sys
+import copy
+import time
 from pathlib import Path
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
 from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold
 from optbinning import Scorecard
 from src.exception import AppException
 from src.logger import logger
-from src.utils.file_ops import load_joblib, save_joblib
+from src.utils.file_ops import load_joblib, load_split, save_joblib, save_json
+from src.utils.metrics import binary_classification_metrics
+from src.utils.woe_cache import WoeCache, binning_params_of, hash_data
+from src.utils.outlier_caps import apply_caps, caps_path_for, load_caps, save_model_caps
+from src.utils.incremental_binning import (
+    n_binned_records, prefitted, refresh_binning_process, refresh_logistic_coefficients
+)
+from src.utils.psi_baseline import baseline_path_for, compute_psi_baseline, load_psi_baseline, save_psi_baseline
+from src.utils.scorecard_compiler import compile_scorecard
+from src.components.model_search import ScorecardSearch
 from src.entity.config_entity import ModelTrainerConfig
 from src.entity.artifacts_entity import DataTransformationArtifact, ModelTrainerArtifact
 
@@ -22,17 +37,267 @@ class ModelTrainer:
         except Exception as e:
             raise AppException(e, sys)
 
+    def run_search(self, binning_process, X_train, y_train, model_dir: Path) -> dict:
+        """
+        Run the configured scorecard search on train/test and save the ranked
+        results next to the model.
+
+        Returns:
+            dict: Search results (see ScorecardSearch.run), including the results path.
+        """
+        try:
+            split_format = self.trans_artifact.split_format
+            X_test = load_split(self.trans_artifact.X_test_path, split_format,
+                                columns=binning_process.variable_names)
+            y_test = load_split(self.trans_artifact.y_test_path, split_format)
+
+            search = ScorecardSearch(self.cfg.search, self.cfg.estimator_params)
+            results = search.run(binning_process, X_train, y_train, X_test, y_test)
+
+            results_path = model_dir / self.cfg.search.get("results_file", "search_results.json")
+            save_json(results_path, results)
+            logger.info(f"🧾 Search results saved to {results_path}")
+            return {**results, "results_path": str(results_path)}
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def cross_validate(self, binning_process, estimator_params: dict, X_train, y_train, model_dir: Path) -> dict:
+        """
+        Stratified k-fold CV of the scorecard on the train split.
+
+        Each fold's BinningProcess is fitted on the fold's training part and
+        its WoE train/validation matrices are stored in the WoE cache, keyed
+        by fold, data hash and binning params. Re-running CV on the same data
+        and binning options with another estimator or scaling loads them and
+        only refits the LogisticRegression (scaling maps probabilities to
+        points, so the metrics are those of the scorecard).
+
+        Returns:
+            dict: Per-fold and mean/std validation metrics, cache hits/misses,
+            and the results path.
+        """
+        try:
+            cv_cfg = self.cfg.cv
+            n_splits = cv_cfg.get("n_splits", 5)
+            random_state = cv_cfg.get("random_state", 42)
+            cache = WoeCache(cv_cfg.get("cache_dir", str(model_dir / "woe_cache")))
+
+            start = time.perf_counter()
+            data_hash = hash_data(X_train, y_train)
+            binning_params = binning_params_of(binning_process)
+            y = np.asarray(y_train)
+            splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+            folds = []
+            for fold, (train_idx, valid_idx) in enumerate(splitter.split(X_train, y)):
+                key = WoeCache.make_key(
+                    {"fold": fold, "n_splits": n_splits, "random_state": random_state}, data_hash, binning_params
+                )
+                cached = cache.get(key)
+                if cached is not None:
+                    woe_train, woe_valid, _ = cached
+                else:
+                    fold_start = time.perf_counter()
+                    bp = clone(binning_process).fit(X_train.iloc[train_idx], y[train_idx])
+                    woe_train = bp.transform(X_train.iloc[train_idx], metric="woe").to_numpy(dtype=np.float64)
+                    woe_valid = bp.transform(X_train.iloc[valid_idx], metric="woe").to_numpy(dtype=np.float64)
+                    cache.put(key, woe_train, woe_valid, {
+                        "fold": fold,
+                        "n_splits": n_splits,
+                        "data_hash": data_hash,
+                        "binning_params": binning_params,
+                        "binning_seconds": time.perf_counter() - fold_start,
+                    })
+
+                estimator = LogisticRegression(**estimator_params).fit(woe_train, y[train_idx])
+                proba = estimator.predict_proba(woe_valid)[:, 1]
+                metrics = binary_classification_metrics(y[valid_idx], proba)
+                folds.append({
+                    "fold": fold,
+                    "cached": cached is not None,
+                    **{k: metrics[k] for k in ("auc", "gini", "ks", "brier")},
+                })
+                logger.info(
+                    f"🔁 Fold {fold + 1}/{n_splits} ({'cached WoE' if cached is not None else 'binned'}) — "
+                    f"Gini: {folds[-1]['gini']:.4f}, KS: {folds[-1]['ks']:.4f}"
+                )
+
+            summary = {}
+            for metric in ("auc", "gini", "ks", "brier"):
+                values = np.array([f[metric] for f in folds])
+                summary[f"{metric}_mean"] = float(values.mean())
+                summary[f"{metric}_std"] = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+
+            results = {
+                "n_splits": n_splits,
+                "random_state": random_state,
+                "data_hash": data_hash,
+                "estimator_params": estimator_params,
+                "cache_hits": cache.hits,
+                "cache_misses": cache.misses,
+                "elapsed_seconds": round(time.perf_counter() - start, 4),
+                **summary,
+                "folds": folds,
+            }
+            results_path = model_dir / cv_cfg.get("results_file", "cv_results.json")
+            save_json(results_path, results)
+            logger.info(
+                f"📈 {n_splits}-fold CV — Gini: {summary['gini_mean']:.4f} ± {summary['gini_std']:.4f}, "
+                f"KS: {summary['ks_mean']:.4f} ± {summary['ks_std']:.4f} "
+                f"(WoE cache: {cache.hits} hit(s), {cache.misses} miss(es); {results['elapsed_seconds']:.2f}s)"
+            )
+            return {**results, "results_path": str(results_path)}
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def refresh_model(self, model_dir: Path) -> ModelTrainerArtifact:
+        """
+        Refresh an existing scorecard with a new batch of performance data
+        instead of refitting on the full history.
+
+        The base model's bin boundaries are kept: the delta is binned with
+        them, its per-bin event/non-event counts are added to the stored ones
+        and WoE follows from the updated counts. The LogisticRegression is
+        then updated from the delta's WoE matrix with a quadratic penalty
+        toward the base coefficients standing in for the base training rows
+        (``refresh_logistic_coefficients``): with ``refresh.base_weight: 1``
+        this approximates a refit on base plus delta, with 0 it is a fit on
+        the delta alone. The points table is rebuilt, and the base model's
+        PSI baseline keeps its breakpoints and gains the delta's scores. All
+        work is proportional to the delta (plus O(bins) per variable).
+
+        Returns:
+            ModelTrainerArtifact: Refreshed model, refresh report and PSI baseline paths.
+        """
+        try:
+            refresh_cfg = self.cfg.refresh
+            base_model_path = refresh_cfg["base_model_path"]
+            start = time.perf_counter()
+
+            base = load_joblib(base_model_path)
+            binning_process = copy.deepcopy(base.binning_process_)
+
+            # Delta rows get the base model's preprocessing (its outlier caps)
+            df = pd.read_csv(refresh_cfg["delta_data_path"])
+            X_delta = df[binning_process.variable_names].copy()
+            y_delta = df[refresh_cfg["target_column"]]
+            caps = load_caps(caps_path_for(base_model_path))
+            if caps is not None:
+                apply_caps(X_delta, caps)
+            logger.info(f"📥 Refresh delta: {len(X_delta):,} rows ({int(y_delta.sum()):,} events)")
+
+            n_base = n_binned_records(binning_process)
+            woe_shift = refresh_binning_process(binning_process, X_delta, y_delta)
+
+            # Base coefficients updated with the delta, the base rows weighted by base_weight
+            base_weight = float(refresh_cfg.get("base_weight", 1.0))
+            estimator = copy.deepcopy(base.estimator_)
+            coef_before = estimator.coef_.ravel().copy()
+            selected = list(binning_process.get_support(names=True))
+            woe = binning_process.transform(X_delta, metric="woe")[selected].to_numpy(dtype=np.float64)
+            n_iter = refresh_logistic_coefficients(estimator, woe, y_delta, n_base, base_weight)
+            scorecard = Scorecard(
+                binning_process=binning_process,
+                estimator=estimator,
+                scaling_method=self.cfg.scaling_method,
+                scaling_method_params=self.cfg.scaling_method_params,
+                intercept_based=True
+            )
+            with prefitted(binning_process, estimator, fit_estimator=False):
+                scorecard.fit(X_delta, y_delta)
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"✅ Scorecard refreshed in {elapsed:.2f}s: {n_base:,} base record(s) (weight {base_weight:g}) "
+                f"+ {len(X_delta):,} delta record(s), {n_iter} Newton iteration(s)."
+            )
+
+            model_path = model_dir / self.cfg.model_file_name
+            save_joblib(model_path, scorecard)
+            logger.info(f"💾 Refreshed model saved at: {model_path}")
+            caps_path = save_model_caps(model_path, caps)  # The base caps the delta was clipped with
+
+            # Base training histograms plus the delta, scored by the refreshed model
+            proba, score = compile_scorecard(scorecard).predict(X_delta)
+            baseline = load_psi_baseline(baseline_path_for(base_model_path))
+            if baseline is None:
+                logger.warning(f"⚠️ No PSI baseline next to {base_model_path}; the refreshed baseline covers the delta only.")
+                baseline = compute_psi_baseline({"proba": proba, "score": score}, self.cfg.psi_buckets)
+            else:
+                baseline["proba"].update(proba)
+                baseline["score"].update(score)
+            baseline_path = baseline_path_for(model_path)
+            save_psi_baseline(baseline_path, baseline)
+            logger.info(f"📊 PSI baseline saved at: {baseline_path}")
+
+            report = {
+                "base_model_path": str(base_model_path),
+                "delta_data_path": str(refresh_cfg["delta_data_path"]),
+                "delta_rows": int(len(X_delta)),
+                "delta_events": int(y_delta.sum()),
+                "base_records": n_base,
+                "base_weight": base_weight,
+                "coefficient_update": "delta fit penalized toward the base coefficients "
+                                      "(second-order stand-in for the base records)",
+                "outlier_caps_applied": caps is not None,
+                "psi_baseline_rows": baseline["proba"].n,
+                "elapsed_seconds": round(elapsed, 4),
+                "estimator_n_iter": n_iter,  # Newton iterations of the coefficient update
+                "max_abs_woe_shift": woe_shift,
+                "coefficients": {
+                    name: {"before": float(before), "after": float(after)}
+                    for name, before, after in zip(selected, coef_before, estimator.coef_.ravel())
+                },
+            }
+            report_path = model_dir / refresh_cfg.get("report_file", "refresh_report.json")
+            save_json(report_path, report)
+            logger.info(f"🧾 Refresh report saved to {report_path}")
+
+            return ModelTrainerArtifact(
+                trained_model_path=str(model_path),
+                estimator_params=base.estimator_.get_params(),
+                refresh_report_path=str(report_path),
+                psi_baseline_path=str(baseline_path),
+                outlier_caps_path=str(caps_path) if caps_path else None
+            )
+        except Exception as e:
+            raise AppException(e, sys)
+
     def initiate_model_trainer(self) -> ModelTrainerArtifact:
         try:
+            model_dir = Path(self.cfg.trained_model_dir)
+            model_dir.mkdir(parents=True, exist_ok=True)
+
+            # Refresh mode: update the base model from the delta only
+            if self.cfg.refresh and self.cfg.refresh.get("enabled"):
+                return self.refresh_model(model_dir)
+
             # Load train data and binning object
-            X_train = load_joblib(self.trans_artifact.X_train_path)
-            y_train = load_joblib(self.trans_artifact.y_train_path)
             binning_process = load_joblib(self.trans_artifact.binning_object_path)
+            split_format = self.trans_artifact.split_format
+            X_train = load_split(self.trans_artifact.X_train_path, split_format,
+                                 columns=binning_process.variable_names)
+            y_train = load_split(self.trans_artifact.y_train_path, split_format)
+
+            # Search mode: the best candidate's options replace params.yaml's
+            estimator_params, search_results_path = self.cfg.estimator_params, None
+            if self.cfg.search and self.cfg.search.get("enabled"):
+                results = self.run_search(binning_process, X_train, y_train, model_dir)
+                best = results["best"]
+                estimator_params = best["estimator_params"]
+                binning_process = clone(binning_process).set_params(**best["binning_params"])
+                search_results_path = results["results_path"]
+
+            # CV mode: k-fold estimate of the chosen configuration before the final fit
+            cv_results_path = None
+            if self.cfg.cv and self.cfg.cv.get("enabled"):
+                cv_results_path = self.cross_validate(
+                    binning_process, estimator_params, X_train, y_train, model_dir
+                )["results_path"]
 
             # Initialize Scorecard with unfitted estimator
             scorecard = Scorecard(
                 binning_process=binning_process,
-                estimator=LogisticRegression(**self.cfg.estimator_params),
+                estimator=LogisticRegression(**estimator_params),
                 scaling_method=self.cfg.scaling_method,
                 scaling_method_params=self.cfg.scaling_method_params,
                 intercept_based=True
@@ -43,13 +308,26 @@ class ModelTrainer:
             logger.info("✅ Scorecard model trained.")
 
             # Save model artifact
-            model_dir = Path(self.cfg.trained_model_dir)
-            model_dir.mkdir(parents=True, exist_ok=True)
             model_path = model_dir / self.cfg.model_file_name
             save_joblib(model_path, scorecard)
             logger.info(f"💾 Model saved at: {model_path}")
+            caps_path = save_model_caps(model_path, load_caps(self.trans_artifact.outlier_caps_path)
+                                        if self.trans_artifact.outlier_caps_path else None)
+
+            # Training score distributions with frozen PSI breakpoints, saved next to the model
+            proba, score = compile_scorecard(scorecard).predict(X_train)
+            baseline_path = baseline_path_for(model_path)
+            save_psi_baseline(baseline_path, compute_psi_baseline({"proba": proba, "score": score}, self.cfg.psi_buckets))
+            logger.info(f"📊 PSI baseline ({self.cfg.psi_buckets} buckets) saved at: {baseline_path}")
 
-            return ModelTrainerArtifact(trained_model_path=str(model_path))
+            return ModelTrainerArtifact(
+                trained_model_path=str(model_path),
+                estimator_params=estimator_params,
+                search_results_path=search_results_path,
+                cv_results_path=cv_results_path,
+                psi_baseline_path=str(baseline_path),
+                outlier_caps_path=str(caps_path) if caps_path else None
+            )
             
         except Exception as e:
             logger.error(f"❌ Model training failed: {e}")
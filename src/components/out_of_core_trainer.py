@@ -0,0 +1,228 @@
+# src/components/out_of_core_trainer.py
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import SGDClassifier
+from optbinning import BinningProcessSketch, Scorecard
+from src.exception import AppException
+from src.logger import logger
+from src.utils.file_ops import save_joblib, save_json
+from src.utils.metrics import PSIAccumulator, StreamingBinaryMetrics
+from src.utils.typed_csv import iter_csv_typed
+from src.utils.outlier_caps import save_model_caps
+from src.utils.psi_baseline import baseline_path_for, compute_psi_baseline, save_psi_baseline
+from src.utils.scorecard_compiler import compile_scorecard
+from src.utils.incremental_binning import binning_process_from_sketch, prefitted
+from src.entity.config_entity import DataLoadingConfig, ModelTrainerConfig, OutOfCoreConfig
+from src.entity.artifacts_entity import ModelTrainerArtifact
+
+
+class OutOfCoreTrainer:
+    """
+    Trains the scorecard on data larger than memory, one chunk at a time.
+
+    Every pass streams the ingested CSV in ``chunk_size`` rows; each row is
+    assigned to train or holdout by a seeded draw that is replayed
+    identically on every pass. Peak memory is bounded by the chunk size:
+
+    1. Binning: train rows are added to a BinningProcessSketch, solved once.
+    2. Estimator: ``n_epochs`` passes of SGD (log loss) ``partial_fit`` on
+       the WoE-transformed train rows.
+    3. Scorecard: points table built from the solved bins and SGD coefficients.
+    4. Evaluation: holdout metrics from streaming histograms, and the PSI
+       baseline of the train scores.
+
+    Inputs are not outlier-capped (caps need quantiles of the whole train
+    split), so the model is recorded and pushed without caps and serving
+    scores raw inputs, as the model saw them.
+    """
+
+    def __init__(
+        self,
+        config: OutOfCoreConfig,
+        trainer_cfg: ModelTrainerConfig,
+        data_csv: str,
+        loading_config: DataLoadingConfig,
+    ):
+        try:
+            self.config = config
+            self.trainer_cfg = trainer_cfg
+            self.data_csv = Path(data_csv)
+            self.loading_config = loading_config
+            self.artifact_dir = Path(self.config.artifact_dir)
+            self.artifact_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"✅ OutOfCoreTrainer initialized. Input CSV: {self.data_csv}, chunk size: {config.chunk_size:,}")
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def iter_chunks(self, holdout: bool = False) -> Iterator[Tuple[pd.DataFrame, np.ndarray]]:
+        """
+        Stream (X, y) of the train rows (or the holdout rows) chunk by chunk.
+        The row assignment only depends on ``random_state`` and the chunk
+        size, so every pass sees the same split.
+        """
+        rng = np.random.default_rng(self.config.random_state)
+        loading = self.loading_config
+        for chunk in iter_csv_typed(self.data_csv, loading.schema_columns, chunk_size=self.config.chunk_size,
+                                    categorical=loading.categorical_dtypes, downcast=loading.downcast_numerics):
+            in_holdout = rng.random(len(chunk)) < self.config.holdout_fraction
+            rows = chunk[in_holdout if holdout else ~in_holdout]
+            if len(rows):
+                yield rows.drop(columns=self.config.target_column), rows[self.config.target_column].to_numpy()
+
+    def fit_binning(self):
+        """
+        Pass 1: feed the train rows to a BinningProcessSketch and solve it.
+
+        Returns:
+            BinningProcess: Fitted equivalent of the solved sketch.
+        """
+        try:
+            start = time.perf_counter()
+            sketch, n_rows = None, 0
+            for X, y in self.iter_chunks():
+                if sketch is None:
+                    sketch = BinningProcessSketch(
+                        variable_names=X.columns.tolist(),
+                        categorical_variables=X.select_dtypes(exclude="number").columns.tolist(),
+                        binning_fit_params={
+                            name: dict(self.config.sketch_params) for name in X.columns
+                        } if self.config.sketch_params else None
+                    )
+                sketch.add(X, y)
+                n_rows += len(X)
+            if sketch is None:
+                raise ValueError(f"No training rows found in {self.data_csv}")
+            sketch.solve()
+            binning_process = binning_process_from_sketch(sketch)
+            logger.info(f"📊 Sketch binning solved over {n_rows:,} rows in {time.perf_counter() - start:.2f}s")
+            return binning_process
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def fit_estimator(self, binning_process) -> SGDClassifier:
+        """
+        Pass 2..n: SGD on the WoE-transformed train rows, ``n_epochs`` passes
+        (rows shuffled within each chunk).
+        """
+        try:
+            variables = list(binning_process.get_support(names=True))
+            estimator = SGDClassifier(**{"loss": "log_loss", **self.config.sgd_params})
+            classes = np.array([0, 1])
+            rng = np.random.default_rng(self.config.random_state)
+            for epoch in range(self.config.n_epochs):
+                start = time.perf_counter()
+                for X, y in self.iter_chunks():
+                    woe = binning_process.transform(X, metric="woe")[variables].to_numpy(dtype=np.float64)
+                    order = rng.permutation(len(y))
+                    estimator.partial_fit(woe[order], y[order], classes=classes)
+                logger.info(f"🔁 SGD epoch {epoch + 1}/{self.config.n_epochs} done in {time.perf_counter() - start:.2f}s")
+            return estimator
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def build_scorecard(self, binning_process, estimator: SGDClassifier) -> Scorecard:
+        """
+        Scorecard whose points come from the sketch bins and the SGD
+        coefficients; its fit only builds the points table (one chunk is
+        passed to satisfy Scorecard's input checks).
+        """
+        try:
+            scorecard = Scorecard(
+                binning_process=binning_process,
+                estimator=estimator,
+                scaling_method=self.trainer_cfg.scaling_method,
+                scaling_method_params=self.trainer_cfg.scaling_method_params,
+                intercept_based=True
+            )
+            X, y = next(self.iter_chunks())
+            with prefitted(binning_process, estimator, fit_estimator=False):
+                scorecard.fit(X, y)
+            return scorecard
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def evaluate(self, scorecard: Scorecard) -> Tuple[dict, Dict[str, PSIAccumulator]]:
+        """
+        Final pass: streaming train and holdout metrics of the scorecard, and
+        the PSI baseline of its train scores. The baseline's breakpoints are
+        the quantiles of the first train chunk (memory stays bounded); every
+        train chunk is then counted into them.
+
+        Returns:
+            tuple: (metrics per split, {"proba": ..., "score": ...} accumulators).
+        """
+        try:
+            compiled = compile_scorecard(scorecard)
+            results, baseline = {}, None
+            for name, holdout in (("train", False), ("holdout", True)):
+                metrics = StreamingBinaryMetrics(self.config.histogram_bins)
+                for X, y in self.iter_chunks(holdout=holdout):
+                    proba, score = compiled.predict(X)
+                    metrics.update(y, proba)
+                    if holdout:
+                        continue
+                    if baseline is None:
+                        baseline = compute_psi_baseline({"proba": proba, "score": score}, self.trainer_cfg.psi_buckets)
+                    else:
+                        baseline["proba"].update(proba)
+                        baseline["score"].update(score)
+                if metrics.pos.sum() and metrics.neg.sum():
+                    results[name] = metrics.result()
+                    logger.info(
+                        f"{name.capitalize()} — AUC: {results[name]['auc']:.3f}, GINI: {results[name]['gini']:.3f}, "
+                        f"KS: {results[name]['ks']:.3f}, Brier: {results[name]['brier']:.3f}"
+                    )
+            return results, baseline
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def initiate_training(self) -> ModelTrainerArtifact:
+        try:
+            start = time.perf_counter()
+            binning_process = self.fit_binning()
+            binning_path = self.artifact_dir / self.config.binning_object_file
+            save_joblib(binning_path, binning_process)
+
+            estimator = self.fit_estimator(binning_process)
+            scorecard = self.build_scorecard(binning_process, estimator)
+            logger.info("✅ Out-of-core scorecard model trained.")
+
+            model_dir = Path(self.trainer_cfg.trained_model_dir)
+            model_dir.mkdir(parents=True, exist_ok=True)
+            model_path = model_dir / self.trainer_cfg.model_file_name
+            save_joblib(model_path, scorecard)
+            logger.info(f"💾 Model saved at: {model_path}")
+            save_model_caps(model_path, None)  # Trained on raw inputs: no earlier run's caps may ship with it
+
+            metrics, baseline = self.evaluate(scorecard)
+            baseline_path = baseline_path_for(model_path)
+            save_psi_baseline(baseline_path, baseline)
+            logger.info(f"📊 PSI baseline ({self.trainer_cfg.psi_buckets} buckets) saved at: {baseline_path}")
+
+            report_path = self.artifact_dir / self.config.report_file
+            save_json(report_path, {
+                "data_file": str(self.data_csv),
+                "chunk_size": self.config.chunk_size,
+                "holdout_fraction": self.config.holdout_fraction,
+                "n_epochs": self.config.n_epochs,
+                "sgd_params": self.config.sgd_params,
+                "elapsed_seconds": round(time.perf_counter() - start, 4),
+                "binning_object_path": str(binning_path),
+                "metrics": metrics,
+            })
+            logger.info(f"🧾 Out-of-core training report saved to {report_path}")
+
+            return ModelTrainerArtifact(
+                trained_model_path=str(model_path),
+                estimator_params={"loss": "log_loss", **self.config.sgd_params},
+                psi_baseline_path=str(baseline_path),
+                outlier_caps_path=None
+            )
+        except Exception as e:
+            logger.error(f"❌ Out-of-core training failed: {e}")
+            raise AppException(e, sys)
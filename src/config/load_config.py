@@ -1,20 +1,23 @@
 # src/config/load_config.py
 
-from pyprojroot import here
-from src.utils.file_ops import read_yaml
+from src.utils.file_ops import project_root, read_yaml
 from src.entity.config_entity import (
     DataIngestionConfig,
     DataValidationConfig,
+    DataLoadingConfig,
+    OutOfCoreConfig,
     DataTransformationConfig,
     ModelTrainerConfig,
     ModelEvaluationConfig,
-    ModelPusherConfig
+    ModelPusherConfig,
+    ModelServingConfig,
+    DriftMonitoringConfig
 )
 
 
 class LoadConfig:
     def __init__(self, config_file: str = "config/config.yaml"):
-        config_path = here() / config_file
+        config_path = project_root() / config_file
         self.config = read_yaml(config_path)
 
     def get_data_ingestion_config(self) -> DataIngestionConfig:
@@ -30,26 +33,45 @@ class LoadConfig:
         validation_cfg = self.config["data_validation"]
 
         # Resolve schema path relative to project root
-        schema_path = here() / validation_cfg["schema_file_path"]
+        schema_path = project_root() / validation_cfg["schema_file_path"]
         schema = read_yaml(schema_path)
 
         return DataValidationConfig(
             schema_file_path=schema_path,
             validation_artifact_dir=validation_cfg["validation_artifact_dir"],
             validation_report_file=validation_cfg["validation_report_file"],
-            schema=schema
+            schema=schema,
+            profile_file=validation_cfg["profile_file"],
+            chunk_size=validation_cfg["chunk_size"],
+            quantile_sample_size=validation_cfg["quantile_sample_size"],
+            max_tracked_categories=validation_cfg["max_tracked_categories"]
+        )
+
+    def get_data_loading_config(self) -> DataLoadingConfig:
+        dl = self.config["data_loading"]
+        schema = read_yaml(project_root() / self.config["data_validation"]["schema_file_path"])
+
+        return DataLoadingConfig(
+            schema_columns=schema["columns"],
+            csv_engine=dl["csv_engine"],
+            categorical_dtypes=dl["categorical_dtypes"],
+            downcast_numerics=dl["downcast_numerics"]
         )
 
     def get_data_transformation_config(self) -> DataTransformationConfig:
         dt = self.config["data_transformation"]
 
         # Get absolute path for transformed data directory
-        trans_dir = here() / dt["transformed_data_dir"]
+        trans_dir = project_root() / dt["transformed_data_dir"]
 
         return DataTransformationConfig(
             transformed_data_dir=str(trans_dir),
             transformed_data_file_name=dt["transformed_data_file_name"],
             binning_object_file=dt["binning_object_file"],
+            outlier_caps_file=dt["outlier_caps_file"],
+            binning_n_jobs=dt["binning_n_jobs"],
+            binning_parallel_backend=dt["binning_parallel_backend"],
+            transformation_report_file=dt["transformation_report_file"],
             target_column=dt["target_column"],
             test_size=dt["test_size"],
             oot_size=dt["oot_size"],
@@ -60,11 +82,12 @@ class LoadConfig:
             y_train_path=str(trans_dir / dt["y_train_file"]),
             y_test_path=str(trans_dir / dt["y_test_file"]),
             y_oot_path=str(trans_dir / dt["y_oot_file"]),
+            split_format=dt["split_format"],
         )
 
     def get_model_trainer_config(self) -> ModelTrainerConfig:
         mt = self.config["model_trainer"]
-        params = read_yaml(here() / "params.yaml")
+        params = read_yaml(project_root() / "params.yaml")
         trainer_params = params["model_trainer"]
 
         return ModelTrainerConfig(
@@ -75,18 +98,85 @@ class LoadConfig:
             scaling_method_params=trainer_params["scaling_method_params"],
             mlflow_tracking_uri=mt["mlflow_tracking_uri"],
             experiment_name=mt["experiment_name"],
-            run_name=mt["run_name"]
+            run_name=mt["run_name"],
+            psi_buckets=mt["psi_buckets"],
+            search=trainer_params.get("search"),
+            cv=trainer_params.get("cv"),
+            refresh=trainer_params.get("refresh")
         )
     
+    def get_out_of_core_config(self) -> OutOfCoreConfig:
+        oc = self.config["out_of_core"]
+        return OutOfCoreConfig(
+            artifact_dir=oc["artifact_dir"],
+            binning_object_file=oc["binning_object_file"],
+            report_file=oc["report_file"],
+            target_column=oc["target_column"],
+            chunk_size=oc["chunk_size"],
+            holdout_fraction=oc["holdout_fraction"],
+            random_state=oc["random_state"],
+            n_epochs=oc["n_epochs"],
+            sgd_params=oc["sgd_params"] or {},
+            sketch_params=oc["sketch_params"] or {},
+            histogram_bins=oc["histogram_bins"]
+        )
+
     def get_model_evaluation_config(self) -> ModelEvaluationConfig:
         me = self.config["model_evaluation"]
+        params = read_yaml(project_root() / "params.yaml")
+        eval_params = params.get("model_evaluation") or {}
+
         return ModelEvaluationConfig(
             evaluation_artifact_dir=me["evaluation_artifact_dir"],
-            metrics_file_name=me["metrics_file_name"]
+            metrics_file_name=me["metrics_file_name"],
+            score_store_dir=me["score_store_dir"],
+            csi_file_name=me["csi_file_name"],
+            bootstrap=eval_params.get("bootstrap")
         )
 
     def get_model_pusher_config(self) -> ModelPusherConfig:
         mp = self.config["model_pusher"]
         return ModelPusherConfig(
-            export_dir=mp["export_dir"]
+            export_dir=mp["export_dir"],
+            versions_dir=mp["versions_dir"]
+        )
+
+    def get_model_serving_config(self) -> ModelServingConfig:
+        ms = self.config["model_serving"]
+        return ModelServingConfig(
+            registry_max_models=ms["registry_max_models"],
+            registry_max_memory_mb=ms["registry_max_memory_mb"],
+            batch_max_records=ms["batch_max_records"],
+            engine=ms["engine"],
+            fused_prediction=ms["fused_prediction"],
+            single_record_fast_path=ms["single_record_fast_path"],
+            micro_batching=ms["micro_batching"],
+            micro_batch_max_size=ms["micro_batch_max_size"],
+            micro_batch_max_wait_ms=ms["micro_batch_max_wait_ms"],
+            worker_pool_kind=ms["worker_pool_kind"],
+            worker_pool_size=ms["worker_pool_size"],
+            max_in_flight=ms["max_in_flight"],
+            overload_status_code=ms["overload_status_code"],
+            warmup_in_background=ms["warmup_in_background"],
+            prediction_cache=ms["prediction_cache"],
+            prediction_cache_max_size=ms["prediction_cache_max_size"],
+            prediction_cache_ttl_seconds=ms["prediction_cache_ttl_seconds"],
+            prediction_log=ms["prediction_log"],
+            prediction_log_path=ms["prediction_log_path"]
+        )
+
+    def get_drift_monitoring_config(self) -> DriftMonitoringConfig:
+        dm = self.config["drift_monitoring"]
+        return DriftMonitoringConfig(
+            prediction_log_path=self.config["model_serving"]["prediction_log_path"],
+            artifact_dir=dm["artifact_dir"],
+            state_file=dm["state_file"],
+            report_file=dm["report_file"],
+            alerts_file=dm["alerts_file"],
+            chunk_bytes=dm["chunk_bytes"],
+            rolling_hours=dm["rolling_hours"],
+            retention_days=dm["retention_days"],
+            min_records=dm["min_records"],
+            psi_threshold=dm["psi_threshold"],
+            csi_threshold=dm["csi_threshold"]
         )
\ No newline at end of file
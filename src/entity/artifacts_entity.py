@@ -9,6 +9,7 @@ class DataIngestionArtifact:
 class DataValidationArtifact:
     validation_status: bool
     validation_report_file_path: str
+    profile_file_path: str = None
 
 @dataclass
 class DataTransformationArtifact:
@@ -20,11 +21,20 @@ class DataTransformationArtifact:
     y_train_path: str
     y_test_path: str
     y_oot_path: str
+    transformation_report_path: str = None
+    split_format: str = "joblib"
+    outlier_caps_path: str = None
 
 
 @dataclass
 class ModelTrainerArtifact:
     trained_model_path: str
+    estimator_params: dict = None       # Params the final estimator was fitted with
+    search_results_path: str = None     # Ranked search candidates (search mode only)
+    cv_results_path: str = None         # k-fold CV metrics (CV mode only)
+    refresh_report_path: str = None     # Count/WoE/coefficient changes (refresh mode only)
+    psi_baseline_path: str = None       # Frozen-breakpoint training score histograms
+    outlier_caps_path: str = None       # Caps the training inputs were clipped with (pushed with the model)
     # roc_auc: float = None
     # gini: float = None
     # pr_auc: float = None
@@ -34,8 +44,21 @@ class ModelTrainerArtifact:
 @dataclass
 class ModelEvaluationArtifact:
     evaluation_metrics_path: str
+    score_vector_paths: dict = None  # Split -> ScoreStore entry dir (float64 proba.npy, float32 score.npy)
+    csi_table_path: str = None       # Feature x split CSI against the training bins
 
 
 @dataclass
 class ModelPusherArtifact:
-    pushed_model_path: str
\ No newline at end of file
+    pushed_model_path: str
+    model_version: str = None
+    outlier_caps_path: str = None
+    psi_baseline_path: str = None
+
+
+@dataclass
+class DriftMonitoringArtifact:
+    report_path: str
+    alerts_path: str
+    n_new_records: int = 0
+    n_alerts: int = 0
@@ -14,12 +14,27 @@ class DataValidationConfig:
     validation_artifact_dir: str
     validation_report_file: str
     schema: dict
+    profile_file: str = "profile.json"
+    chunk_size: int = 100_000
+    quantile_sample_size: int = 10_000
+    max_tracked_categories: int = 1_000
+
+@dataclass
+class DataLoadingConfig:
+    schema_columns: dict
+    csv_engine: str
+    categorical_dtypes: bool
+    downcast_numerics: bool
 
 @dataclass
 class DataTransformationConfig:
     transformed_data_dir: str
     transformed_data_file_name: str
     binning_object_file: str
+    outlier_caps_file: str
+    binning_n_jobs: int
+    binning_parallel_backend: str
+    transformation_report_file: str
     target_column: str
     test_size: float
     oot_size: float
@@ -30,6 +45,7 @@ class DataTransformationConfig:
     y_train_path: str
     y_test_path: str
     y_oot_path: str
+    split_format: str
 
 @dataclass
 class ModelTrainerConfig:
@@ -41,12 +57,70 @@ class ModelTrainerConfig:
     mlflow_tracking_uri: str
     experiment_name: str
     run_name: str
+    psi_buckets: int = 10
+    search: dict = None
+    cv: dict = None
+    refresh: dict = None
+
+@dataclass
+class OutOfCoreConfig:
+    artifact_dir: str
+    binning_object_file: str
+    report_file: str
+    target_column: str
+    chunk_size: int
+    holdout_fraction: float
+    random_state: int
+    n_epochs: int
+    sgd_params: dict
+    sketch_params: dict
+    histogram_bins: int
 
 @dataclass
 class ModelEvaluationConfig:
     evaluation_artifact_dir: str
     metrics_file_name: str
+    score_store_dir: str
+    csi_file_name: str
+    bootstrap: dict = None
 
 @dataclass
 class ModelPusherConfig:
     export_dir: str
+    versions_dir: str
+
+@dataclass
+class ModelServingConfig:
+    registry_max_models: int
+    registry_max_memory_mb: float
+    batch_max_records: int
+    engine: str
+    fused_prediction: bool
+    single_record_fast_path: bool
+    micro_batching: bool
+    micro_batch_max_size: int
+    micro_batch_max_wait_ms: float
+    worker_pool_kind: str
+    worker_pool_size: int
+    max_in_flight: int
+    overload_status_code: int
+    warmup_in_background: bool
+    prediction_cache: bool
+    prediction_cache_max_size: int
+    prediction_cache_ttl_seconds: float
+    prediction_log: bool = False
+    prediction_log_path: str = None
+
+@dataclass
+class DriftMonitoringConfig:
+    prediction_log_path: str
+    artifact_dir: str
+    state_file: str
+    report_file: str
+    alerts_file: str
+    chunk_bytes: int
+    rolling_hours: int
+    retention_days: int
+    min_records: int
+    psi_threshold: float
+    csi_threshold: float
@@ -41,7 +41,7 @@ def setup_logger(name: str = "appLogger") -> logging.Logger:
     # Avoid adding multiple handlers if logger already has them
     if not logger.handlers:
         # File handler
-        file_handler = logging.FileHandler(LOG_PATH)
+        file_handler = logging.FileHandler(LOG_PATH, delay=True)  # File is only created on the first record
         file_handler.setFormatter(logging.Formatter(LOG_FORMAT)) # Set the custom logging format defined above
 
 
@@ -13,6 +13,7 @@ class DataTransformationPipeline:
     def __init__(self):
         self.cfg = LoadConfig()
         self.transformation_config = self.cfg.get_data_transformation_config()
+        self.loading_config = self.cfg.get_data_loading_config()
 
     def run(self) -> DataTransformationArtifact:
         try:
@@ -20,7 +21,9 @@ class DataTransformationPipeline:
             ingestion_dict = load_json("artifacts/data_ingestion/ingestion_artifact.json")
             ingestion_artifact = DataIngestionArtifact(**ingestion_dict)
 
-            transformer = DataTransformation(self.transformation_config, ingestion_artifact.data_csv_file_path)
+            transformer = DataTransformation(
+                self.transformation_config, ingestion_artifact.data_csv_file_path, self.loading_config
+            )
             transformation_artifact = transformer.initiate_data_transformation()
 
             save_json("artifacts/data_transformation/transformation_artifact.json", asdict(transformation_artifact))
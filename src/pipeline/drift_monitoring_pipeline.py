@@ -0,0 +1,47 @@
+# src/pipeline/drift_monitoring_pipeline.py
+
+import sys
+from dataclasses import asdict
+from src.config.load_config import LoadConfig
+from src.components.drift_monitor import DriftMonitor
+from src.utils.file_ops import load_json, save_json
+from src.entity.artifacts_entity import ModelPusherArtifact, DriftMonitoringArtifact
+from src.exception import AppException
+from src.logger import logger
+
+
+class DriftMonitoringPipeline:
+    """
+    Incremental drift check of the logged /predict/ traffic; meant to be run
+    periodically (e.g. from cron), each run only reading new log lines.
+    """
+    def __init__(self):
+        self.cfg = LoadConfig()
+        self.monitoring_config = self.cfg.get_drift_monitoring_config()
+        self.pusher_config = self.cfg.get_model_pusher_config()
+
+    def run(self) -> DriftMonitoringArtifact:
+        try:
+            logger.info("===== 🛰️ Drift Monitoring Started =====")
+            pusher_artifact = ModelPusherArtifact(**load_json(f"{self.pusher_config.export_dir}/model_pusher_artifact.json"))
+
+            monitor = DriftMonitor(self.monitoring_config, pusher_artifact)
+            artifact = monitor.initiate_monitoring()
+
+            save_json(f"{self.monitoring_config.artifact_dir}/drift_monitoring_artifact.json", asdict(artifact))
+            logger.info(f"✅ Drift Monitoring Completed. Report saved at: {artifact.report_path}")
+            return artifact
+        except Exception as e:
+            logger.error(f"❌ Drift Monitoring Pipeline Failed: {e}")
+            raise AppException(e, sys)
+
+def main():
+    try:
+        pipeline = DriftMonitoringPipeline()
+        artifact = pipeline.run()
+        logger.info(f"[main] Drift Monitoring Artifact: {artifact}")
+    except Exception as e:
+        raise AppException(e, sys)
+
+if __name__ == "__main__":
+    main()
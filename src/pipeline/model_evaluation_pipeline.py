@@ -1,6 +1,7 @@
 # src/pipeline/model_evaluation_pipeline.py
 
 import sys
+import pandas as pd
 from src.config.load_config import LoadConfig
 from src.components.model_evaluation import ModelEvaluation
 from src.utils.file_ops import load_json, save_json
@@ -11,7 +12,8 @@ from dataclasses import asdict
 from src.utils.mlflow_ops import (
     setup_mlflow,
     start_mlflow_run,
-    log_metrics
+    log_metrics,
+    log_file_artifact
 )
 
 
@@ -55,6 +57,14 @@ class ModelEvaluationPipeline:
                 # Log PSI separately
                 log_metrics({"psi": metrics_dict["psi"]})
 
+                # Per-feature CSI as metrics plus the table itself
+                csi_table = pd.read_csv(eval_artifact.csi_table_path, index_col="feature")
+                log_metrics({
+                    f"csi_{split}_{feature}": float(value)
+                    for split in csi_table.columns for feature, value in csi_table[split].items()
+                })
+                log_file_artifact(eval_artifact.csi_table_path, artifact_path="evaluation")
+
             return eval_artifact
         except Exception as e:
             logger.error(f"❌ Model Evaluation Pipeline Failed: {e}")
@@ -18,7 +18,6 @@ class ModelPusherPipeline:
         try:
             logger.info("===== 🚀 [Step 6] Model Pusher Started =====")
             trainer_art = ModelTrainerArtifact(**load_json("artifacts/model_trainer/model_artifact.json"))
-
             pusher = ModelPusher(self.pusher_config, trainer_art)
             pusher_artifact = pusher.initiate_model_pusher()
 
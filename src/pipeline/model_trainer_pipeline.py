@@ -10,7 +10,9 @@ from src.entity.artifacts_entity import DataTransformationArtifact, ModelTrainer
 from src.exception import AppException
 from src.logger import logger
 from dataclasses import asdict
-from src.utils.mlflow_ops import setup_mlflow, start_mlflow_run, log_params, log_param, log_model_artifact
+from src.utils.mlflow_ops import (
+    setup_mlflow, start_mlflow_run, log_params, log_param, log_model_artifact, log_search_results, log_metrics
+)
 
 
 class ModelTrainerPipeline:
@@ -38,11 +40,38 @@ class ModelTrainerPipeline:
 
             with start_mlflow_run(run_name=self.trainer_config.run_name) as run:
                 run_id = run.info.run_id  # Capture run_id for reuse
-                log_params(self.trainer_config.estimator_params)
+                log_params(trainer_artifact.estimator_params or self.trainer_config.estimator_params)
                 log_params(self.trainer_config.scaling_method_params)
                 log_param("scaling_method", self.trainer_config.scaling_method)
                 log_model_artifact(trainer_artifact.trained_model_path)
 
+                # Search mode: the whole sweep as nested runs, written in batches
+                if trainer_artifact.search_results_path:
+                    search_results = load_json(trainer_artifact.search_results_path)
+                    log_params({f"binning.{k}": v for k, v in search_results["best"]["binning_params"].items()})
+                    log_search_results(search_results)
+
+                # CV mode: fold-averaged metrics, one batched call
+                if trainer_artifact.cv_results_path:
+                    cv_results = load_json(trainer_artifact.cv_results_path)
+                    log_metrics({
+                        f"cv_{key}": cv_results[key]
+                        for key in cv_results if key.endswith(("_mean", "_std"))
+                    })
+
+                # Refresh mode: what the model was refreshed from and with
+                if trainer_artifact.refresh_report_path:
+                    refresh_report = load_json(trainer_artifact.refresh_report_path)
+                    log_param("refresh_base_model", refresh_report["base_model_path"])
+                    log_param("refresh_delta_data", refresh_report["delta_data_path"])
+                    log_param("refresh_base_weight", refresh_report["base_weight"])
+                    log_metrics({
+                        "refresh_delta_rows": refresh_report["delta_rows"],
+                        "refresh_delta_events": refresh_report["delta_events"],
+                        "refresh_estimator_n_iter": refresh_report["estimator_n_iter"],
+                        "refresh_seconds": refresh_report["elapsed_seconds"],
+                    })
+
                 # Save run_id for reuse
                 save_json("artifacts/model_trainer/mlflow_run.json", {"run_id": run_id})
 
@@ -0,0 +1,74 @@
+# src/pipeline/out_of_core_training_pipeline.py
+
+import sys
+from dataclasses import asdict
+from src.config.load_config import LoadConfig
+from src.components.out_of_core_trainer import OutOfCoreTrainer
+from src.utils.file_ops import load_json, save_json
+from src.entity.artifacts_entity import DataIngestionArtifact, ModelTrainerArtifact
+from src.exception import AppException
+from src.logger import logger
+from src.utils.mlflow_ops import setup_mlflow, start_mlflow_run, log_params, log_param, log_metrics, log_model_artifact
+
+
+class OutOfCoreTrainingPipeline:
+    """
+    Large-data replacement for the transformation + training steps: trains
+    the scorecard straight from the ingested CSV in bounded memory.
+    """
+    def __init__(self):
+        self.cfg = LoadConfig()
+        self.out_of_core_config = self.cfg.get_out_of_core_config()
+        self.trainer_config = self.cfg.get_model_trainer_config()
+        self.loading_config = self.cfg.get_data_loading_config()
+
+    def run(self) -> ModelTrainerArtifact:
+        try:
+            logger.info("===== 🤖 [Step 3-4] Out-of-Core Model Training Started =====")
+            ingestion_artifact = DataIngestionArtifact(**load_json("artifacts/data_ingestion/ingestion_artifact.json"))
+
+            trainer = OutOfCoreTrainer(
+                self.out_of_core_config, self.trainer_config,
+                ingestion_artifact.data_csv_file_path, self.loading_config
+            )
+            trainer_artifact = trainer.initiate_training()
+
+            save_json("artifacts/model_trainer/model_artifact.json", asdict(trainer_artifact))
+            logger.info(f"✅ Out-of-Core Model Training Completed. Model saved at: {trainer_artifact.trained_model_path}")
+
+            setup_mlflow(
+                tracking_uri=self.trainer_config.mlflow_tracking_uri,
+                experiment_name=self.trainer_config.experiment_name
+            )
+
+            report = load_json(f"{self.out_of_core_config.artifact_dir}/{self.out_of_core_config.report_file}")
+            with start_mlflow_run(run_name=f"{self.trainer_config.run_name}_out_of_core") as run:
+                log_params(trainer_artifact.estimator_params)
+                log_params(self.trainer_config.scaling_method_params)
+                log_param("scaling_method", self.trainer_config.scaling_method)
+                log_param("chunk_size", self.out_of_core_config.chunk_size)
+                log_param("n_epochs", self.out_of_core_config.n_epochs)
+                log_metrics({
+                    f"{split}_{key}": value
+                    for split, split_metrics in report["metrics"].items()
+                    for key, value in split_metrics.items()
+                })
+                log_model_artifact(trainer_artifact.trained_model_path)
+
+                save_json("artifacts/model_trainer/mlflow_run.json", {"run_id": run.info.run_id})
+
+            return trainer_artifact
+        except Exception as e:
+            logger.error(f"❌ Out-of-Core Training Pipeline Failed: {e}")
+            raise AppException(e, sys)
+
+def main():
+    try:
+        pipeline = OutOfCoreTrainingPipeline()
+        artifact = pipeline.run()
+        logger.info(f"[main] Model Trainer Artifact: {artifact}")
+    except Exception as e:
+        raise AppException(e, sys)
+
+if __name__ == "__main__":
+    main()
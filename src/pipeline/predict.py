@@ -1,20 +1,120 @@
 # src/pipeline/predict.py
 
+import os
 import sys
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+import numpy as np
 import pandas as pd
 from src.config.load_config import LoadConfig
-from src.utils.file_ops import load_json, load_joblib
+from src.utils.file_ops import count_split_rows, load_json, load_split
+from src.utils.risk_level import get_risk_levels
+from src.utils.typed_csv import iter_csv_typed
 from src.entity.artifacts_entity import ModelPusherArtifact, DataTransformationArtifact
-from src.components.model_prediction import ModelPrediction
+from src.entity.config_entity import DataLoadingConfig
+from src.components.model_prediction import ModelPrediction, init_prediction_worker, predict_in_worker
 from src.logger import logger
 from src.exception import AppException
 
+OUTPUT_COLUMNS = ["credit_score", "credit_level", "credit_description", "default_probability", "risk_level"]
+
+
+def read_chunks(input_path: str, chunk_size: int, loading: Optional[DataLoadingConfig] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV or Parquet file in chunks of at most ``chunk_size`` rows.
+    CSVs are read with the schema-driven dtypes used for training when a
+    loading config is given.
+    """
+    suffix = Path(input_path).suffix.lower()
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq  # Optional dependency, only needed for Parquet
+
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif suffix == ".csv":
+        if loading is not None:
+            yield from iter_csv_typed(input_path, loading.schema_columns, chunk_size=chunk_size,
+                                      categorical=loading.categorical_dtypes, downcast=loading.downcast_numerics)
+        else:
+            yield from pd.read_csv(input_path, chunksize=chunk_size)
+    else:
+        raise ValueError(f"Unsupported input format '{suffix}'. Expected .csv or .parquet")
+
+
+def score_chunk(chunk: pd.DataFrame, id_column: Optional[str] = None) -> pd.DataFrame:
+    """
+    Score one chunk inside a worker process (see init_prediction_worker).
+    """
+    prediction_df = predict_in_worker(chunk)
+    result = pd.DataFrame({
+        "credit_score": prediction_df["credit_score"].to_numpy(dtype="int64"),
+        "credit_level": prediction_df["credit_level"].to_numpy(dtype="int64"),
+        "credit_description": prediction_df["credit_description"].astype(str).to_numpy(),
+        "default_probability": prediction_df["default_probability"].to_numpy(),
+        "risk_level": get_risk_levels(prediction_df["default_probability"].to_numpy()),
+    })
+    if id_column:
+        result.insert(0, id_column, chunk[id_column].to_numpy())
+    return result
+
+
+class ChunkWriter:
+    """
+    Appends scored chunks to a CSV or Parquet file as they arrive.
+
+    Use as a context manager: the file is always closed (a Parquet footer is
+    only written on close), and an incomplete output is removed when the
+    block exits with an error.
+    """
+
+    def __init__(self, output_path: str):
+        self.output_path = Path(output_path)
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.format = self.output_path.suffix.lower()
+        if self.format not in (".csv", ".parquet"):
+            raise ValueError(f"Unsupported output format '{self.format}'. Expected .csv or .parquet")
+        self._parquet_writer = None
+        self._first = True
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.format == ".csv":
+            chunk.to_csv(self.output_path, mode="w" if self._first else "a", header=self._first, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.output_path, table.schema)
+            self._parquet_writer.write_table(table)
+        self._first = False
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+        if exc_type is not None and self.output_path.exists():
+            self.output_path.unlink()
+            logger.warning(f"🗑️ Removed incomplete output: {self.output_path}")
+
 
 class PredictPipeline:
     def __init__(self):
-        self.cfg = LoadConfig()        
-        self.pusher_artifact_path = "artifacts/model_trainer/model_artifact.json"
+        self.cfg = LoadConfig()
+        self.pusher_artifact_path = f"{self.cfg.get_model_pusher_config().export_dir}/model_pusher_artifact.json"
         self.trans_artifact_path = "artifacts/data_transformation/transformation_artifact.json"
+        self.serving_config = self.cfg.get_model_serving_config()
+        self.loading_config = self.cfg.get_data_loading_config()
 
     def run(self) -> pd.DataFrame:
         try:
@@ -22,16 +122,17 @@ class PredictPipeline:
 
             # Load artifacts
             pusher_dict = load_json(self.pusher_artifact_path)
-            trans_dict = load_json(self.trans_artifact_path)            
-            
+            trans_dict = load_json(self.trans_artifact_path)
+
             pusher_artifact = ModelPusherArtifact(**pusher_dict)
             trans_artifact = DataTransformationArtifact(**trans_dict)
 
             predictor = ModelPrediction(pusher_artifact, trans_artifact)
 
-            # Load sample input data for prediction
-            X_test = load_joblib(trans_artifact.X_test_path)
-            sample_input = X_test.sample(1)
+            # Load one random test row (columnar formats read just that row)
+            n_rows = count_split_rows(trans_artifact.X_test_path, trans_artifact.split_format)
+            row = np.random.default_rng().integers(n_rows)
+            sample_input = load_split(trans_artifact.X_test_path, trans_artifact.split_format, rows=[row])
 
             logger.info(f"📥 Sample Input Data:\n{sample_input.to_string(index=False)}")
 
@@ -45,15 +146,95 @@ class PredictPipeline:
             logger.error(f"❌ Prediction Pipeline Failed: {e}")
             raise AppException(e, sys)
 
+    def run_bulk(
+        self,
+        input_path: str,
+        output_path: str,
+        chunk_size: int = 100_000,
+        n_workers: int = None,
+        id_column: str = None
+    ) -> dict:
+        """
+        Score a large CSV/Parquet file chunk by chunk on a process pool.
+
+        Chunks are read lazily, fanned out to worker processes (each holding its
+        own loaded Scorecard) and written back in input order as soon as they are
+        done. At most ``2 * n_workers`` chunks are in flight, so memory stays flat
+        regardless of file size.
+
+        Returns:
+            dict: Rows scored, elapsed seconds and throughput in rows/s.
+        """
+        try:
+            logger.info("===== 🧠  [Step 7] Starting Bulk Model Prediction =====")
+            n_workers = n_workers or os.cpu_count()
+            max_pending = 2 * n_workers
+            pusher_artifact = ModelPusherArtifact(**load_json(self.pusher_artifact_path))
+
+            n_rows, n_chunks = 0, 0
+            start = time.perf_counter()
+
+            with ChunkWriter(output_path) as writer, ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=init_prediction_worker,
+                initargs=(pusher_artifact, self.serving_config.engine, self.serving_config.fused_prediction)
+            ) as pool:
+                pending = deque()
+
+                def drain_one():
+                    nonlocal n_rows, n_chunks
+                    scored = pending.popleft().result()
+                    writer.write(scored)
+                    n_rows += len(scored)
+                    n_chunks += 1
+                    rate = n_rows / (time.perf_counter() - start)
+                    logger.info(f"📦 Chunk {n_chunks} written: {n_rows:,} rows scored ({rate:,.0f} rows/s)")
+
+                for chunk in read_chunks(input_path, chunk_size, self.loading_config):
+                    pending.append(pool.submit(score_chunk, chunk, id_column))
+                    if len(pending) >= max_pending:
+                        drain_one()
+                while pending:
+                    drain_one()
+
+            elapsed = time.perf_counter() - start
+            summary = {
+                "rows": n_rows,
+                "chunks": n_chunks,
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(n_rows / elapsed, 1) if elapsed > 0 else None,
+                "output_path": str(output_path)
+            }
+            logger.info(f"✅ Bulk prediction completed: {summary}")
+            return summary
+
+        except Exception as e:
+            logger.error(f"❌ Bulk Prediction Pipeline Failed: {e}")
+            raise AppException(e, sys)
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Score a sample row, or a whole file with --input.")
+    parser.add_argument("--input", help="CSV or Parquet file to score in bulk")
+    parser.add_argument("--output", help="Output CSV or Parquet file for bulk scores")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="Rows per chunk")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--id-column", default=None, help="Input column copied to the output to identify rows")
+    args = parser.parse_args()
+
     try:
         pipeline = PredictPipeline()
-        prediction_df = pipeline.run()
-        logger.info(f"📊 Prediction completed successfully. Prediction Output:\n{prediction_df.to_string(index=False)}")
+        if args.input:
+            if not args.output:
+                parser.error("--output is required with --input")
+            summary = pipeline.run_bulk(args.input, args.output, args.chunk_size, args.workers, args.id_column)
+            logger.info(f"📊 Bulk prediction summary: {summary}")
+        else:
+            prediction_df = pipeline.run()
+            logger.info(f"📊 Prediction completed successfully. Prediction Output:\n{prediction_df.to_string(index=False)}")
     except Exception as e:
         raise AppException(e, sys)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,244 @@
+# src/utils/bootstrap.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+BOOTSTRAP_METRICS = ("auc", "gini", "pr_auc", "ks", "brier")
+
+# Per-process resampling cells of the split being bootstrapped (see _init_bootstrap_worker)
+_cells: Optional[Dict[str, np.ndarray]] = None
+
+# Draw row indices instead of a multinomial over the cells once cells * ratio > rows
+ROW_DRAW_CELL_RATIO = 10
+
+# Working memory of one block; the replicates per block are capped to fit it
+BLOCK_MEMORY_BYTES = 256 * 1024 * 1024
+
+
+def resampling_cells(y_true: np.ndarray, proba: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Collapse a split into its distinct (probability, class) cells, sorted by
+    probability (the only sort of the bootstrap), with the event cells and
+    the event/non-event ties metrics_from_cell_counts needs.
+
+    A bootstrap resample of the rows is fully described by how many times it
+    draws each cell, so replicates are counted and scored at the cell level.
+    With few cells (tied scores) the counts are drawn as one multinomial over
+    the cells; with many (continuous scores) drawing row indices and
+    counting them per cell is cheaper, so the row -> cell map is kept.
+    """
+    y = np.asarray(y_true).astype(np.int64)
+    proba = np.asarray(proba, dtype=np.float64)
+    values, group = np.unique(proba, return_inverse=True)
+    slot = group * 2 + y
+    counts = np.bincount(slot, minlength=2 * values.size)
+    cell = np.flatnonzero(counts)
+    cell_group, is_event = cell // 2, (cell % 2).astype(bool)
+
+    # Within a probability group the non-event cell comes right before the event cell
+    event_cells = np.flatnonzero(is_event)
+    tied = np.zeros(event_cells.size, dtype=bool)
+    has_prev = event_cells > 0
+    prev = event_cells[has_prev] - 1
+    tied[has_prev] = ~is_event[prev] & (cell_group[prev] == cell_group[event_cells[has_prev]])
+
+    cells = {
+        "n": np.int64(y.size),
+        "n_groups": np.int64(values.size),
+        "pvals": counts[cell] / y.size,
+        "sq_error": (is_event - values[cell_group]) ** 2,
+        "event_cells": event_cells,
+        "tied": np.flatnonzero(tied),  # Event cells sharing their probability with a non-event cell
+        "row_cell": None,
+    }
+    if cell.size * ROW_DRAW_CELL_RATIO > y.size:
+        cell_of_slot = np.zeros(2 * values.size, dtype=np.int32)
+        cell_of_slot[cell] = np.arange(cell.size, dtype=np.int32)
+        cells["row_cell"] = cell_of_slot[slot]
+    return cells
+
+
+def replicate_nbytes(cells: Dict[str, np.ndarray]) -> int:
+    """
+    Approximate working memory of one replicate: its int32 draw counts (plus
+    the int64 multinomial output or running count), and a few arrays over
+    the event cells.
+    """
+    return cells["pvals"].size * 20 + cells["event_cells"].size * 60
+
+
+def cells_nbytes(cells: Dict[str, np.ndarray]) -> int:
+    return sum(value.nbytes for value in cells.values() if isinstance(value, np.ndarray))
+
+
+def metrics_from_cell_counts(cells: Dict[str, np.ndarray], counts: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    AUC, Gini, PR-AUC, KS and Brier score of every replicate of a block.
+
+    Everything is read at the event cells from cumulative counts: AUC and
+    PR-AUC sum over them, and the KS curve (event CDF minus non-event CDF)
+    only rises at an event cell and reaches each of its lows just before
+    one. The counts are integers, so AUC and KS match the full-data formulas
+    exactly. Memory is ``replicate_nbytes`` per replicate of the block.
+
+    Args:
+        cells (dict): Output of ``resampling_cells``.
+        counts (np.ndarray): (replicates, cells) draw counts.
+
+    Returns:
+        dict: One array of ``len(counts)`` values per metric (NaN for a
+        replicate that drew a single class).
+    """
+    n_reps, n = counts.shape[0], int(cells["n"])
+    event_cells, tied = cells["event_cells"], cells["tied"]
+    brier = counts @ cells["sq_error"] / n
+
+    events = counts[:, event_cells]
+    events_le = np.zeros((n_reps, events.shape[1] + 1), dtype=np.int64)
+    np.cumsum(events, axis=1, out=events_le[:, 1:])
+    # Draws at or below each event cell (one flat running count; every row of counts sums to n)
+    drawn_le = np.cumsum(counts.ravel()).reshape(counts.shape)[:, event_cells]
+    drawn_le -= (np.arange(n_reps) * n)[:, None]
+
+    # Non-events at or below each event cell's probability, and those tied with it
+    below = (drawn_le - events_le[:, 1:]).astype(np.float64)
+    del drawn_le
+    tied_nonevents = np.zeros_like(below)
+    tied_nonevents[:, tied] = counts[:, event_cells[tied] - 1]
+    n_events = events_le[:, -1:].astype(np.float64)
+    n_nonevents = n - n_events
+    events = events.astype(np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Two-sample KS as ks_2samp: the larger of the one-sided statistics. The low before
+        # an event cell is at the previous group's end (its own, if a non-event is tied with it).
+        nonevent_cdf = below / n_nonevents
+        cdf_diff = events_le[:, 1:] / n_events
+        cdf_diff -= nonevent_cdf
+        max_s = cdf_diff.max(axis=1, initial=-np.inf)
+        low = events_le[:, :-1].astype(np.float64)
+        low[:, tied] += events[:, tied]
+        low /= n_events
+        low -= nonevent_cdf
+        min_s = np.clip(-low.min(axis=1, initial=0.0), 0, 1)
+        ks = np.where(min_s > max_s, min_s, max_s)
+        del nonevent_cdf, cdf_diff, low
+
+        # Mann-Whitney AUC, ties counted as half
+        work = np.multiply(tied_nonevents, -0.5)
+        work += below
+        work *= events
+        auc = work.sum(axis=1) / (n_events * n_nonevents)[:, 0]
+
+        # Average precision: recall steps (events at each threshold) times precision at that threshold
+        np.subtract(n_events, events_le[:, 1:], out=work)
+        work += events  # Events scored at or above the threshold
+        below -= tied_nonevents
+        np.subtract(n_nonevents, below, out=below)  # Non-events scored at or above the threshold
+        below += work
+        np.divide(work, below, out=work, where=events > 0)
+        work *= events  # Zero wherever no event was drawn
+        pr_auc = work.sum(axis=1) / n_events[:, 0]
+
+    return {"auc": auc, "gini": 2 * auc - 1, "pr_auc": pr_auc, "ks": ks, "brier": brier}
+
+
+def _init_bootstrap_worker(cells: Dict[str, np.ndarray]) -> None:
+    """
+    Process pool initializer: every worker receives the split's cells once.
+    """
+    global _cells
+    _cells = cells
+
+
+def draw_cell_counts(rng: np.random.Generator, cells: Dict[str, np.ndarray], n_reps: int) -> np.ndarray:
+    """
+    (n_reps, cells) int32 draw counts of ``n_reps`` resamples of the rows
+    with replacement.
+    """
+    n = int(cells["n"])
+    if cells["row_cell"] is None:
+        return rng.multinomial(n, cells["pvals"], size=n_reps).astype(np.int32)
+    counts = np.empty((n_reps, cells["pvals"].size), dtype=np.int32)
+    for rep in range(n_reps):
+        rows = rng.integers(0, n, size=n)
+        counts[rep] = np.bincount(cells["row_cell"][rows], minlength=counts.shape[1])
+    return counts
+
+
+def bootstrap_block(seed: np.random.SeedSequence, n_reps: int) -> Dict[str, np.ndarray]:
+    """
+    Draw ``n_reps`` resamples at once and score them.
+    """
+    counts = draw_cell_counts(np.random.default_rng(seed), _cells, n_reps)
+    return metrics_from_cell_counts(_cells, counts)
+
+
+def bootstrap_confidence_intervals(
+    y_true: np.ndarray,
+    proba: np.ndarray,
+    n_replicates: int = 1000,
+    confidence: float = 0.95,
+    random_state: int = 42,
+    block_size: int = 50,
+    n_workers: Optional[int] = None,
+    max_memory_mb: float = 1024,
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Percentile bootstrap confidence intervals of the evaluation metrics.
+
+    Replicates are drawn in blocks spread over a process pool. A block holds
+    ``block_size`` replicates at most, fewer when the split has so many
+    distinct scores that they would not fit in ``BLOCK_MEMORY_BYTES``. Each
+    block has its own child of ``SeedSequence(random_state)``, so the
+    intervals only depend on the data, the seed and the block size, not on
+    the number of workers. Workers are capped so that their blocks (and
+    their copy of the cells) fit in ``max_memory_mb``.
+
+    Args:
+        y_true (array-like): Binary target (0/1).
+        proba (array-like): Predicted probability of the event class.
+        n_replicates (int): Number of bootstrap resamples.
+        confidence (float): Coverage of the intervals, e.g. 0.95.
+        random_state (int): Root seed.
+        block_size (int): Max replicates drawn and scored per vectorized block.
+        n_workers (int, optional): Process pool size (None: CPU count; 1: in process).
+        max_memory_mb (float): Memory budget of all workers together.
+
+    Returns:
+        dict: (lower, upper) per metric of ``BOOTSTRAP_METRICS``.
+
+    Raises:
+        ValueError: If only one class is present or confidence is not in (0, 1).
+    """
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    if len(np.unique(np.asarray(y_true))) != 2:
+        raise ValueError("Both classes are needed to bootstrap AUC/KS.")
+
+    cells = resampling_cells(y_true, proba)
+    block_size = max(1, min(block_size, BLOCK_MEMORY_BYTES // replicate_nbytes(cells)))
+    sizes = [min(block_size, n_replicates - start) for start in range(0, n_replicates, block_size)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+
+    worker_nbytes = block_size * replicate_nbytes(cells) + cells_nbytes(cells)
+    memory_cap = max(1, int(max_memory_mb * 1024 * 1024) // worker_nbytes)
+    n_workers = min(n_workers or os.cpu_count(), len(sizes), memory_cap)
+
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_bootstrap_worker,
+                                 initargs=(cells,)) as pool:
+            blocks = list(pool.map(bootstrap_block, seeds, sizes))
+    else:
+        _init_bootstrap_worker(cells)
+        blocks = [bootstrap_block(seed, size) for seed, size in zip(seeds, sizes)]
+
+    alpha = (1 - confidence) / 2
+    intervals = {}
+    for metric in BOOTSTRAP_METRICS:
+        values = np.concatenate([block[metric] for block in blocks])
+        lower, upper = np.nanquantile(values, [alpha, 1 - alpha])
+        intervals[metric] = (float(lower), float(upper))
+    return intervals
@@ -0,0 +1,137 @@
+# src/utils/column_profile.py
+
+from typing import Any, Dict, Optional
+import numpy as np
+import pandas as pd
+
+# Dtype kinds in the vocabulary of config/schema.yaml
+KIND_INT, KIND_FLOAT, KIND_BOOL, KIND_OBJECT = "int", "float", "bool", "object"
+
+PROFILE_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+def dtype_kind(series: pd.Series) -> str:
+    """
+    Map a pandas dtype to a schema kind: "int", "float", "bool" or "object"
+    (object, string and category columns are all "object").
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return KIND_BOOL
+    if pd.api.types.is_integer_dtype(series):
+        return KIND_INT
+    if pd.api.types.is_float_dtype(series):
+        return KIND_FLOAT
+    return KIND_OBJECT
+
+
+def promote_kind(current: Optional[str], new: str) -> str:
+    """
+    Kind of a column after concatenating chunks of kinds ``current`` and ``new``,
+    matching what a single full pd.read_csv would infer (int + float -> float,
+    any other mix -> object).
+    """
+    if current is None or current == new:
+        return new
+    if {current, new} == {KIND_INT, KIND_FLOAT}:
+        return KIND_FLOAT
+    return KIND_OBJECT
+
+
+class ColumnProfile:
+    """
+    One-pass, constant-memory profile of a single column fed chunk by chunk.
+
+    Tracks the promoted dtype kind, row and null counts, min/max/mean of
+    numeric values, a uniform reservoir sample (Algorithm R) for approximate
+    quantiles, and value counts for categorical values up to
+    ``max_categories`` distinct values (beyond that only a lower bound on the
+    cardinality is reported).
+    """
+
+    def __init__(self, name: str, sample_size: int = 10_000, max_categories: int = 1_000, seed: int = 0):
+        self.name = name
+        self.sample_size = sample_size
+        self.max_categories = max_categories
+        self._rng = np.random.default_rng(seed)
+
+        self.kind: Optional[str] = None
+        self.count = 0
+        self.nulls = 0
+
+        self.numeric_count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._sum = 0.0
+        self._reservoir = np.empty(sample_size, dtype=np.float64)
+
+        self._categories: Dict[str, int] = {}
+        self.categories_overflow = False
+
+    def update(self, series: pd.Series) -> None:
+        self.kind = promote_kind(self.kind, dtype_kind(series))
+        self.count += len(series)
+        null_mask = series.isna().to_numpy()
+        self.nulls += int(null_mask.sum())
+
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            self._update_numeric(series.to_numpy(dtype=np.float64)[~null_mask])
+        else:
+            self._update_categories(series[~null_mask])
+
+    def _update_numeric(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        low, high = float(values.min()), float(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self._sum += float(values.sum())
+
+        # Algorithm R, vectorized: the i-th value overall replaces a random
+        # slot with probability sample_size / (i + 1)
+        seen = self.numeric_count
+        n_fill = min(max(self.sample_size - seen, 0), values.size)
+        self._reservoir[seen:seen + n_fill] = values[:n_fill]
+        rest = values[n_fill:]
+        if rest.size:
+            positions = np.arange(seen + n_fill, seen + values.size)
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self.sample_size
+            self._reservoir[slots[keep]] = rest[keep]
+        self.numeric_count += values.size
+
+    def _update_categories(self, values: pd.Series) -> None:
+        for value, n in values.astype(str).value_counts(sort=False).items():
+            if value in self._categories:
+                self._categories[value] += int(n)
+            elif len(self._categories) < self.max_categories:
+                self._categories[value] = int(n)
+            else:
+                self.categories_overflow = True
+
+    def to_dict(self) -> Dict[str, Any]:
+        profile: Dict[str, Any] = {
+            "dtype": self.kind,
+            "count": self.count,
+            "nulls": self.nulls,
+            "null_fraction": self.nulls / self.count if self.count else 0.0,
+        }
+        if self.numeric_count:
+            sample = self._reservoir[:min(self.numeric_count, self.sample_size)]
+            profile.update({
+                "min": self.min,
+                "max": self.max,
+                "mean": self._sum / self.numeric_count,
+                "quantiles": {
+                    f"p{round(q * 100):02d}": float(v)
+                    for q, v in zip(PROFILE_QUANTILES, np.quantile(sample, PROFILE_QUANTILES))
+                },
+                "quantiles_exact": self.numeric_count <= self.sample_size,
+            })
+        if self._categories or self.categories_overflow:
+            top = sorted(self._categories.items(), key=lambda kv: kv[1], reverse=True)[:20]
+            profile.update({
+                "cardinality": len(self._categories),
+                "cardinality_exact": not self.categories_overflow,
+                "top_values": dict(top),
+            })
+        return profile
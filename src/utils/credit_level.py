@@ -0,0 +1,51 @@
+# src/utils/credit_level.py
+
+from bisect import bisect_left
+import numpy as np
+
+# Upper (inclusive) credit-score bound of every credit level but the last
+CREDIT_LEVEL_EDGES = np.array([380, 450, 520, 590, 660, 730, 800])
+CREDIT_LEVEL_LABELS = np.arange(1, len(CREDIT_LEVEL_EDGES) + 2)
+CREDIT_LEVEL_DESCRIPTIONS = np.array([
+    "Very Poor", "Poor", "Average", "Above Average",
+    "Good", "Very Good", "Excellent", "Exceptional"
+], dtype=object)
+
+_CREDIT_LEVEL_EDGE_LIST = CREDIT_LEVEL_EDGES.tolist()
+
+
+def get_credit_levels(credit_scores: np.ndarray):
+    """
+    Map credit scores to credit levels (1-8) and their descriptions.
+
+    Bins are right-closed, i.e. a score of exactly 380 is level 1. A missing
+    (NaN) score has no level, as with ``pd.cut``: its level is NaN (levels
+    are then float) and its description None.
+
+    Args:
+        credit_scores (np.ndarray): Credit scores.
+
+    Returns:
+        tuple: (np.ndarray of levels, np.ndarray of descriptions).
+    """
+    scores = np.asarray(credit_scores, dtype=float)
+    positions = np.searchsorted(CREDIT_LEVEL_EDGES, scores, side="left")
+    levels, descriptions = CREDIT_LEVEL_LABELS[positions], CREDIT_LEVEL_DESCRIPTIONS[positions]
+    missing = np.isnan(scores)
+    if missing.any():
+        levels = np.where(missing, np.nan, levels)
+        descriptions[missing] = None
+    return levels, descriptions
+
+
+def get_credit_level(credit_score: float):
+    """
+    Scalar get_credit_levels for a single score.
+
+    Returns:
+        tuple: (int level, str description), or (None, None) for a missing score.
+    """
+    if credit_score is None or credit_score != credit_score:  # NaN
+        return None, None
+    position = bisect_left(_CREDIT_LEVEL_EDGE_LIST, credit_score)
+    return position + 1, CREDIT_LEVEL_DESCRIPTIONS[position]
@@ -3,10 +3,14 @@
 import os
 import sys
 import pickle
-import joblib
 import yaml
 import json
-from typing import Any
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator
 from pathlib import Path
 from src.exception import AppException
 
@@ -135,6 +139,8 @@ def save_joblib(file_path: str, obj: Any) -> None:
     """
     try:
         Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        import joblib  # Deferred: only needed when artifacts are written/read
+
         joblib.dump(obj, file_path)
     except Exception as e:
         raise AppException(e, sys)
@@ -156,6 +162,8 @@ def load_joblib(file_path: str) -> Any:
     try:
         if not Path(file_path).exists():
             raise FileNotFoundError(f"File not found: {file_path}")
+        import joblib
+
         return joblib.load(file_path)
     except Exception as e:
         raise AppException(e, sys)
@@ -209,4 +217,248 @@ def load_json(file_path: str) -> dict:
         with open(file_path, "r") as f:
             return json.load(f)
     except Exception as e:
-        raise AppException(e, sys)
\ No newline at end of file
+        raise AppException(e, sys)
+
+def compute_file_hash(file_path: str, length: int = 12, chunk_size: int = 1 << 20) -> str:
+    """
+    Computes a short SHA-256 content hash of a file, read in chunks.
+
+    Args:
+        file_path (str): The path to the file.
+        length (int): Number of hex characters to keep from the digest.
+        chunk_size (int): Bytes read per iteration.
+
+    Returns:
+        str: The truncated hex digest.
+
+    Raises:
+        AppException: If the file does not exist or cannot be read.
+    """
+    try:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:length]
+    except Exception as e:
+        raise AppException(e, sys)
+
+@contextmanager
+def atomic_directory(dir_path: str, marker: str = "meta.json") -> Iterator[Path]:
+    """
+    Write a directory atomically: yields a temp directory next to ``dir_path``
+    and renames it into place once the block completes, so concurrent or
+    interrupted runs never leave a half-written directory behind.
+
+    If another writer renamed its directory into place first (``marker``
+    exists there), the rename failure is ignored and theirs is kept; the
+    temp directory is always removed.
+
+    Args:
+        dir_path (str): Final directory path.
+        marker (str): File whose presence marks a complete directory.
+
+    Yields:
+        Path: The temp directory to write into.
+
+    Raises:
+        OSError: If the rename fails and no complete directory is in place.
+    """
+    target = Path(dir_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=target.parent, prefix=f".{target.name[:12]}-"))
+    try:
+        yield tmp
+        try:
+            os.replace(tmp, target)
+        except OSError:
+            if not (target / marker).exists():
+                raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+@lru_cache(maxsize=None)
+def project_root() -> Path:
+    """
+    Returns the project root, located once per process by pyprojroot
+    (which walks up the filesystem looking for project markers).
+
+    Returns:
+        Path: The project root directory.
+    """
+    from pyprojroot import here
+
+    return here()
+
+
+# === Train/Test/OOT split artifacts ===
+# "joblib": one pickle per split (default). "parquet": one Parquet file, readable
+# column by column. "npy": a directory with one .npy per column, memory-mapped on
+# load; string columns are dictionary-encoded (int32 codes + categories).
+SPLIT_FORMATS = ("joblib", "parquet", "npy")
+
+
+def split_path(file_path: str, split_format: str) -> str:
+    """
+    Path of a split artifact for a format, derived from its configured
+    file name (X_train.pkl -> X_train.parquet, or the directory X_train/ for npy).
+    """
+    if split_format not in SPLIT_FORMATS:
+        raise ValueError(f"Unknown split format '{split_format}'. Expected one of {SPLIT_FORMATS}.")
+    suffix = {"joblib": ".pkl", "parquet": ".parquet", "npy": ""}[split_format]
+    return str(Path(file_path).with_suffix(suffix))
+
+
+def save_split(file_path: str, data: Any, split_format: str = "joblib") -> str:
+    """
+    Saves a split (DataFrame or Series) in the given format.
+
+    Args:
+        file_path (str): Configured artifact path; the suffix is adapted to the format.
+        data (pd.DataFrame | pd.Series): The split to save.
+        split_format (str): One of SPLIT_FORMATS.
+
+    Returns:
+        str: The path actually written.
+
+    Raises:
+        AppException: If saving fails.
+    """
+    try:
+        path = split_path(file_path, split_format)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        if split_format == "joblib":
+            save_joblib(path, data)
+        elif split_format == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            is_series = data.ndim == 1
+            table = pa.Table.from_pandas(data.to_frame() if is_series else data)
+            metadata = {**(table.schema.metadata or {}), b"split_kind": b"series" if is_series else b"frame"}
+            pq.write_table(table.replace_schema_metadata(metadata), path)
+        else:
+            _save_npy_split(path, data)
+        return path
+    except Exception as e:
+        raise AppException(e, sys)
+
+
+def _save_npy_split(path: str, data: Any) -> None:
+    import numpy as np
+    import pandas as pd
+
+    out_dir = Path(path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    is_series = data.ndim == 1
+    frame = data.to_frame() if is_series else data
+
+    columns = []
+    for i, (name, col) in enumerate(frame.items()):
+        file_name = f"col_{i}.npy"
+        if pd.api.types.is_numeric_dtype(col.dtype) or pd.api.types.is_bool_dtype(col.dtype):
+            np.save(out_dir / file_name, col.to_numpy())
+            columns.append({"name": name, "file": file_name, "encoding": "array"})
+        else:
+            codes, categories = pd.factorize(col)  # Missing values -> code -1
+            np.save(out_dir / file_name, codes.astype(np.int32))
+            columns.append({"name": name, "file": file_name, "encoding": "dictionary",
+                            "categories": [str(c) for c in categories]})
+
+    np.save(out_dir / "index.npy", frame.index.to_numpy())
+    save_json(out_dir / "meta.json", {
+        "kind": "series" if is_series else "frame",
+        "n_rows": len(frame),
+        "index_name": frame.index.name,
+        "columns": columns,
+    })
+
+
+def load_split(file_path: str, split_format: str = "joblib", columns: list = None, rows: Any = None) -> Any:
+    """
+    Loads a split saved by save_split, optionally projecting columns and rows.
+
+    Parquet reads only the requested columns from disk; npy memory-maps each
+    column and only copies the requested rows. joblib always unpickles the
+    whole object and selects afterwards.
+
+    Args:
+        file_path (str): Configured artifact path (suffix is adapted to the format).
+        split_format (str): One of SPLIT_FORMATS.
+        columns (list, optional): Columns to load (DataFrame splits only).
+        rows (array-like, optional): Positional row indices to load.
+
+    Returns:
+        pd.DataFrame | pd.Series: The (projected) split.
+
+    Raises:
+        AppException: If the artifact does not exist or cannot be read.
+    """
+    try:
+        path = split_path(file_path, split_format)
+        if split_format == "joblib":
+            data = load_joblib(path)
+            if columns is not None and data.ndim == 2:
+                data = data[columns]
+            return data.iloc[rows] if rows is not None else data
+
+        if split_format == "parquet":
+            import pyarrow.parquet as pq
+
+            table = pq.read_pandas(path, columns=columns, memory_map=True)
+            if rows is not None:
+                table = table.take(rows)
+            data = table.to_pandas()
+            if table.schema.metadata.get(b"split_kind") == b"series":
+                data = data.iloc[:, 0]
+            return data
+
+        return _load_npy_split(path, columns, rows)
+    except Exception as e:
+        raise AppException(e, sys)
+
+
+def _load_npy_split(path: str, columns: list = None, rows: Any = None) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    split_dir = Path(path)
+    meta = load_json(split_dir / "meta.json")
+    wanted = meta["columns"] if columns is None else [c for c in meta["columns"] if c["name"] in set(columns)]
+
+    def read(file_name):
+        array = np.load(split_dir / file_name, mmap_mode="r").view(np.ndarray)  # Still backed by the map
+        return array if rows is None else array[rows]
+
+    data = {}
+    for col in wanted:
+        values = read(col["file"])
+        if col["encoding"] == "dictionary":
+            # Decode with the column's own string dtype; code -1 becomes NaN
+            values = pd.Index(col["categories"]).take(values, allow_fill=True, fill_value=np.nan).array
+        data[col["name"]] = values
+
+    index = pd.Index(read("index.npy"), name=meta["index_name"])
+    frame = pd.DataFrame(data, index=index, copy=False)
+    if columns is not None:
+        frame = frame[[c for c in columns if c in frame.columns]]
+    return frame.iloc[:, 0] if meta["kind"] == "series" else frame
+
+
+def count_split_rows(file_path: str, split_format: str = "joblib") -> int:
+    """
+    Number of rows of a split, read from metadata where the format has it.
+    """
+    try:
+        path = split_path(file_path, split_format)
+        if split_format == "parquet":
+            import pyarrow.parquet as pq
+
+            return pq.ParquetFile(path).metadata.num_rows
+        if split_format == "npy":
+            return load_json(Path(path) / "meta.json")["n_rows"]
+        return len(load_joblib(path))
+    except Exception as e:
+        raise AppException(e, sys)
@@ -0,0 +1,268 @@
+# src/utils/incremental_binning.py
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+import numpy as np
+from optbinning.binning.binning_statistics import BinningTable
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from optbinning import BinningProcess, BinningProcessSketch, OptimalBinning
+
+
+def delta_bin_counts(optb: "OptimalBinning", x, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-bin (event, non-event) counts of new data under the fitted, unchanged
+    bins of ``optb``, laid out like ``optb._n_event`` ([bins..., specials...,
+    missing]). Categories unseen at fit time have no bin and are not counted,
+    as at fit time.
+    """
+    indices = optb.transform(x, metric="indices", metric_special="empirical", metric_missing="empirical")
+    n_slots = len(optb._n_event)
+    known = indices >= 0
+    indices, y = indices[known], y[known]
+    n_event = np.bincount(indices[y == 1], minlength=n_slots)
+    n_nonevent = np.bincount(indices[y == 0], minlength=n_slots)
+    return n_event, n_nonevent
+
+
+def add_bin_counts(optb: "OptimalBinning", n_event: np.ndarray, n_nonevent: np.ndarray, x=None) -> None:
+    """
+    Add delta counts to a fitted OptimalBinning in place and rebuild its
+    binning table. Bin boundaries are untouched; WoE, IV and every other
+    statistic follow from the updated counts (O(bins) work).
+    """
+    optb._n_event = optb._n_event + n_event
+    optb._n_nonevent = optb._n_nonevent + n_nonevent
+
+    table = optb._binning_table
+    min_x, max_x = table.min_x, table.max_x
+    if optb.dtype == "numerical" and x is not None:
+        values = np.asarray(x, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size:
+            min_x, max_x = min(min_x, values.min()), max(max_x, values.max())
+
+    optb._binning_table = BinningTable(
+        optb.name, optb.dtype, optb.special_codes, optb._splits_optimal,
+        optb._n_nonevent, optb._n_event, min_x, max_x, optb._categories,
+        optb._cat_others, optb.user_splits
+    )
+
+
+def refresh_binning_process(binning_process: "BinningProcess", X: "pd.DataFrame", y) -> Dict[str, Any]:
+    """
+    Fold a batch of new data into a fitted BinningProcess in place: every
+    variable keeps its bins and gets its counts, WoE and selection stats
+    (IV, Gini, ...) updated. Variable selection is kept as fitted.
+
+    Returns:
+        dict: Per-variable max absolute WoE change over the regular bins.
+    """
+    y = np.asarray(y)
+    woe_shift = {}
+    for name in binning_process.variable_names:
+        optb = binning_process.get_binned_variable(name)
+        n_regular = len(optb._n_event) - _n_special_slots(optb) - 1  # Rows: bins, specials, missing
+        woe_before = optb.binning_table.build(add_totals=False)["WoE"].to_numpy(dtype=np.float64)[:n_regular]
+
+        n_event, n_nonevent = delta_bin_counts(optb, X[name], y)
+        add_bin_counts(optb, n_event, n_nonevent, X[name])
+
+        table = optb.binning_table
+        table.build()
+        table.analysis(print_output=False)
+        stats = binning_process._variable_stats[name]
+        for metric in ("iv", "gini", "js", "quality_score"):
+            if metric in stats:
+                stats[metric] = getattr(table, metric)
+
+        woe_after = table.build(add_totals=False)["WoE"].to_numpy(dtype=np.float64)[:n_regular]
+        woe_shift[name] = float(np.max(np.abs(woe_after - woe_before), initial=0.0))
+    return woe_shift
+
+
+def n_binned_records(binning_process: "BinningProcess") -> int:
+    """
+    Records a fitted BinningProcess was fitted on (plus any refreshed
+    batches), read from the counts of its first variable.
+    """
+    optb = binning_process.get_binned_variable(binning_process.variable_names[0])
+    return int(np.sum(optb._n_event) + np.sum(optb._n_nonevent))
+
+
+def refresh_logistic_coefficients(estimator, woe: np.ndarray, y, n_base: int, base_weight: float = 1.0,
+                                  tol: float = 1e-8, max_iter: int = 100) -> int:
+    """
+    Update a fitted LogisticRegression in place with a batch of new data,
+    approximating a refit on the base training rows plus the batch.
+
+    The base rows are not available, so their log-loss is replaced by its
+    second-order expansion at the base coefficients ``b0``: the gradient
+    there follows from the base fit's optimality (it cancels the L2 term,
+    ``-b0 / C``) and the curvature is the batch's, scaled to ``n_base``
+    rows. The fit minimizes, by Newton's method,
+
+        batch log-loss + |coef|^2 / (2C) + base_weight * (g.d + 0.5 * d' H d),
+        d = b - b0,  g = -b0 / C,  H = n_base / n_batch * H_batch(b0)
+
+    ``base_weight=1`` weighs every base record like a batch record;
+    ``base_weight=0`` is a plain fit on the batch alone.
+
+    Args:
+        estimator (LogisticRegression): Fitted, L2-penalized (``l1_ratio=0``).
+        woe (np.ndarray): (n_batch, n_coef) WoE matrix the estimator is fitted on.
+        y (array-like): Binary target of the batch.
+        n_base (int): Records the base model was fitted on.
+        base_weight (float): Weight of the base records relative to the batch's.
+        tol (float): Stop when no coefficient moves by more than this.
+        max_iter (int): Maximum Newton iterations.
+
+    Returns:
+        int: Newton iterations run.
+    """
+    if getattr(estimator, "l1_ratio", None) or getattr(estimator, "class_weight", None) is not None:
+        raise ValueError("Coefficient refresh supports unweighted, L2-penalized LogisticRegression only.")
+    X = np.column_stack([np.asarray(woe, dtype=np.float64), np.ones(len(woe))])
+    y = np.asarray(y, dtype=np.float64)
+    b0 = np.r_[estimator.coef_.ravel(), estimator.intercept_]
+    ridge = np.r_[np.full(b0.size - 1, 1.0 / estimator.C), 0.0]  # The intercept is not penalized
+
+    def loss_terms(b):
+        z = X @ b
+        return np.sum(np.logaddexp(0.0, z) - y * z), 1.0 / (1.0 + np.exp(-z))
+
+    _, p0 = loss_terms(b0)
+    base_gradient = -base_weight * ridge * b0
+    base_hessian = (base_weight * n_base / len(y)) * (X.T * (p0 * (1 - p0))) @ X
+
+    def objective(b):
+        loss, p = loss_terms(b)
+        d = b - b0
+        return loss + 0.5 * ridge @ (b * b) + base_gradient @ d + 0.5 * d @ base_hessian @ d, p
+
+    b, n_iter = b0.copy(), 0
+    value, p = objective(b)
+    for n_iter in range(1, max_iter + 1):
+        gradient = X.T @ (p - y) + ridge * b + base_gradient + base_hessian @ (b - b0)
+        hessian = (X.T * (p * (1 - p))) @ X + np.diag(ridge) + base_hessian
+        step = np.linalg.solve(hessian, gradient)
+        # Backtrack until the (convex) objective decreases
+        t = 1.0
+        while True:
+            candidate = b - t * step
+            candidate_value, candidate_p = objective(candidate)
+            if candidate_value <= value or t < 1e-10:
+                break
+            t /= 2
+        b, value, p = candidate, candidate_value, candidate_p
+        if np.max(np.abs(t * step)) < tol:
+            break
+
+    estimator.coef_ = b[:-1].reshape(estimator.coef_.shape)
+    estimator.intercept_ = b[-1:].copy()
+    estimator.n_iter_ = np.array([n_iter], dtype=np.int32)
+    return n_iter
+
+
+def _n_special_slots(optb: "OptimalBinning") -> int:
+    """
+    Number of special-code rows in the binning table (one unless codes are given as a dict).
+    """
+    return len(optb.special_codes) if isinstance(optb.special_codes, dict) else 1
+
+
+def _transform_only(binning_process, X, y=None, sample_weight=None, metric="woe", metric_special=0,
+                    metric_missing=0, show_digits=2, check_input=False):
+    return binning_process.transform(X, metric=metric, metric_special=metric_special,
+                                     metric_missing=metric_missing, show_digits=show_digits,
+                                     check_input=check_input)
+
+
+@contextmanager
+def prefitted(binning_process: "BinningProcess", estimator, fit_estimator: bool = True):
+    """
+    Let ``Scorecard.fit`` use an already fitted BinningProcess and a
+    warm-startable estimator as they are.
+
+    Scorecard.fit clones both and refits the binning; inside this context
+    cloning returns the objects themselves and the binning's fit_transform
+    only transforms, so the fit reduces to the estimator fit (warm-started
+    when ``estimator.warm_start`` is set) plus building the points table.
+    With ``fit_estimator=False`` the estimator is used exactly as fitted
+    (e.g. trained out of core) and only the points table is built.
+    The overrides are instance attributes removed on exit, so nothing
+    extra is pickled with the model.
+    """
+    binning_process.__sklearn_clone__ = lambda: binning_process
+    binning_process.fit_transform = lambda *args, **kwargs: _transform_only(binning_process, *args, **kwargs)
+    estimator.__sklearn_clone__ = lambda: estimator
+    if not fit_estimator:
+        estimator.fit = lambda *args, **kwargs: estimator
+    try:
+        yield
+    finally:
+        del binning_process.__sklearn_clone__
+        del binning_process.fit_transform
+        del estimator.__sklearn_clone__
+        if not fit_estimator:
+            del estimator.fit
+
+
+# Private OptimalBinning/OptimalBinningSketch state copied by binning_process_from_sketch.
+# Checked against the optbinning release pinned in pyproject.toml.
+_SKETCH_STATE = ("_splits_optimal", "_n_nonevent", "_n_event", "_categories", "_cat_others", "_binning_table")
+
+
+def _check_sketch_state(sk: Any, optb: Any) -> None:
+    """
+    Fail loudly, instead of producing a silently broken model, if an
+    optbinning release renamed the private state this module copies.
+    """
+    missing = [attr for attr in _SKETCH_STATE + ("_status", "_is_fitted") if not hasattr(optb, attr)]
+    missing += [f"sketch.{attr}" for attr in _SKETCH_STATE if not hasattr(sk, attr)]
+    if missing:
+        import optbinning
+
+        raise AttributeError(
+            f"optbinning {optbinning.__version__} lacks the binning state copied from sketches "
+            f"({', '.join(missing)}); install the version pinned in pyproject.toml."
+        )
+
+
+def binning_process_from_sketch(sketch: "BinningProcessSketch") -> "BinningProcess":
+    """
+    Fitted BinningProcess equivalent to a solved BinningProcessSketch.
+
+    Each OptimalBinningSketch carries exactly the state OptimalBinning
+    transforms with (splits, per-bin event/non-event counts, categories), so
+    it is copied into an OptimalBinning and the process is assembled with
+    ``fit_from_dict``. The result works wherever a fitted BinningProcess is
+    expected (Scorecard, the compiled engine), with no data in memory.
+    """
+    from optbinning import BinningProcess, OptimalBinning
+
+    binned = {}
+    for name in sketch.variable_names:
+        sk = sketch.get_binned_variable(name)
+        optb = OptimalBinning(name=name, dtype=sk.dtype, special_codes=sk.special_codes,
+                              cat_unknown=sk.cat_unknown)
+        _check_sketch_state(sk, optb)
+        optb._splits_optimal = sk._splits_optimal
+        optb._n_nonevent = sk._n_nonevent
+        optb._n_event = sk._n_event
+        optb._categories = sk._categories
+        optb._cat_others = sk._cat_others
+        optb._binning_table = sk._binning_table
+        optb._status = sk.status
+        optb._is_fitted = True
+        binned[name] = optb
+
+    categorical = [name for name, optb in binned.items() if optb.dtype == "categorical"]
+    binning_process = BinningProcess(
+        variable_names=list(sketch.variable_names),
+        categorical_variables=categorical,
+        special_codes=sketch.special_codes,
+        selection_criteria=sketch.selection_criteria
+    )
+    return binning_process.fit_from_dict(binned)
@@ -1,6 +1,10 @@
 # src/utils/metrics.py
 
 import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from src.utils.scorecard_compiler import CompiledScorecard
 
 def calculate_psi(expected: np.ndarray, actual: np.ndarray, buckets: int = 10) -> float:
     """
@@ -14,4 +18,269 @@ def calculate_psi(expected: np.ndarray, actual: np.ndarray, buckets: int = 10) -
     actual_perc = np.where(actual_perc == 0, 0.0001, actual_perc)
 
     psi = np.sum((expected_perc - actual_perc) * np.log(expected_perc / actual_perc))
-    return float(psi)
\ No newline at end of file
+    return float(psi)
+
+
+def stability_index(expected: np.ndarray, actual: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    PSI of several binned distributions at once. Bin counts of every
+    distribution are laid out back to back in ``expected`` / ``actual``,
+    each one starting at its entry of ``offsets``. Empty bins are floored as
+    in ``calculate_psi``.
+
+    Returns:
+        np.ndarray: One index per distribution.
+    """
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+    sizes = np.diff(np.append(offsets, len(expected)))
+    expected_perc = expected / np.repeat(np.add.reduceat(expected, offsets), sizes)
+    actual_perc = actual / np.repeat(np.add.reduceat(actual, offsets), sizes)
+
+    expected_perc = np.where(expected_perc == 0, 0.0001, expected_perc)
+    actual_perc = np.where(actual_perc == 0, 0.0001, actual_perc)
+
+    return np.add.reduceat((expected_perc - actual_perc) * np.log(expected_perc / actual_perc), offsets)
+
+
+class PSIAccumulator:
+    """
+    Histogram of a score over frozen breakpoints, for PSI in production.
+
+    The breakpoints are fixed once from the training distribution
+    (``from_baseline``) and saved with the model; batches of scores are then
+    counted into the same bins with ``update``. Memory is one counter per bin
+    however many scores are seen, accumulators over the same breakpoints
+    merge by adding counts (across workers, days, ...), and PSI against the
+    baseline is O(bins). The outer bins are open-ended, so scores outside the
+    training range are still counted.
+    """
+
+    def __init__(self, breakpoints: np.ndarray, counts: np.ndarray = None):
+        self.breakpoints = np.asarray(breakpoints, dtype=np.float64)
+        self.counts = (np.zeros(len(self.breakpoints) + 1, dtype=np.int64) if counts is None
+                       else np.asarray(counts, dtype=np.int64).copy())
+
+    @classmethod
+    def from_baseline(cls, values: np.ndarray, buckets: int = 10) -> "PSIAccumulator":
+        """
+        Accumulator with breakpoints at the inner ``buckets``-quantiles of
+        ``values`` (as ``calculate_psi``; repeated quantiles of discrete
+        scores collapse into one bin), already holding their counts.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        accumulator = cls(np.unique(np.percentile(values, np.linspace(0, 100, buckets + 1))[1:-1]))
+        accumulator.update(values)
+        return accumulator
+
+    @property
+    def n(self) -> int:
+        return int(self.counts.sum())
+
+    def empty_like(self) -> "PSIAccumulator":
+        return PSIAccumulator(self.breakpoints)
+
+    def update(self, values: np.ndarray) -> "PSIAccumulator":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        bins = np.searchsorted(self.breakpoints, values, side="right")
+        self.counts += np.bincount(bins, minlength=len(self.counts))
+        return self
+
+    def merge(self, other: "PSIAccumulator") -> "PSIAccumulator":
+        if not np.array_equal(self.breakpoints, other.breakpoints):
+            raise ValueError("Cannot merge accumulators with different breakpoints.")
+        self.counts += other.counts
+        return self
+
+    def psi(self, baseline: "PSIAccumulator") -> float:
+        """
+        PSI of the accumulated distribution against ``baseline`` (same breakpoints).
+        """
+        if not np.array_equal(self.breakpoints, baseline.breakpoints):
+            raise ValueError("PSI needs accumulators with the same breakpoints.")
+        if self.n == 0:
+            raise ValueError("No scores accumulated yet.")
+        return float(stability_index(baseline.counts, self.counts, np.array([0]))[0])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"breakpoints": self.breakpoints.tolist(), "counts": self.counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PSIAccumulator":
+        return cls(data["breakpoints"], data["counts"])
+
+
+def characteristic_stability(compiled: "CompiledScorecard", X) -> Dict[str, float]:
+    """
+    Characteristic Stability Index of every scorecard variable: PSI of the
+    bin distribution of ``X`` against the training distribution stored in
+    the binning tables. All variables are binned in one pass and counted
+    with a single ``np.bincount``.
+
+    Args:
+        compiled (CompiledScorecard): Compiled model (see ``compile_scorecard``).
+        X (pd.DataFrame): Raw features (at least the scorecard variables).
+
+    Returns:
+        dict: CSI per variable.
+    """
+    if compiled.train_counts is None:
+        raise ValueError("Compiled scorecard has no training bin counts; recompile it with compile_scorecard.")
+    csi = stability_index(compiled.train_counts, compiled.bin_counts(X), compiled.offsets)
+    return dict(zip(compiled.variables, csi.tolist()))
+
+
+def _ecdf_steps(counts: np.ndarray, n: int) -> np.ndarray:
+    """
+    ``np.linspace(0, 1, n + 1)[counts]`` without building the table: the
+    ECDF heights exactly as ``scipy.stats.ks_2samp`` computes them.
+    """
+    steps = counts * (1.0 / n)
+    steps[counts == n] = 1.0
+    return steps
+
+
+def sorted_class_counts(y_true: np.ndarray, proba: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort once and count events / non-events at or below every distinct
+    probability.
+
+    Returns:
+        tuple: (distinct probabilities ascending, events <= each, non-events <= each).
+    """
+    order = np.argsort(proba, kind="stable")
+    proba_sorted = proba[order]
+    last = np.r_[np.flatnonzero(np.diff(proba_sorted)), proba_sorted.size - 1]
+    events_le = np.cumsum(y_true[order], dtype=np.int64)[last]
+    nonevents_le = last + 1 - events_le
+    return proba_sorted[last], events_le, nonevents_le
+
+
+def metrics_from_counts(values: np.ndarray, events_le: np.ndarray, nonevents_le: np.ndarray) -> Dict[str, float]:
+    """
+    AUC/Gini, PR-AUC, KS and the KS cutoff from the cumulative class counts
+    of ``sorted_class_counts``. Every step reproduces the arithmetic of
+    ``roc_auc_score``, ``average_precision_score`` and ``ks_2samp``, so the
+    values are identical to theirs, not merely close.
+    """
+    n_events, n_nonevents = int(events_le[-1]), int(nonevents_le[-1])
+    if n_events == 0 or n_nonevents == 0:
+        raise ValueError("Both classes are needed to compute AUC/KS.")
+
+    # sklearn's descending thresholds: counts at or above each distinct value
+    tps = (n_events - np.r_[0, events_le[:-1]])[::-1].astype(np.float64)
+    fps = (n_nonevents - np.r_[0, nonevents_le[:-1]])[::-1].astype(np.float64)
+
+    # ROC AUC (roc_curve with drop_intermediate, then trapezoid)
+    if tps.size > 2:
+        keep = np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True]
+        roc_tps, roc_fps = tps[keep], fps[keep]
+    else:
+        roc_tps, roc_fps = tps, fps
+    roc_tps, roc_fps = np.r_[0, roc_tps], np.r_[0, roc_fps]
+    auc = float(np.trapezoid(roc_tps / roc_tps[-1], roc_fps / roc_fps[-1]))
+
+    # Average precision (precision_recall_curve, step-wise sum)
+    predicted = tps + fps
+    precision = np.divide(tps, predicted, out=np.zeros_like(tps), where=predicted != 0)
+    recall = tps / tps[-1]
+    precision, recall = np.r_[precision[::-1], 1], np.r_[recall[::-1], 0]
+    pr_auc = float(max(0.0, -np.sum(np.diff(recall) * precision[:-1])))
+
+    # Two-sample KS of event vs non-event probabilities
+    cdf_diff = _ecdf_steps(events_le, n_events) - _ecdf_steps(nonevents_le, n_nonevents)
+    arg_min, arg_max = int(np.argmin(cdf_diff)), int(np.argmax(cdf_diff))
+    min_s = float(np.clip(-cdf_diff[arg_min], 0, 1))
+    max_s = float(cdf_diff[arg_max])
+    ks, cutoff = (min_s, values[arg_min]) if min_s > max_s else (max_s, values[arg_max])
+
+    return {"auc": auc, "gini": 2 * auc - 1, "pr_auc": pr_auc, "ks": ks, "ks_cutoff": float(cutoff)}
+
+
+def binary_classification_metrics(y_true: np.ndarray, proba: np.ndarray) -> Dict[str, float]:
+    """
+    AUC, Gini, PR-AUC, KS, KS cutoff and Brier score in one pass over a
+    single sort of the probabilities.
+
+    Identical to ``roc_auc_score``, ``average_precision_score``,
+    ``ks_2samp(proba[y == 1], proba[y == 0])`` (statistic and
+    statistic_location) and ``brier_score_loss``, which each sort or rescan
+    the data on their own.
+
+    Args:
+        y_true (array-like): Binary target (0/1).
+        proba (array-like): Predicted probability of the event class.
+
+    Returns:
+        dict: auc, gini, pr_auc, ks, ks_cutoff, brier.
+
+    Raises:
+        ValueError: If only one class is present.
+    """
+    y = np.asarray(y_true).astype(np.int64)
+    proba = np.asarray(proba, dtype=np.float64)
+    metrics = metrics_from_counts(*sorted_class_counts(y, proba))
+
+    # Brier score as brier_score_loss: squared error over both class columns, halved
+    labels = y.astype(np.float64)
+    squared = ((1.0 - labels) - (1.0 - proba)) ** 2 + (labels - proba) ** 2
+    metrics["brier"] = float(np.mean(squared) * 0.5)
+    return metrics
+
+
+class StreamingBinaryMetrics:
+    """
+    Constant-memory binary classification metrics accumulated chunk by chunk.
+
+    Probabilities are counted per class into ``n_bins`` equal-width
+    histogram bins: AUC (pairs falling in the same bin count as ties) and KS
+    are exact up to that resolution, Brier score and log loss are exact.
+    Accumulators can be merged, e.g. across worker processes.
+    """
+
+    def __init__(self, n_bins: int = 10_000):
+        self.n_bins = n_bins
+        self.pos = np.zeros(n_bins, dtype=np.int64)
+        self.neg = np.zeros(n_bins, dtype=np.int64)
+        self._sq_error = 0.0
+        self._log_loss = 0.0
+
+    def update(self, y: np.ndarray, proba: np.ndarray) -> None:
+        y = np.asarray(y).astype(bool)
+        proba = np.asarray(proba, dtype=np.float64)
+        bins = np.minimum((proba * self.n_bins).astype(np.int64), self.n_bins - 1)
+        self.pos += np.bincount(bins[y], minlength=self.n_bins)
+        self.neg += np.bincount(bins[~y], minlength=self.n_bins)
+        self._sq_error += float(np.sum((proba - y) ** 2))
+        clipped = np.clip(proba, 1e-15, 1 - 1e-15)
+        self._log_loss -= float(np.sum(np.where(y, np.log(clipped), np.log1p(-clipped))))
+
+    def merge(self, other: "StreamingBinaryMetrics") -> "StreamingBinaryMetrics":
+        if other.n_bins != self.n_bins:
+            raise ValueError("Cannot merge accumulators with different histogram resolutions.")
+        self.pos += other.pos
+        self.neg += other.neg
+        self._sq_error += other._sq_error
+        self._log_loss += other._log_loss
+        return self
+
+    def result(self) -> Dict[str, float]:
+        n_pos, n_neg = int(self.pos.sum()), int(self.neg.sum())
+        n = n_pos + n_neg
+        if n_pos == 0 or n_neg == 0:
+            raise ValueError("Both classes are needed to compute AUC/KS.")
+        neg_below = np.cumsum(self.neg) - self.neg
+        auc = float((np.sum(self.pos * neg_below) + 0.5 * np.sum(self.pos * self.neg)) / (n_pos * n_neg))
+        ks = float(np.max(np.abs(np.cumsum(self.pos) / n_pos - np.cumsum(self.neg) / n_neg)))
+        return {
+            "n": n,
+            "n_events": n_pos,
+            "auc": auc,
+            "gini": 2 * auc - 1,
+            "ks": ks,
+            "brier": self._sq_error / n,
+            "log_loss": self._log_loss / n,
+        }
+
@@ -0,0 +1,186 @@
+# src/utils/micro_batcher.py
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Set
+import numpy as np
+from src.logger import logger
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-record requests into batches.
+
+    Requests are queued and flushed as one call to ``predict_batch`` once
+    ``max_batch_size`` records are waiting or the oldest one has waited
+    ``max_wait_ms``. Each caller gets back its own result. Records are grouped
+    by their batch key (e.g. model version) so one flush never mixes models.
+    Flushed batches are scored as separate tasks, up to
+    ``max_concurrent_batches`` at once, so a busy pool keeps all of its
+    workers fed while the next batch is being collected.
+    """
+
+    def __init__(
+        self,
+        predict_batch: Callable[[List[Dict[str, Any]], Optional[str]], List[Dict[str, Any]]],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        executor: Any = None,
+        max_concurrent_batches: int = 1,
+        metrics_window: int = 10_000,
+    ):
+        """
+        Args:
+            predict_batch (Callable): Scores a list of records for a batch key and
+                returns one result per record, in order. A coroutine function is
+                awaited directly; a plain function runs in ``executor``.
+            max_batch_size (int): Flush as soon as this many records are queued.
+            max_wait_ms (float): Max time the first record of a batch waits.
+            executor: Executor for ``predict_batch``; None uses the loop default.
+            max_concurrent_batches (int): Max batches being scored at once,
+                typically the size of the scoring pool.
+            metrics_window (int): Number of recent batches/requests kept for percentiles.
+        """
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+        self.total_requests = 0
+        self.total_batches = 0
+        self._batch_sizes = deque(maxlen=metrics_window)
+        self._queue_delays_ms = deque(maxlen=metrics_window)
+
+    async def start(self) -> None:
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._batch_slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._worker = asyncio.create_task(self._run())
+            logger.info(
+                f"🧺 Micro-batcher started (max_batch_size={self.max_batch_size}, "
+                f"max_wait_ms={self.max_wait * 1000:g}, max_concurrent_batches={self.max_concurrent_batches})"
+            )
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        for task in list(self._batch_tasks):
+            task.cancel()
+        await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+    async def submit(self, record: Dict[str, Any], batch_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Queue one record and wait for its result.
+        """
+        if self._worker is None:
+            raise RuntimeError("MicroBatcher is not started.")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, batch_key, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> List[tuple]:
+        items = [await self._queue.get()]
+        deadline = items[0][3] + self.max_wait
+        while len(items) < self.max_batch_size:
+            if not self._queue.empty():  # Drain the backlog without waiting
+                items.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return items
+
+    async def _run(self) -> None:
+        while True:
+            items = await self._collect()
+            flushed_at = time.perf_counter()
+
+            groups: Dict[Optional[str], List[tuple]] = {}
+            for item in items:
+                groups.setdefault(item[1], []).append(item)
+
+            for batch_key, group in groups.items():
+                self._record_batch(group, flushed_at)
+                # Waiting for a free slot lets the next batch grow in the queue meanwhile
+                try:
+                    await self._batch_slots.acquire()
+                except asyncio.CancelledError:
+                    self._fail(group, RuntimeError("Micro-batcher stopped before the batch was scored."))
+                    raise
+                task = asyncio.create_task(self._flush(group, batch_key))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+
+    async def _flush(self, group: List[tuple], batch_key: Optional[str]) -> None:
+        """
+        Score one batch and resolve its callers' futures.
+        """
+        records = [record for record, _, _, _ in group]
+        try:
+            if asyncio.iscoroutinefunction(self.predict_batch):
+                results = await self.predict_batch(records, batch_key)
+            else:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, self.predict_batch, records, batch_key
+                )
+            if len(results) != len(group):
+                raise RuntimeError(f"predict_batch returned {len(results)} results for {len(group)} records.")
+        except asyncio.CancelledError:
+            self._fail(group, RuntimeError("Micro-batcher stopped before the batch was scored."))
+            raise
+        except Exception as e:
+            self._fail(group, e)
+            return
+        finally:
+            self._batch_slots.release()
+
+        for (_, _, future, _), result in zip(group, results):
+            if not future.done():  # Caller may have been cancelled meanwhile
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(group: List[tuple], error: BaseException) -> None:
+        for _, _, future, _ in group:
+            if not future.done():
+                future.set_exception(error)
+
+    def _record_batch(self, group: List[tuple], flushed_at: float) -> None:
+        self.total_batches += 1
+        self.total_requests += len(group)
+        self._batch_sizes.append(len(group))
+        self._queue_delays_ms.extend((flushed_at - enqueued_at) * 1000 for *_, enqueued_at in group)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Batch size and queueing delay statistics over the recent window.
+        """
+        sizes = np.asarray(self._batch_sizes, dtype=float)
+        delays = np.asarray(self._queue_delays_ms, dtype=float)
+        return {
+            "total_requests": self.total_requests,
+            "total_batches": self.total_batches,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batches_in_flight": len(self._batch_tasks),
+            "batch_size_mean": float(sizes.mean()) if sizes.size else 0.0,
+            "batch_size_max": int(sizes.max()) if sizes.size else 0,
+            "queue_delay_ms_mean": float(delays.mean()) if delays.size else 0.0,
+            "queue_delay_ms_p50": float(np.percentile(delays, 50)) if delays.size else 0.0,
+            "queue_delay_ms_p99": float(np.percentile(delays, 99)) if delays.size else 0.0,
+            "queue_delay_ms_max": float(delays.max()) if delays.size else 0.0,
+        }
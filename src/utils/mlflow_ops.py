@@ -1,10 +1,13 @@
 # src/utils/mlflow_ops.py
 
+import time
 import mlflow
-from pyprojroot import here
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking import MlflowClient
+from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID, MLFLOW_RUN_NAME
 from urllib.parse import urlparse
 from pathlib import Path
-from src.utils.file_ops import load_joblib
+from src.utils.file_ops import load_joblib, project_root
 
 
 def setup_mlflow(tracking_uri: str, experiment_name: str):
@@ -15,7 +18,7 @@ def setup_mlflow(tracking_uri: str, experiment_name: str):
     if parsed_uri.scheme in ("http", "https"):
         mlflow.set_tracking_uri(tracking_uri)
     else:
-        uri_path = here() / tracking_uri
+        uri_path = project_root() / tracking_uri
         mlflow.set_tracking_uri(f"file://{uri_path}")
 
     mlflow.set_experiment(experiment_name)
@@ -32,8 +35,7 @@ def start_mlflow_run(run_name: str = None, run_id: str = None):
 
 
 def log_params(params: dict):
-    for key, value in params.items():
-        mlflow.log_param(key, value)
+    mlflow.log_params(params)  # One batched call instead of one request per key
 
 
 def log_param(key: str, value):
@@ -42,8 +44,11 @@ def log_param(key: str, value):
 
 
 def log_metrics(metrics: dict):
-    for key, value in metrics.items():
-        mlflow.log_metric(key, value)
+    mlflow.log_metrics(metrics)  # One batched call instead of one request per key
+
+
+def log_file_artifact(file_path: str, artifact_path: str = None):
+    mlflow.log_artifact(file_path, artifact_path=artifact_path)
 
 
 def log_model_artifact(model_path: str, artifact_path: str = "model"):
@@ -67,4 +72,45 @@ def log_model_artifact(model_path: str, artifact_path: str = "model"):
         )
     else:
         # Just log the raw file as artifact (local store)
-        mlflow.log_artifact(model_path, artifact_path=artifact_path)
\ No newline at end of file
+        mlflow.log_artifact(model_path, artifact_path=artifact_path)
+
+
+def log_search_results(results: dict, max_batch_size: int = 1000):
+    """
+    Log a scorecard search (see ScorecardSearch.run) under the active run.
+
+    Every candidate becomes a nested child run whose params, metrics and tags
+    are written with a single log_batch call; the parent run gets the search
+    summary, also batched. Far fewer tracking requests than logging key by key.
+    """
+    client = MlflowClient()
+    parent = mlflow.active_run()
+    now = int(time.time() * 1000)
+
+    for candidate in results["candidates"]:
+        run = client.create_run(
+            parent.info.experiment_id,
+            tags={MLFLOW_PARENT_RUN_ID: parent.info.run_id, MLFLOW_RUN_NAME: candidate["candidate_id"]}
+        )
+        params = [Param(f"estimator.{k}", str(v)) for k, v in candidate["estimator_params"].items()]
+        params += [Param(f"binning.{k}", str(v)) for k, v in candidate["binning_params"].items()]
+        metrics = [
+            Metric(key, float(candidate[key]), now, 0)
+            for key in ("test_auc", "test_gini", "test_ks", "fit_seconds", "total_bins")
+            if key in candidate
+        ]
+        tags = [RunTag("rank", str(candidate.get("rank", "failed")))]
+        if "error" in candidate:
+            tags.append(RunTag("error", candidate["error"][:5000]))
+        client.log_batch(run.info.run_id, metrics=metrics, params=params, tags=tags)
+        client.set_terminated(run.info.run_id, status="FAILED" if "error" in candidate else "FINISHED")
+
+    best = results["best"]
+    summary = [
+        Metric(f"search_{key}", float(results[key]), now, 0)
+        for key in ("n_candidates", "n_failed", "n_binning_groups", "elapsed_seconds", "binning_seconds")
+    ]
+    summary += [Metric(f"search_best_{key}", float(best[key]), now, 0) for key in ("test_gini", "test_ks")]
+    for start in range(0, len(summary), max_batch_size):
+        client.log_batch(parent.info.run_id, metrics=summary[start:start + max_batch_size])
+    client.set_tag(parent.info.run_id, "search_best_candidate", best["candidate_id"])
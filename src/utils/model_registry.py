@@ -0,0 +1,242 @@
+# src/utils/model_registry.py
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from src.exception import AppException
+from src.logger import logger
+from src.utils.file_ops import compute_file_hash, load_joblib
+from src.utils.outlier_caps import caps_path_for, load_caps
+from src.utils.scorecard_compiler import CompiledScorecard, compile_scorecard
+
+
+class ModelRegistry:
+    """
+    Process-wide in-memory store of pushed models.
+
+    Every model file is unpickled once and kept resident, keyed by its version
+    (the content hash of the file unless an explicit version is registered).
+    Several versions can be resident at once; when the count or memory budget
+    is exceeded the least recently used version is evicted. Memory use is
+    approximated by the size of the pickle on disk. Compiled scorecards and
+    outlier caps are cached alongside their model and evicted with it.
+    """
+
+    def __init__(self, max_models: int = 3, max_memory_mb: float = 512):
+        self.max_models = max_models
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+
+        self._catalog: Dict[str, str] = {}  # version -> model path
+        self._fingerprints: Dict[str, tuple] = {}  # path -> (mtime_ns, size, version)
+        self._models: "OrderedDict[str, Any]" = OrderedDict()  # LRU: version -> model
+        self._sizes: Dict[str, int] = {}
+        self._compiled: Dict[str, CompiledScorecard] = {}
+        self._caps: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._loading: Dict[str, threading.Lock] = {}  # version -> lock held while it is unpickled
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_models: int, max_memory_mb: float) -> None:
+        """
+        Update the residency budget and evict immediately if it is now exceeded.
+        """
+        with self._lock:
+            self.max_models = max_models
+            self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+            self._evict()
+
+    def register(self, model_path: str, version: Optional[str] = None) -> str:
+        """
+        Register a model file and return its version.
+
+        The content hash is only recomputed when the file's mtime or size
+        changes, so calling this on every request is cheap.
+
+        Args:
+            model_path (str): Path to the pickled model.
+            version (str, optional): Explicit version; defaults to the content hash.
+
+        Returns:
+            str: The version the model is registered under.
+        """
+        try:
+            path = str(model_path)
+            stat = os.stat(path)
+            with self._lock:
+                cached = self._fingerprints.get(path)
+                if version is None and cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                    return cached[2]
+
+                version = version or compute_file_hash(path)
+                self._fingerprints[path] = (stat.st_mtime_ns, stat.st_size, version)
+                if self._catalog.get(version) != path:
+                    self._catalog[version] = path
+                    logger.info(f"🗂️ Registered model version {version} at {path}")
+                return version
+        except Exception as e:
+            raise AppException(e, sys)
+
+    def discover(self, versions_dir: str) -> List[str]:
+        """
+        Register every ``<version>.pkl`` file found in a versions directory.
+        """
+        versions_path = Path(versions_dir)
+        if not versions_path.is_dir():
+            return []
+        return [self.register(p, version=p.stem) for p in sorted(versions_path.glob("*.pkl"))]
+
+    def get(self, model_path: Optional[str] = None, version: Optional[str] = None) -> Any:
+        """
+        Return a resident model, loading it from disk on first use.
+
+        Args:
+            model_path (str, optional): Model file to serve when no version is given.
+            version (str, optional): A registered version to serve.
+
+        Returns:
+            Any: The loaded model object.
+
+        Raises:
+            KeyError: If the requested version is not registered.
+        """
+        version = self._resolve(model_path, version)
+
+        with self._lock:
+            if version in self._models:
+                self._models.move_to_end(version)
+                self.hits += 1
+                return self._models[version]
+
+            if version not in self._catalog:
+                raise KeyError(f"Unknown model version: {version}")
+            path = self._catalog[version]
+            load_lock = self._loading.setdefault(version, threading.Lock())
+
+        # Unpickle outside the registry lock so requests for other versions are
+        # not blocked; the per-version lock makes concurrent misses load once
+        with load_lock:
+            with self._lock:
+                if version in self._models:  # Loaded by a concurrent request meanwhile
+                    self._models.move_to_end(version)
+                    self.hits += 1
+                    return self._models[version]
+
+            model = load_joblib(path)
+
+            with self._lock:
+                self.misses += 1
+                self._models[version] = model
+                self._sizes[version] = os.path.getsize(path)
+                self._loading.pop(version, None)
+                logger.info(f"✅ Model version {version} loaded into memory from: {path}")
+                self._evict(keep=version)
+                return model
+
+    def get_compiled(self, model_path: Optional[str] = None, version: Optional[str] = None) -> CompiledScorecard:
+        """
+        Return the compiled NumPy engine of a model, compiling it on first use.
+        """
+        version = self._resolve(model_path, version)
+        model = self.get(version=version)  # Also refreshes LRU position
+        with self._lock:
+            if version in self._compiled:
+                return self._compiled[version]
+
+        compiled = compile_scorecard(model)
+        with self._lock:
+            if version in self._models:  # Not cached for a version evicted meanwhile
+                compiled = self._compiled.setdefault(version, compiled)
+            return compiled
+
+    def is_warm(self, model_path: Optional[str] = None, version: Optional[str] = None) -> bool:
+        """
+        Whether the compiled engine and caps of a model are cached, so scoring
+        it from the compiled tables needs no disk access or compilation.
+        """
+        version = self._resolve(model_path, version)
+        with self._lock:
+            return version in self._compiled and version in self._caps
+
+    def get_caps(self, model_path: Optional[str] = None, version: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the outlier caps pushed next to a model file, or None if it has none.
+        Caps are only cached while their model is resident (and are evicted
+        with it); for any other version they are read from disk.
+        """
+        version = self._resolve(model_path, version)
+        with self._lock:
+            if version in self._caps:
+                return self._caps[version]
+            if version not in self._catalog:
+                raise KeyError(f"Unknown model version: {version}")
+            path = self._catalog[version]
+
+        caps = load_caps(caps_path_for(path))
+        with self._lock:
+            if version in self._models:  # Not cached for a version that is not resident
+                caps = self._caps.setdefault(version, caps)
+            return caps
+
+    def _resolve(self, model_path: Optional[str], version: Optional[str]) -> str:
+        if version is not None:
+            return version
+        if model_path is None:
+            raise ValueError("Either model_path or version must be provided.")
+        return self.register(model_path)
+
+    def evict(self, version: str) -> None:
+        """
+        Drop a version from memory (it stays registered and can be reloaded).
+        """
+        with self._lock:
+            self._models.pop(version, None)
+            self._sizes.pop(version, None)
+            self._compiled.pop(version, None)
+            self._caps.pop(version, None)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        while self._models and (
+            len(self._models) > self.max_models
+            or sum(self._sizes.values()) > self.max_memory_bytes
+        ):
+            oldest = next(iter(self._models))
+            if oldest == keep:
+                break  # Always keep the model that was just requested
+            self.evict(oldest)
+            self.evictions += 1
+            logger.info(f"♻️ Evicted model version {oldest} from memory.")
+
+    def __contains__(self, version: str) -> bool:
+        return version in self._catalog
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """
+        List registered versions and whether each is currently resident.
+        """
+        with self._lock:
+            return [
+                {"version": version, "path": path, "loaded": version in self._models}
+                for version, path in self._catalog.items()
+            ]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "resident_models": len(self._models),
+                "resident_bytes": sum(self._sizes.values()),
+                "max_models": self.max_models,
+                "max_memory_bytes": self.max_memory_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# Process-wide registry shared by every ModelPrediction instance
+model_registry = ModelRegistry()
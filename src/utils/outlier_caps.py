@@ -0,0 +1,100 @@
+# src/utils/outlier_caps.py
+
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+from src.utils.file_ops import load_json, save_json
+
+if TYPE_CHECKING:
+    import pandas as pd  # Type hints only; keeps the API import light
+
+CAPS_SUFFIX = ".caps.json"
+
+
+def caps_path_for(model_path: str) -> Path:
+    """
+    Location of the caps that belong to a pushed model file
+    (e.g. saved_models/scorecard_model.pkl -> saved_models/scorecard_model.caps.json).
+    """
+    return Path(model_path).with_suffix(CAPS_SUFFIX)
+
+
+def compute_caps(X: "pd.DataFrame", lower: float = 0.01, upper: float = 0.99) -> Dict[str, Any]:
+    """
+    Lower/upper quantile caps of every numeric column, computed in one
+    vectorized quantile call.
+
+    Args:
+        X (pd.DataFrame): Training features.
+        lower (float): Lower quantile.
+        upper (float): Upper quantile.
+
+    Returns:
+        dict: {"lower_quantile", "upper_quantile", "caps": {column: [low, high]}}.
+    """
+    numeric = X.select_dtypes(include="number")
+    bounds = numeric.quantile([lower, upper])
+    return {
+        "lower_quantile": lower,
+        "upper_quantile": upper,
+        "caps": {col: [float(bounds.at[lower, col]), float(bounds.at[upper, col])] for col in numeric.columns},
+    }
+
+
+def apply_caps(df: "pd.DataFrame", caps: Dict[str, Any]) -> "pd.DataFrame":
+    """
+    Clip the capped columns of ``df`` in place (one vectorized clip over all of
+    them) and return it. Columns missing from ``df`` are ignored.
+    """
+    import pandas as pd
+
+    cols = [col for col in caps["caps"] if col in df.columns]
+    if cols:
+        low = pd.Series({col: caps["caps"][col][0] for col in cols})
+        high = pd.Series({col: caps["caps"][col][1] for col in cols})
+        df[cols] = df[cols].clip(lower=low, upper=high, axis=1)
+    return df
+
+
+def apply_caps_record(record: Mapping[str, Any], caps: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Scalar apply_caps for a single record; returns a new dict. Missing values are left as-is.
+    """
+    capped = dict(record)
+    for col, (low, high) in caps["caps"].items():
+        value = capped.get(col)
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        capped[col] = min(max(value, low), high)
+    return capped
+
+
+def save_caps(file_path: str, caps: Dict[str, Any]) -> None:
+    save_json(file_path, caps)
+
+
+def save_model_caps(model_path: str, caps: Optional[Dict[str, Any]]) -> Optional[Path]:
+    """
+    Save the caps a model was trained with next to the model file (removing
+    a previous run's caps when it has none), so the pusher ships the model
+    with its own caps.
+
+    Returns:
+        Path: The saved caps file, or None.
+    """
+    caps_path = caps_path_for(model_path)
+    if caps is None:
+        caps_path.unlink(missing_ok=True)
+        return None
+    save_caps(caps_path, caps)
+    return caps_path
+
+
+def load_caps(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load caps saved by save_caps, or None if the file does not exist
+    (models pushed before caps were persisted).
+    """
+    if not Path(file_path).exists():
+        return None
+    return load_json(file_path)
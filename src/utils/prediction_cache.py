@@ -0,0 +1,94 @@
+# src/utils/prediction_cache.py
+
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class PredictionCache:
+    """
+    Bounded LRU cache of prediction responses with per-entry TTL.
+
+    Keys combine a canonical hash of the applicant payload with the model
+    version, so a pushed model never serves results of the previous one; when
+    the served version changes the whole cache is dropped to free memory.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, response)
+        self._model_version: Optional[str] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any], model_version: str) -> str:
+        """
+        Canonical key: SHA-256 of the payload as sorted, compact JSON plus the model version.
+        """
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(f"{model_version}|{canonical}".encode()).hexdigest()
+
+    def observe_model_version(self, model_version: str) -> None:
+        """
+        Invalidate every entry when the default model version changes (new model pushed).
+        """
+        with self._lock:
+            if self._model_version is not None and model_version != self._model_version:
+                self._entries.clear()
+                self.invalidations += 1
+            self._model_version = model_version
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, response = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(response)
+
+    def put(self, key: str, response: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "model_version": self._model_version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,49 @@
+# src/utils/prediction_log.py
+
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class PredictionLog:
+    """
+    Append-only JSONL log of scored requests, read by the drift monitor.
+
+    One line per scored record: ``{"ts", "model_version", "request",
+    "response"}``, flushed as soon as it is written. Readers tailing the
+    file by byte offset only consume up to the last newline, so a line still
+    being written is picked up on their next read.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.file_path, "a", encoding="utf-8", buffering=1)
+
+    @staticmethod
+    def _line(request: Dict[str, Any], response: Dict[str, Any], model_version: Optional[str], ts: float) -> str:
+        entry = {"ts": round(ts, 3), "model_version": model_version, "request": request, "response": response}
+        return json.dumps(entry, separators=(",", ":"), default=str) + "\n"
+
+    def write(self, request: Dict[str, Any], response: Dict[str, Any], model_version: Optional[str] = None) -> None:
+        line = self._line(request, response, model_version, time.time())
+        with self._lock:
+            self._file.write(line)
+
+    def write_many(self, pairs: Iterable[Tuple[Dict[str, Any], Dict[str, Any]]],
+                   model_version: Optional[str] = None) -> None:
+        """
+        Log (request, response) pairs of one batch call with a single write.
+        """
+        ts = time.time()
+        lines = "".join(self._line(request, response, model_version, ts) for request, response in pairs)
+        if lines:
+            with self._lock:
+                self._file.write(lines)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
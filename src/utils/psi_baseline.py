@@ -0,0 +1,39 @@
+# src/utils/psi_baseline.py
+
+from pathlib import Path
+from typing import Dict, Optional
+import numpy as np
+from src.utils.file_ops import load_json, save_json
+from src.utils.metrics import PSIAccumulator
+
+BASELINE_SUFFIX = ".psi_baseline.json"
+
+
+def baseline_path_for(model_path: str) -> Path:
+    """
+    Location of the PSI baseline that belongs to a model file
+    (e.g. saved_models/scorecard_model.pkl -> saved_models/scorecard_model.psi_baseline.json).
+    """
+    return Path(model_path).with_suffix(BASELINE_SUFFIX)
+
+
+def compute_psi_baseline(scores: Dict[str, np.ndarray], buckets: int = 10) -> Dict[str, PSIAccumulator]:
+    """
+    Frozen-breakpoint accumulators of the training distributions, e.g.
+    {"proba": default probabilities, "score": credit scores}.
+    """
+    return {name: PSIAccumulator.from_baseline(values, buckets) for name, values in scores.items()}
+
+
+def save_psi_baseline(file_path: str, baseline: Dict[str, PSIAccumulator]) -> None:
+    save_json(file_path, {name: accumulator.to_dict() for name, accumulator in baseline.items()})
+
+
+def load_psi_baseline(file_path: str) -> Optional[Dict[str, PSIAccumulator]]:
+    """
+    Load a baseline saved by save_psi_baseline, or None if the file does not
+    exist (models trained before baselines were persisted).
+    """
+    if not Path(file_path).exists():
+        return None
+    return {name: PSIAccumulator.from_dict(data) for name, data in load_json(file_path).items()}
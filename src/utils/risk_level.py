@@ -1,5 +1,14 @@
 # src/utils/risk_level.py
 
+from bisect import bisect_right
+import numpy as np
+
+# Upper (exclusive) default-probability bound of every risk level but the last
+RISK_LEVEL_THRESHOLDS = np.array([0.1, 0.3, 0.5, 0.7])
+RISK_LEVEL_LABELS = np.array(["Very Low", "Low", "Medium", "High", "Very High"], dtype=object)
+
+_RISK_LEVEL_THRESHOLD_LIST = RISK_LEVEL_THRESHOLDS.tolist()
+
 def get_risk_level(default_prob: float) -> str:
     """
     Determine risk level based on default probability.
@@ -13,23 +22,29 @@ def get_risk_level(default_prob: float) -> str:
     Raises:
         ValueError: If default_prob is not a float or not in [0, 1].
     """
-    try:
-        if not isinstance(default_prob, (float, int)):
-            raise TypeError("default_prob must be a number (float or int).")
-
-        if not (0.0 <= default_prob <= 1.0):
-            raise ValueError("default_prob must be between 0.0 and 1.0.")
-
-        if default_prob < 0.1:
-            return "Very Low"
-        elif default_prob < 0.3:
-            return "Low"
-        elif default_prob < 0.5:
-            return "Medium"
-        elif default_prob < 0.7:
-            return "High"
-        else:
-            return "Very High"
-
-    except Exception as e:
-        raise ValueError(f"Invalid input for risk level calculation: {e}")
+    if not isinstance(default_prob, (float, int)):
+        raise ValueError("Invalid input for risk level calculation: default_prob must be a number (float or int).")
+
+    if not (0.0 <= default_prob <= 1.0):
+        raise ValueError("Invalid input for risk level calculation: default_prob must be between 0.0 and 1.0.")
+
+    return RISK_LEVEL_LABELS[bisect_right(_RISK_LEVEL_THRESHOLD_LIST, default_prob)]
+
+
+def get_risk_levels(default_probs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized get_risk_level for an array of default probabilities.
+
+    Args:
+        default_probs (np.ndarray): Predicted default probabilities (0 to 1).
+
+    Returns:
+        np.ndarray: Risk level label per probability.
+
+    Raises:
+        ValueError: If any probability is NaN or outside [0, 1].
+    """
+    probs = np.asarray(default_probs, dtype=float)
+    if not np.all((probs >= 0.0) & (probs <= 1.0)):
+        raise ValueError("Invalid input for risk level calculation: default_prob must be between 0.0 and 1.0.")
+    return RISK_LEVEL_LABELS[np.searchsorted(RISK_LEVEL_THRESHOLDS, probs, side="right")]
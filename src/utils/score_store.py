@@ -0,0 +1,65 @@
+# src/utils/score_store.py
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from src.utils.file_ops import atomic_directory
+
+PROBA_FILE = "proba.npy"
+SCORE_FILE = "score.npy"
+META_FILE = "meta.json"
+# Part of every key: entries written with another vector layout are never reused
+STORE_FORMAT = 2
+
+
+def load_score_vectors(entry_dir: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Memory-mapped default probability (float64) and score (float32) vectors
+    of a stored split, e.g. a path from ``ModelEvaluationArtifact.score_vector_paths``.
+    """
+    entry = Path(entry_dir)
+    return np.load(entry / PROBA_FILE, mmap_mode="r"), np.load(entry / SCORE_FILE, mmap_mode="r")
+
+
+class ScoreStore:
+    """
+    On-disk store of per-split default probability and score vectors.
+
+    Entries are keyed by the model file hash and the feature data hash, so a
+    split already scored by the same model is read back instead of rescored.
+    Each entry is a directory holding ``proba.npy`` (float64, so metrics of
+    a reused entry are exactly those of the fresh scoring) and ``score.npy``
+    (float32), in row order of the split, plus meta.json, written to a temp
+    directory and renamed into place like the WoE cache. Vectors are
+    memory-mapped on load.
+    """
+
+    def __init__(self, store_dir: str):
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(model_hash: str, data_hash: str) -> str:
+        return f"{model_hash}-{data_hash[:16]}-v{STORE_FORMAT}"
+
+    def path_of(self, key: str) -> Path:
+        return self.store_dir / key
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Stored (proba, score) for ``key``, or None.
+        """
+        entry = self.path_of(key)
+        if not (entry / META_FILE).exists():
+            return None
+        return load_score_vectors(entry)
+
+    def put(self, key: str, proba: np.ndarray, score: np.ndarray, meta: Dict[str, Any]) -> Path:
+        entry = self.path_of(key)
+        with atomic_directory(entry, marker=META_FILE) as tmp:
+            np.save(tmp / PROBA_FILE, np.ascontiguousarray(proba, dtype=np.float64))
+            np.save(tmp / SCORE_FILE, np.ascontiguousarray(score, dtype=np.float32))
+            with open(tmp / META_FILE, "w") as f:
+                json.dump(meta, f, indent=4, default=str)
+        return entry
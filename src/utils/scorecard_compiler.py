@@ -0,0 +1,329 @@
+# src/utils/scorecard_compiler.py
+
+import sys
+import math
+from bisect import bisect_right
+import numpy as np
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Tuple, Union
+from src.exception import AppException
+from src.logger import logger
+
+if TYPE_CHECKING:
+    import pandas as pd  # Type hints only; imported where needed to keep API cold start fast
+
+# Documented agreement with optbinning's Scorecard.predict_proba / Scorecard.score.
+# Differences only come from floating-point summation order.
+PROBA_TOLERANCE = 1e-9
+SCORE_TOLERANCE = 1e-6
+
+
+def _empirical_woe(n_event: np.ndarray, n_nonevent: np.ndarray) -> np.ndarray:
+    """
+    Per-bin WoE exactly as optbinning computes it (0 for pure or empty bins).
+    """
+    t_event, t_nonevent = n_event.sum(), n_nonevent.sum()
+    n_records = n_event + n_nonevent
+    mask = (n_event > 0) & (n_nonevent > 0)
+    woe = np.zeros(len(n_records))
+    event_rate = n_event[mask] / n_records[mask]
+    woe[mask] = np.log((1.0 / event_rate - 1) * t_event / t_nonevent)
+    return woe
+
+
+def _unknown_woe(n_event: np.ndarray, n_nonevent: np.ndarray, n_bin: int, empirical: bool) -> float:
+    """
+    WoE optbinning assigns to unseen categories: that of the mean event rate,
+    taken over the regular bins only unless special/missing are empirical.
+    """
+    t_event, t_nonevent = n_event.sum(), n_nonevent.sum()
+    n_records = n_event + n_nonevent
+    if not empirical:
+        n_records = n_records[:n_bin]
+    mean_event_rate = t_event / n_records.sum()
+    return float(np.log((1.0 / mean_event_rate - 1) * t_event / t_nonevent))
+
+
+class CompiledScorecard:
+    """
+    Flat-array representation of a fitted optbinning Scorecard.
+
+    Each selected variable owns a slice of two global lookup tables (WoE and
+    points) laid out as ``[bins..., specials..., missing, unknown]``. Numeric
+    values are binned with ``np.searchsorted`` over the split edges and
+    categorical values through a category-to-bin map applied to the distinct
+    values only, so scoring is a bin lookup, a gather and a sum — no
+    BinningProcess or sklearn call involved.
+    """
+
+    def __init__(
+        self,
+        variables: List[str],
+        dtypes: List[str],
+        splits: List[np.ndarray],
+        category_maps: List[Dict[str, int]],
+        special_codes: List[Any],
+        n_bins: np.ndarray,
+        n_specials: np.ndarray,
+        offsets: np.ndarray,
+        woe_table: np.ndarray,
+        points_table: np.ndarray,
+        coefs: np.ndarray,
+        intercept: float,
+        score_intercept: float,
+        train_counts: np.ndarray = None,
+    ):
+        self.variables = variables
+        self.dtypes = dtypes
+        self.splits = splits
+        self.category_maps = category_maps
+        self.special_codes = special_codes
+        self.n_bins = n_bins
+        self.n_specials = n_specials
+        self.offsets = offsets
+        self.woe_table = woe_table
+        self.points_table = points_table
+        self.coefs = coefs
+        self.intercept = intercept
+        self.score_intercept = score_intercept
+        self.train_counts = train_counts  # Training records per table entry (CSI baseline)
+
+        # Plain-Python views of the same tables for the single-record path, where
+        # per-call NumPy dispatch costs more than the arithmetic itself
+        sizes = self.n_bins + self.n_specials + 2
+        self._split_lists = [None if s is None else s.tolist() for s in splits]
+        self._contrib_list = (woe_table * np.repeat(coefs, sizes)).tolist()
+        self._points_list = points_table.tolist()
+        self._offset_list = [int(o) for o in offsets]
+
+    def _bin_column(self, j: int, x: np.ndarray) -> np.ndarray:
+        """
+        Local bin index of every value of variable ``j``.
+        """
+        n_bins, n_special = self.n_bins[j], self.n_specials[j]
+        missing_idx = n_bins + n_special
+        unknown_idx = missing_idx + 1
+
+        if self.dtypes[j] == "numerical":
+            x = np.asarray(x, dtype=float)
+            missing = np.isnan(x)
+            idx = np.searchsorted(self.splits[j], x, side="right")
+        else:
+            import pandas as pd
+
+            # Hash-factorize once, then resolve only the distinct values (missing -> code -1)
+            codes, uniques = pd.factorize(np.asarray(x, dtype=object))
+            category_map = self.category_maps[j]
+            lookup = np.array([category_map.get(str(u), unknown_idx) for u in uniques] + [missing_idx])
+            missing = codes == -1
+            idx = lookup[codes]
+
+        specials = self.special_codes[j]
+        if specials:
+            if isinstance(specials, dict):
+                for i, codes in enumerate(specials.values()):
+                    codes = codes if isinstance(codes, (list, np.ndarray)) else [codes]
+                    idx[np.isin(x, codes)] = n_bins + i
+            else:
+                idx[np.isin(x, specials)] = n_bins
+
+        idx[missing] = missing_idx
+        return idx
+
+    def bin_indices(self, X: Union["pd.DataFrame", Dict[str, Any]]) -> np.ndarray:
+        """
+        Local bin indices, shape (n_samples, n_variables). Missing values map to
+        ``n_bins + n_specials`` and unseen categories to the slot after it.
+        """
+        columns = [np.atleast_1d(np.asarray(X[var])) for var in self.variables]
+        return np.column_stack([self._bin_column(j, x) for j, x in enumerate(columns)])
+
+    def transform(self, X: Union["pd.DataFrame", Dict[str, Any]]) -> np.ndarray:
+        """
+        Indices into the flat WoE/points tables, shape (n_samples, n_variables).
+        """
+        return self.bin_indices(X) + self.offsets
+
+    def bin_counts(self, X) -> np.ndarray:
+        """
+        Records of ``X`` per flat table entry: one bincount over the bin
+        indices of all variables, laid out like ``train_counts``.
+        """
+        return np.bincount(self.transform(X).ravel(), minlength=len(self.woe_table))
+
+    def decision_function(self, X) -> np.ndarray:
+        return self.woe_table[self.transform(X)] @ self.coefs + self.intercept
+
+    def predict_proba(self, X) -> np.ndarray:
+        p = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+        return np.column_stack([1.0 - p, p])
+
+    def score(self, X) -> np.ndarray:
+        return self.points_table[self.transform(X)].sum(axis=1) + self.score_intercept
+
+    def predict(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Default probability and score from a single binning pass.
+        """
+        return self._predict_from_table_indices(self.transform(X))
+
+    def predict_from_indices(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Default probability and score from optbinning bin indices, i.e. the output
+        of ``BinningProcess.transform(X, metric="indices", metric_special="empirical",
+        metric_missing="empirical")`` (unseen categories are -1).
+        """
+        indices = np.asarray(indices)
+        unknown = self.n_bins + self.n_specials + 1
+        return self._predict_from_table_indices(np.where(indices < 0, unknown, indices) + self.offsets)
+
+    def _predict_from_table_indices(self, table_idx: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        decision = self.woe_table[table_idx] @ self.coefs + self.intercept
+        default_proba = 1.0 / (1.0 + np.exp(-decision))
+        score = self.points_table[table_idx].sum(axis=1) + self.score_intercept
+        return default_proba, score
+
+    def predict_record(self, record: Mapping[str, Any]) -> Tuple[float, float]:
+        """
+        Default probability and score of a single record (e.g. one API request)
+        without building any DataFrame or array: values are binned with bisect /
+        dict lookups and the per-bin WoE contributions and points are summed.
+        Agrees with ``predict`` within PROBA_TOLERANCE / SCORE_TOLERANCE.
+        """
+        decision, score = self.intercept, self.score_intercept
+        for j, variable in enumerate(self.variables):
+            value = record[variable]
+            n_bins = int(self.n_bins[j])
+            missing_idx = n_bins + int(self.n_specials[j])
+
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                idx = missing_idx
+            elif self.dtypes[j] == "numerical":
+                idx = bisect_right(self._split_lists[j], value)
+            else:
+                idx = self.category_maps[j].get(str(value), missing_idx + 1)
+
+            specials = self.special_codes[j]
+            if specials and idx != missing_idx:
+                if isinstance(specials, dict):
+                    for i, codes in enumerate(specials.values()):
+                        if value in (codes if isinstance(codes, (list, np.ndarray)) else [codes]):
+                            idx = n_bins + i
+                            break
+                elif value in specials:
+                    idx = n_bins
+
+            table_idx = self._offset_list[j] + idx
+            decision += self._contrib_list[table_idx]
+            score += self._points_list[table_idx]
+
+        if decision >= 0:
+            return 1.0 / (1.0 + math.exp(-decision)), score
+        odds = math.exp(decision)  # Avoids overflow for very negative decisions
+        return odds / (1.0 + odds), score
+
+    def verify(self, scorecard: Any, X: "pd.DataFrame") -> Dict[str, float]:
+        """
+        Compare against the source Scorecard on ``X`` and raise if the documented
+        tolerances (PROBA_TOLERANCE, SCORE_TOLERANCE) are exceeded.
+        """
+        proba_diff = float(np.max(np.abs(
+            self.predict_proba(X)[:, 1] - scorecard.predict_proba(X)[:, 1])))
+        score_diff = float(np.max(np.abs(self.score(X) - scorecard.score(X))))
+
+        if proba_diff > PROBA_TOLERANCE or score_diff > SCORE_TOLERANCE:
+            raise ValueError(
+                f"Compiled scorecard deviates from Scorecard: "
+                f"proba diff {proba_diff:.3e}, score diff {score_diff:.3e}"
+            )
+        return {"max_proba_diff": proba_diff, "max_score_diff": score_diff}
+
+
+def compile_scorecard(scorecard: Any) -> CompiledScorecard:
+    """
+    Compile a fitted optbinning Scorecard (the output of ModelTrainer) into a
+    CompiledScorecard.
+
+    Args:
+        scorecard: A fitted ``optbinning.Scorecard`` with a binary target.
+
+    Returns:
+        CompiledScorecard: The equivalent flat-array scoring engine.
+    """
+    try:
+        binning_process = scorecard.binning_process_
+        variables = list(binning_process.get_support(names=True))
+        transform_params = binning_process.binning_transform_params or {}
+        table = scorecard.table(style="summary")
+        coefs = np.asarray(scorecard.estimator_.coef_, dtype=float).ravel()
+        intercept = float(np.ravel(scorecard.estimator_.intercept_)[0])
+
+        dtypes, splits, category_maps, special_codes = [], [], [], []
+        n_bins, n_specials, woe_tables, points_tables, count_tables = [], [], [], [], []
+
+        for variable in variables:
+            optb = binning_process.get_binned_variable(variable)
+            bt = optb.binning_table
+            n_event = np.asarray(bt.n_event, dtype=float)
+            n_nonevent = np.asarray(bt.n_nonevent, dtype=float)
+
+            n_special = len(optb.special_codes) if isinstance(optb.special_codes, dict) else 1
+            n_bin = len(n_event) - n_special - 1
+
+            if optb.dtype == "numerical":
+                splits.append(np.asarray(optb.splits, dtype=float))
+                category_maps.append(None)
+            else:
+                # Let optbinning resolve every known category (incl. "others") to its bin
+                cats = np.asarray(list(optb._categories) + list(optb._cat_others or []), dtype=object)
+                cat_idx = optb.transform(cats, metric="indices",
+                                         metric_special="empirical", metric_missing="empirical")
+                splits.append(None)
+                category_maps.append({str(c): int(i) for c, i in zip(cats, cat_idx)})
+
+            # WoE used by predict_proba: empirical for regular bins; special and
+            # missing follow the scorecard's (or per-variable) metric settings
+            woe = _empirical_woe(n_event, n_nonevent)
+            params = transform_params.get(variable, {})
+            metric_special = params.get("metric_special", scorecard._metric_special)
+            metric_missing = params.get("metric_missing", scorecard._metric_missing)
+            if metric_special != "empirical":
+                woe[n_bin:n_bin + n_special] = metric_special
+            if metric_missing != "empirical":
+                woe[n_bin + n_special] = metric_missing
+            woe_tables.append(np.append(woe, _unknown_woe(
+                n_event, n_nonevent, n_bin, "empirical" in (metric_special, metric_missing))))
+
+            # Points used by score: unseen categories get index -1 in optbinning,
+            # i.e. the points of the last (missing) row
+            points = table.loc[table["Variable"] == variable, "Points"].to_numpy(dtype=float)
+            points_tables.append(np.append(points, points[-1]))
+            count_tables.append(np.append(n_event + n_nonevent, 0))  # No unseen categories at fit time
+
+            dtypes.append(optb.dtype)
+            special_codes.append(optb.special_codes)
+            n_bins.append(n_bin)
+            n_specials.append(n_special)
+
+        sizes = np.array([len(t) for t in woe_tables])
+        offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+
+        compiled = CompiledScorecard(
+            variables=variables,
+            dtypes=dtypes,
+            splits=splits,
+            category_maps=category_maps,
+            special_codes=special_codes,
+            n_bins=np.array(n_bins),
+            n_specials=np.array(n_specials),
+            offsets=offsets,
+            woe_table=np.concatenate(woe_tables),
+            points_table=np.concatenate(points_tables),
+            coefs=coefs,
+            intercept=intercept,
+            score_intercept=float(scorecard.intercept_),
+            train_counts=np.concatenate(count_tables),
+        )
+        logger.info(f"⚙️ Scorecard compiled: {len(variables)} variables, {int(sizes.sum())} table entries.")
+        return compiled
+    except Exception as e:
+        raise AppException(e, sys)
@@ -0,0 +1,86 @@
+# src/utils/woe_cache.py
+
+import json
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import numpy as np
+from src.utils.file_ops import atomic_directory
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# BinningProcess params that do not change the fitted bins
+_NON_BINNING_PARAMS = ("n_jobs", "verbose")
+
+
+def hash_data(X: "pd.DataFrame", y: "pd.Series" = None) -> str:
+    """
+    Content hash of a feature frame and its target, if given (values, index,
+    column names and dtypes), used to key cached WoE matrices and score vectors.
+    """
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([list(map(str, X.columns)), list(map(str, X.dtypes))]).encode())
+    digest.update(pd.util.hash_pandas_object(X, index=True).to_numpy().tobytes())
+    if y is not None:
+        digest.update(pd.util.hash_pandas_object(y, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def binning_params_of(binning_process) -> Dict[str, Any]:
+    """
+    The options of an (unfitted) BinningProcess that determine its bins.
+    """
+    params = binning_process.get_params()
+    return {k: v for k, v in sorted(params.items()) if k not in _NON_BINNING_PARAMS}
+
+
+class WoeCache:
+    """
+    On-disk store of WoE-transformed train/validation matrices.
+
+    Entries are keyed by fold, data hash and binning params, so any run over
+    the same data and binning options (different estimator, scaling, ...)
+    loads them instead of refitting optbinning. Each entry is a directory of
+    .npy files plus meta.json, written to a temp directory and renamed into
+    place so concurrent or interrupted runs never leave half-written entries.
+    Matrices are memory-mapped on load.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(fold: Any, data_hash: str, binning_params: Dict[str, Any]) -> str:
+        canonical = json.dumps(
+            {"fold": fold, "data": data_hash, "binning": binning_params},
+            sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray, Dict[str, Any]]]:
+        """
+        Cached (woe_train, woe_valid, meta) for ``key``, or None.
+        """
+        entry = self.cache_dir / key
+        if not (entry / "meta.json").exists():
+            self.misses += 1
+            return None
+        self.hits += 1
+        woe_train = np.load(entry / "woe_train.npy", mmap_mode="r")
+        woe_valid = np.load(entry / "woe_valid.npy", mmap_mode="r")
+        with open(entry / "meta.json") as f:
+            meta = json.load(f)
+        return woe_train, woe_valid, meta
+
+    def put(self, key: str, woe_train: np.ndarray, woe_valid: np.ndarray, meta: Dict[str, Any]) -> None:
+        with atomic_directory(self.cache_dir / key) as tmp:
+            np.save(tmp / "woe_train.npy", np.ascontiguousarray(woe_train, dtype=np.float64))
+            np.save(tmp / "woe_valid.npy", np.ascontiguousarray(woe_valid, dtype=np.float64))
+            with open(tmp / "meta.json", "w") as f:
+                json.dump(meta, f, indent=4, default=str)
@@ -0,0 +1,105 @@
+# src/utils/worker_pool.py
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict
+from src.logger import logger
+
+POOL_KINDS = ("thread", "process")
+
+
+class ServerBusyError(Exception):
+    """
+    Raised when the in-flight request limit is reached and the request is rejected.
+    """
+
+
+class ScoringPool:
+    """
+    Dedicated executor for CPU-bound scoring with a bounded in-flight limit.
+
+    Requests take a slot before any work is done; once ``max_in_flight`` slots
+    are taken new requests fail immediately with ServerBusyError instead of
+    queueing without bound. Counters are only touched from the event loop, so
+    no locking is needed.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        max_workers: int = 4,
+        max_in_flight: int = 64,
+        initializer: Callable = None,
+        initargs: tuple = (),
+    ):
+        """
+        Args:
+            kind (str): "thread" or "process".
+            max_workers (int): Size of the executor.
+            max_in_flight (int): Max requests admitted at once (running + waiting).
+            initializer (Callable): Per-worker setup, used for process pools
+                (e.g. loading the model once in every worker).
+            initargs (tuple): Arguments for ``initializer``.
+        """
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Unknown worker pool kind '{kind}'. Expected one of {POOL_KINDS}.")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+
+        if kind == "process":
+            # spawn: the API process is multi-threaded, forking it is unsafe
+            self.executor: Executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=initializer, initargs=initargs
+            )
+        else:
+            self.executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="scoring",
+                initializer=initializer, initargs=initargs
+            )
+
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        logger.info(f"🧵 Scoring pool ready: {kind} x{max_workers}, max in-flight {max_in_flight}")
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one in-flight slot for the duration of a request.
+
+        Raises:
+            ServerBusyError: If all slots are taken.
+        """
+        if self.in_flight >= self.max_in_flight:
+            self.rejected += 1
+            raise ServerBusyError(f"Too many in-flight requests (limit {self.max_in_flight}).")
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        """
+        Run ``fn(*args)`` on the pool without blocking the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }